@@ -9,6 +9,8 @@ class AIService {
         this.currentProvider = null;
         this.requestQueue = [];
         this.isProcessing = false;
+        // null = not probed yet, false = dev server proxy unavailable (static hosting)
+        this.serverProxyAvailable = null;
         
         // Initialize providers
         this.initializeProviders();
@@ -122,10 +124,11 @@ class AIService {
 
             let result;
             if (streaming) {
-                result = providerInstance.generateStreaming(request, config);
+                result = this.streamViaServerProxy(request, config, providerInstance);
             } else {
                 result = await Promise.race([
-                    providerInstance.generate(request, config),
+                    this.generateViaServerProxy(request, config)
+                        .then(proxied => proxied || providerInstance.generate(request, config)),
                     new Promise((_, reject) => 
                         setTimeout(() => reject(new Error('Request timeout after 60 seconds')), 60000)
                     )
@@ -155,6 +158,107 @@ class AIService {
         }
     }
 
+    /**
+     * Send a request through the dev server's /api/ai proxy, which coalesces
+     * identical prompts from several editors and caches completions.
+     * Returns null when the proxy is unavailable (e.g. static hosting) or
+     * will not forward to this endpoint, so the caller talks to the provider.
+     */
+    async fetchServerProxy(request, config, stream) {
+        if (this.serverProxyAvailable === false) {
+            return null;
+        }
+
+        let response;
+        try {
+            response = await fetch('/api/ai/generate', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    provider: request.provider,
+                    model: request.model,
+                    prompt: request.prompt,
+                    maxTokens: request.maxTokens,
+                    temperature: request.temperature,
+                    endpoint: config.endpoint,
+                    apiKey: config.apiKey,
+                    stream
+                })
+            });
+        } catch (error) {
+            this.serverProxyAvailable = false;
+            return null;
+        }
+
+        if ([404, 405, 501].includes(response.status)) {
+            this.serverProxyAvailable = false;
+            return null;
+        }
+        if (response.status === 403) {
+            // The proxy only forwards to its allowlisted upstreams; call a
+            // custom endpoint (e.g. an Ollama server on the LAN) directly
+            console.log(`AI proxy does not forward to ${config.endpoint}; calling it directly`);
+            return null;
+        }
+        if (!response.ok) {
+            throw new Error(`AI proxy error: ${response.status} ${response.statusText}`);
+        }
+
+        this.serverProxyAvailable = true;
+        return response;
+    }
+
+    async generateViaServerProxy(request, config) {
+        const response = await this.fetchServerProxy(request, config, false);
+        if (!response) {
+            return null;
+        }
+        const result = await response.json();
+        console.log(`🔁 AI proxy: ${result.source}`);
+        return result;
+    }
+
+    async *streamViaServerProxy(request, config, providerInstance) {
+        const response = await this.fetchServerProxy(request, config, true);
+        if (!response) {
+            yield* providerInstance.generateStreaming(request, config);
+            return;
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        try {
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+
+                for (const line of lines) {
+                    if (!line.trim()) continue;
+                    const data = JSON.parse(line);
+                    if (data.error) {
+                        throw new Error(`AI proxy error: ${data.error}`);
+                    }
+                    yield {
+                        provider: request.provider,
+                        model: request.model,
+                        content: data.content,
+                        done: data.done
+                    };
+                }
+            }
+        } finally {
+            reader.releaseLock();
+        }
+    }
+
     /**
      * Generate content suggestions for editing
      */
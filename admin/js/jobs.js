@@ -0,0 +1,51 @@
+/**
+ * Background job helpers for the Buildly admin
+ * Slow operations (regenerating articles.html, rewriting navigation, creating
+ * pages) answer 202 Accepted with a job id; waitForJob follows the job's
+ * progress feed until it finishes.
+ */
+
+(function() {
+    'use strict';
+
+    function followJob(job, onProgress) {
+        return new Promise((resolve, reject) => {
+            const source = new EventSource(job.eventsUrl || `/api/jobs/${job.jobId}/events`);
+
+            source.addEventListener('progress', (event) => {
+                if (onProgress) {
+                    onProgress(JSON.parse(event.data));
+                }
+            });
+
+            source.addEventListener('done', (event) => {
+                source.close();
+                const finished = JSON.parse(event.data);
+                if (finished.status === 'succeeded') {
+                    resolve({ ...job, ...finished });
+                } else {
+                    reject(new Error(finished.error || 'Job failed'));
+                }
+            });
+
+            source.onerror = () => {
+                source.close();
+                reject(new Error('Lost connection to job progress feed'));
+            };
+        });
+    }
+
+    /**
+     * Resolve with the response body once the request's work is done.
+     * Responses that are not queued jobs resolve immediately.
+     */
+    async function waitForJob(response, onProgress) {
+        const data = await response.json();
+        if (response.status !== 202 || !data.jobId) {
+            return data;
+        }
+        return followJob(data, onProgress);
+    }
+
+    window.waitForJob = waitForJob;
+})();
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Faceted search over article metadata for the admin articles manager.
+
+The records from article_store.ArticleStore are indexed once per change:
+
+- inverted indexes from category and from keyword to the articles that have it
+- a sorted vocabulary of title, keyword and description words, so a text
+  prefix is a bisect instead of a scan
+- every article's rank in each sort order, so a filtered result is sorted
+  without comparing records and an unfiltered one is a plain slice
+
+A query intersects the posting sets, smallest first, and returns one page
+plus per-category counts for the tabs, so responses stay bounded no matter
+how many articles there are.
+"""
+
+import argparse
+import bisect
+import json
+import re
+import threading
+from collections import defaultdict
+
+from article_store import ArticleStore
+
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 200
+
+# sort parameter -> (record field, descending); a leading '-' reverses it
+SORTS = {
+    'title': ('title', False),
+    'published': ('published', True),
+    'modified': ('modified', True),
+}
+DEFAULT_SORT = 'title'
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def words(text):
+    return WORD_PATTERN.findall((text or '').lower())
+
+
+def split_keywords(keywords):
+    return [keyword.strip().lower() for keyword in (keywords or '').split(',') if keyword.strip()]
+
+
+def bounded_int(value, default, low, high):
+    try:
+        return min(max(int(value), low), high)
+    except (TypeError, ValueError):
+        return default
+
+
+class ArticleFacets:
+    """Inverted indexes over a fixed list of article records"""
+
+    def __init__(self, articles):
+        self.articles = sorted(articles, key=lambda article: (article['title'], article['filename']))
+        self.categories = defaultdict(set)
+        self.keywords = defaultdict(set)
+        terms = defaultdict(set)
+        for position, article in enumerate(self.articles):
+            self.categories[article['category']].add(position)
+            for keyword in split_keywords(article.get('keywords')):
+                self.keywords[keyword].add(position)
+            for field in ('title', 'keywords', 'description'):
+                for word in words(article.get(field)):
+                    terms[word].add(position)
+        self.terms = dict(terms)
+        self.vocabulary = sorted(terms)
+
+        self.orders, self.ranks = {}, {}
+        for name, (field, descending) in SORTS.items():
+            order = sorted(
+                range(len(self.articles)),
+                key=lambda position: (self.articles[position][field] or '', self.articles[position]['title']),
+                reverse=descending
+            )
+            self.orders[name] = order
+            self.ranks[name] = {position: rank for rank, position in enumerate(order)}
+        # Ascending by publication date, for since/until ranges
+        self.by_published = sorted(range(len(self.articles)), key=lambda position: self.articles[position]['published'])
+        self.published = [self.articles[position]['published'] for position in self.by_published]
+
+    def prefix_matches(self, prefix):
+        """Articles with a word starting with each word of prefix"""
+        result = None
+        for word in words(prefix):
+            matches = set()
+            start = bisect.bisect_left(self.vocabulary, word)
+            for term in self.vocabulary[start:]:
+                if not term.startswith(word):
+                    break
+                matches |= self.terms[term]
+            result = matches if result is None else result & matches
+        return result
+
+    def date_range(self, since, until):
+        start = bisect.bisect_left(self.published, since) if since else 0
+        end = bisect.bisect_right(self.published, until) if until else len(self.published)
+        return set(self.by_published[start:end])
+
+    def search(self, category=None, keywords=(), prefix=None, since=None, until=None,
+               sort=DEFAULT_SORT, page=1, per_page=DEFAULT_PER_PAGE, fields=None):
+        """Return one page of matching articles plus category counts for the other filters"""
+        postings = [self.keywords.get(keyword.lower(), set()) for keyword in keywords]
+        if prefix and words(prefix):
+            postings.append(self.prefix_matches(prefix))
+        if since or until:
+            postings.append(self.date_range(since, until))
+        matches = None
+        for posting in sorted(postings, key=len):
+            matches = set(posting) if matches is None else matches & posting
+            if not matches:
+                break
+
+        # Tab counts ignore the category filter, so every tab shows what it would hold
+        counts = {
+            name: len(members if matches is None else members & matches)
+            for name, members in sorted(self.categories.items())
+        }
+        if category:
+            members = self.categories.get(category, set())
+            matches = set(members) if matches is None else matches & members
+
+        name = sort.lstrip('-') if sort else DEFAULT_SORT
+        if name not in SORTS:
+            raise ValueError(f"Unknown sort {sort!r}; use one of {', '.join(sorted(SORTS))}")
+        if matches is None:
+            ordered = self.orders[name]
+        else:
+            ordered = sorted(matches, key=self.ranks[name].__getitem__)
+        if sort.startswith('-'):
+            ordered = ordered[::-1]
+
+        total = len(ordered)
+        pages = max(1, -(-total // per_page))
+        page = min(max(page, 1), pages)
+        records = [self.articles[position] for position in ordered[(page - 1) * per_page:page * per_page]]
+        if fields:
+            records = [{field: record.get(field) for field in fields} for record in records]
+        return {
+            'articles': records,
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': pages,
+            'sort': sort,
+            'categories': counts,
+        }
+
+
+class FacetIndex:
+    """ArticleFacets kept current with an ArticleStore; rebuilt only after the store changes"""
+
+    def __init__(self, store):
+        self.store = store
+        self.generation = None
+        self.facets = None
+        self.lock = threading.Lock()
+
+    def current(self):
+        self.store.refresh()
+        with self.lock:
+            if self.facets is None or self.generation != self.store.generation:
+                # Read the generation first: a change that lands mid-rebuild triggers another
+                self.generation = self.store.generation
+                self.facets = ArticleFacets(self.store.all())
+            return self.facets
+
+    def search(self, params):
+        """Run a search from query-string style parameters (all values are strings)"""
+        return self.current().search(
+            category=params.get('category') or None,
+            keywords=split_keywords(params.get('keyword')),
+            prefix=params.get('prefix') or params.get('q'),
+            since=params.get('since') or None,
+            until=params.get('until') or None,
+            sort=params.get('sort') or DEFAULT_SORT,
+            page=bounded_int(params.get('page'), 1, 1, 1 << 31),
+            per_page=bounded_int(params.get('per_page'), DEFAULT_PER_PAGE, 1, MAX_PER_PAGE),
+            fields=[field for field in (params.get('fields') or '').split(',') if field] or None,
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Query the article facets the way /api/articles-list does')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    for name in ('category', 'keyword', 'prefix', 'since', 'until', 'sort', 'page', 'per_page', 'fields'):
+        parser.add_argument(f'--{name.replace("_", "-")}', dest=name)
+    args = parser.parse_args()
+
+    params = {name: value for name, value in vars(args).items() if name != 'root' and value is not None}
+    result = FacetIndex(ArticleStore(args.root)).search(params)
+    print(json.dumps(result, indent=2))
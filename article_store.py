@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Article store for the Buildly blog.
+
+Articles are authored as Markdown files with front matter in
+content/articles/<slug>.md; their pages in articles/<slug>.html are generated
+from them. Articles that only exist as hand-written HTML are indexed too, by
+scraping their <head> once (see read_article).
+
+Both kinds are compiled into one SQLite metadata database, .articles.db, with
+indexes on slug, category and publication date. A refresh only re-reads files
+whose mtime or size changed since the database last saw them, so listing,
+filtering and regeneration query the index instead of re-scraping HTML.
+
+Front matter is a block of `key: value` lines between `---` fences:
+
+    ---
+    title: Docker Containerization: Best Practices for Development and Production
+    description: Master Docker containerization ...
+    topic: Backend
+    category: Software Development
+    keywords: docker, containers, containerization
+    date: 2025-12-16
+    ---
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+ARTICLES_DIR = 'articles'
+CONTENT_DIR = 'content/articles'
+DB_FILE = '.articles.db'
+
+# Bump when the table layout or what gets extracted changes; the database is rebuilt
+SCHEMA_VERSION = 2
+
+DEFAULT_AUTHOR = 'Buildly Team'
+DEFAULT_DESCRIPTION = 'No description available'
+FRONT_MATTER_FENCE = '---'
+# Front matter keys, in the order they are written
+FRONT_MATTER_KEYS = ('title', 'description', 'topic', 'category', 'keywords', 'author', 'date', 'updated')
+
+COLUMNS = (
+    'slug', 'filename', 'source', 'title', 'description', 'keywords', 'category', 'topic', 'author',
+    'published', 'modified', 'mtime', 'size', 'body_hash', 'source_signature', 'html_signature'
+)
+# What all() and query() return for each article
+RECORD_COLUMNS = COLUMNS[:-2]
+
+SCHEMA = '''
+CREATE TABLE articles (
+    slug TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    source TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    category TEXT NOT NULL,
+    topic TEXT,
+    author TEXT NOT NULL,
+    published TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    mtime REAL,
+    size INTEGER,
+    body_hash TEXT,
+    source_signature TEXT,
+    html_signature TEXT
+);
+CREATE INDEX articles_by_category ON articles (category, published);
+CREATE INDEX articles_by_published ON articles (published);
+'''
+
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+H1_PATTERN = re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+JSONLD_DATE_PATTERN = re.compile(r'"(datePublished|dateModified)"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+META_DATE_PATTERN = re.compile(
+    r'<meta[^>]*property=["\']article:(published|modified)_time["\'][^>]*content=["\'](\d{4}-\d{2}-\d{2})',
+    re.IGNORECASE
+)
+VISIBLE_DATE_PATTERN = re.compile(
+    r'\b(January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+(\d{1,2}),\s+(\d{4})\b'
+)
+ARTICLE_BODY_PATTERN = re.compile(r'<article[^>]*>(.*)</article>', re.IGNORECASE | re.DOTALL)
+MAIN_BODY_PATTERN = re.compile(r'<main[^>]*>(.*)</main>', re.IGNORECASE | re.DOTALL)
+
+ORDERS = {
+    'published': 'published DESC, title',
+    'oldest': 'published, title',
+    'title': 'title',
+    'modified': 'modified DESC, title',
+}
+
+
+def extract_html_title(content):
+    """Extract title from HTML content"""
+    title_match = TITLE_PATTERN.search(content)
+    if title_match:
+        title = title_match.group(1).strip()
+        # Remove " - Buildly" suffix if present
+        return re.sub(r'\s*-\s*Buildly\s*$', '', title).strip()
+
+    # Fallback: look for h1
+    h1_match = H1_PATTERN.search(content)
+    if h1_match:
+        return TAG_PATTERN.sub('', h1_match.group(1)).strip()
+
+    return None
+
+
+def extract_html_meta(content, meta_name):
+    """Extract meta tag content from HTML"""
+    pattern = rf'<meta[^>]*name=["\']({meta_name})["\'][^>]*content=["\']([^"\']*)["\']'
+    match = re.search(pattern, content, re.IGNORECASE)
+    if match:
+        return match.group(2).strip()
+
+    # Try the other way around (content first, then name)
+    pattern = rf'<meta[^>]*content=["\']([^"\']*)["\'][^>]*name=["\']({meta_name})["\']'
+    match = re.search(pattern, content, re.IGNORECASE)
+    if match:
+        return match.group(1).strip()
+
+    return None
+
+
+def extract_dates(content):
+    """Return (published, modified) ISO dates found in the page, or None"""
+    dates = {}
+    for kind, value in JSONLD_DATE_PATTERN.findall(content):
+        dates.setdefault('published' if kind == 'datePublished' else 'modified', value)
+    for kind, value in META_DATE_PATTERN.findall(content):
+        dates.setdefault(kind.lower(), value)
+    if 'published' not in dates:
+        match = VISIBLE_DATE_PATTERN.search(content)
+        if match:
+            parsed = datetime.strptime(' '.join(match.groups()), '%B %d %Y')
+            dates['published'] = parsed.strftime('%Y-%m-%d')
+    published = dates.get('published')
+    return published, dates.get('modified', published)
+
+
+def extract_article_body(content):
+    """Return the inner HTML of the page's <article> (or <main>) element"""
+    match = ARTICLE_BODY_PATTERN.search(content) or MAIN_BODY_PATTERN.search(content)
+    return match.group(1).strip() if match else None
+
+
+def categorize_article(title, content, keywords):
+    """Categorize article based on title, content, and keywords"""
+    text_to_analyze = f"{title} {content} {keywords}".lower()
+
+    # AI related keywords
+    if any(word in text_to_analyze for word in ['artificial intelligence', 'machine learning', 'ai-powered', 'ai ', ' ai', 'neural', 'automation', 'intelligent']):
+        return 'AI'
+
+    # Product Management keywords
+    if any(word in text_to_analyze for word in ['product management', 'product manager', 'roadmap', 'feature', 'prioritization', 'lifecycle', 'mvp', 'product strategy']):
+        return 'Product Management'
+
+    # Startup keywords
+    if any(word in text_to_analyze for word in ['startup', 'scaling', 'growth', 'founder', 'entrepreneur', 'venture', 'funding', 'market']):
+        return 'Startup Growth'
+
+    # Default to Software Development
+    return 'Software Development'
+
+
+def read_article(file_path, stat=None):
+    """Parse one article file into its metadata record"""
+    stat = stat or os.stat(file_path)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    name = os.path.basename(file_path)
+    slug = name[:-len('.html')] if name.endswith('.html') else name
+    title = extract_html_title(content)
+    description = extract_html_meta(content, 'description')
+    keywords = extract_html_meta(content, 'keywords')
+    author = extract_html_meta(content, 'author')
+    published, modified = extract_dates(content)
+    if not published:
+        published = file_date(stat)
+        modified = modified or published
+
+    return {
+        'filename': f'{ARTICLES_DIR}/{name}',
+        'slug': slug,
+        'title': title or slug.replace('-', ' ').title(),
+        'description': description or DEFAULT_DESCRIPTION,
+        'keywords': keywords or '',
+        'category': categorize_article(title, content, keywords),
+        'author': author or DEFAULT_AUTHOR,
+        'published': published,
+        'modified': modified,
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+    }
+
+
+def parse_front_matter(text):
+    """Split a Markdown document into (front matter dict, body)"""
+    lines = text.split('\n')
+    if not lines or lines[0].strip() != FRONT_MATTER_FENCE:
+        return {}, text
+    meta = {}
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == FRONT_MATTER_FENCE:
+            return meta, '\n'.join(lines[index + 1:]).lstrip('\n')
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        key, separator, value = line.partition(':')
+        if not separator:
+            raise ValueError(f'front matter line {index + 1} is not "key: value": {line!r}')
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = json.loads(value)
+        elif len(value) >= 2 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+        meta[key.strip()] = value
+    raise ValueError('front matter is not closed with ---')
+
+
+def format_front_matter(meta, body=''):
+    """Render a front matter dict and body back into a Markdown document"""
+    keys = [key for key in FRONT_MATTER_KEYS if key in meta] + sorted(set(meta) - set(FRONT_MATTER_KEYS))
+    lines = [FRONT_MATTER_FENCE]
+    for key in keys:
+        value = str(meta[key])
+        if value != value.strip() or value[:1] in ('"', "'", '#'):
+            value = json.dumps(value, ensure_ascii=False)
+        lines.append(f'{key}: {value}')
+    lines.append(FRONT_MATTER_FENCE)
+    return '\n'.join(lines) + '\n' + (f'\n{body.strip()}\n' if body.strip() else '')
+
+
+def file_date(stat):
+    """The UTC day a file was last modified, for articles that do not state a date"""
+    return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def normalize_front_matter(meta, body='', fallback_date=None):
+    """Return meta with the defaults the store records for missing optional keys.
+
+    An article without a date is dated fallback_date (the source file's
+    modification day, see file_date), or today when that is not known.
+    """
+    if not meta.get('title'):
+        raise ValueError('front matter has no title')
+    keywords = meta.get('keywords') or ''
+    published = meta.get('date') or fallback_date or datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    return {
+        **meta,
+        'description': meta.get('description') or DEFAULT_DESCRIPTION,
+        'keywords': keywords,
+        'category': meta.get('category') or categorize_article(meta['title'], body, keywords),
+        'topic': meta.get('topic') or None,
+        'author': meta.get('author') or DEFAULT_AUTHOR,
+        'date': published,
+        'updated': meta.get('updated') or published,
+    }
+
+
+def read_source(file_path):
+    """Return (front matter, body) of one Markdown article"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return parse_front_matter(f.read())
+
+
+def signature(stat):
+    return f'{stat.st_mtime_ns}:{stat.st_size}' if stat is not None else None
+
+
+def scan(directory, suffix):
+    """Return {slug: (path, stat)} for the files in directory with suffix"""
+    files = {}
+    if not os.path.isdir(directory):
+        return files
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and not entry.name.startswith('.') and entry.is_file():
+                files[entry.name[:-len(suffix)]] = (entry.path, entry.stat())
+    return files
+
+
+class ArticleStore:
+    """Article metadata compiled from content/articles and articles/ into SQLite"""
+
+    def __init__(self, root='.', path=None):
+        self.root = root
+        self.path = path or os.path.join(root, DB_FILE)
+        self.lock = threading.Lock()
+        # Bumped by every refresh that changes something, for caches built on the records
+        self.generation = 0
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.ensure_schema()
+
+    def ensure_schema(self):
+        with self.lock:
+            version = self.db.execute('PRAGMA user_version').fetchone()[0]
+            if version == SCHEMA_VERSION:
+                return
+            self.db.executescript('DROP TABLE IF EXISTS articles;' + SCHEMA + f'PRAGMA user_version = {SCHEMA_VERSION};')
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def refresh(self):
+        """Re-read new and changed sources and pages; return the article filenames that changed or were removed"""
+        with self.lock:
+            try:
+                changed = self._refresh()
+            except Exception:
+                self.db.rollback()
+                raise
+            self.db.commit()
+            if changed:
+                self.generation += 1
+            return changed
+
+    def _refresh(self):
+        sources = scan(os.path.join(self.root, CONTENT_DIR), '.md')
+        pages = scan(os.path.join(self.root, ARTICLES_DIR), '.html')
+        known = {
+            row['slug']: (row['source_signature'], row['html_signature'])
+            for row in self.db.execute('SELECT slug, source_signature, html_signature FROM articles')
+        }
+
+        changed = []
+        for slug in sorted(set(sources) | set(pages)):
+            source_path, source_stat = sources.get(slug, (None, None))
+            page_path, page_stat = pages.get(slug, (None, None))
+            signatures = (signature(source_stat), signature(page_stat))
+            if known.get(slug) == signatures:
+                continue
+            try:
+                if source_path:
+                    record = self.source_record(slug, source_path, source_stat, page_stat)
+                else:
+                    record = self.page_record(slug, page_path, page_stat)
+            except (OSError, UnicodeDecodeError, ValueError):
+                self.db.execute('DELETE FROM articles WHERE slug = ?', (slug,))
+                continue
+            record['source_signature'], record['html_signature'] = signatures
+            self.db.execute(
+                f"INSERT OR REPLACE INTO articles ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                [record.get(column) for column in COLUMNS]
+            )
+            changed.append(f'{ARTICLES_DIR}/{slug}.html')
+
+        for slug in set(known) - set(sources) - set(pages):
+            self.db.execute('DELETE FROM articles WHERE slug = ?', (slug,))
+            changed.append(f'{ARTICLES_DIR}/{slug}.html')
+        return changed
+
+    def source_record(self, slug, source_path, source_stat, page_stat):
+        meta, body = read_source(source_path)
+        meta = normalize_front_matter(meta, body, file_date(source_stat))
+        return {
+            'slug': slug,
+            'filename': f'{ARTICLES_DIR}/{slug}.html',
+            'source': f'{CONTENT_DIR}/{slug}.md',
+            'title': meta['title'],
+            'description': meta['description'],
+            'keywords': meta['keywords'],
+            'category': meta['category'],
+            'topic': meta['topic'],
+            'author': meta['author'],
+            'published': meta['date'],
+            'modified': meta['updated'],
+            'mtime': page_stat.st_mtime if page_stat else None,
+            'size': page_stat.st_size if page_stat else None,
+            'body_hash': hashlib.sha256(body.encode('utf-8')).hexdigest(),
+        }
+
+    def page_record(self, slug, page_path, page_stat):
+        record = read_article(page_path, page_stat)
+        return {**record, 'slug': slug, 'source': None, 'topic': None, 'body_hash': None}
+
+    def rows(self, sql, parameters=()):
+        with self.lock:
+            return [dict(row) for row in self.db.execute(sql, parameters)]
+
+    def all(self):
+        """Return every article that has a page, sorted by title"""
+        return self.rows(
+            f"SELECT {', '.join(RECORD_COLUMNS)} FROM articles WHERE size IS NOT NULL ORDER BY title"
+        )
+
+    def get(self, slug):
+        rows = self.rows(f"SELECT {', '.join(RECORD_COLUMNS)} FROM articles WHERE slug = ?", (slug,))
+        return rows[0] if rows else None
+
+    def query(self, category=None, topic=None, since=None, until=None, authored=None,
+              order='published', limit=None, offset=0):
+        """Return articles with a page, filtered through the indexes.
+
+        since/until are inclusive ISO dates; authored=True keeps Markdown-sourced
+        articles, False hand-written HTML ones.
+        """
+        clauses, parameters = ['size IS NOT NULL'], []
+        for column, value in (('category', category), ('topic', topic)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                parameters.append(value)
+        if since:
+            clauses.append('published >= ?')
+            parameters.append(since)
+        if until:
+            clauses.append('published <= ?')
+            parameters.append(until)
+        if authored is not None:
+            clauses.append('source IS NOT NULL' if authored else 'source IS NULL')
+        sql = (
+            f"SELECT {', '.join(RECORD_COLUMNS)} FROM articles WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {ORDERS.get(order, ORDERS['published'])}"
+        )
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            parameters += [int(limit), int(offset)]
+        return self.rows(sql, parameters)
+
+    def categories(self):
+        """Return {category: article count}"""
+        return {
+            row['category']: row['count']
+            for row in self.rows('SELECT category, COUNT(*) AS count FROM articles WHERE size IS NOT NULL GROUP BY category')
+        }
+
+    def sources(self):
+        """Return {slug: (front matter, body)} for every Markdown-sourced article, by slug"""
+        with self.lock:
+            slugs = [row['slug'] for row in self.db.execute('SELECT slug FROM articles WHERE source IS NOT NULL ORDER BY slug')]
+        return {slug: read_source(os.path.join(self.root, CONTENT_DIR, f'{slug}.md')) for slug in slugs}
+
+
+def compile_store(root='.'):
+    """Refresh the metadata database once; return the filenames that changed"""
+    store = ArticleStore(root)
+    try:
+        return store.refresh()
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=f'Compile article metadata into {DB_FILE}')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--category', help='List the articles in this category')
+    parser.add_argument('--since', help='List articles published on or after this ISO date')
+    parser.add_argument('--list', action='store_true', help='List articles after compiling')
+    args = parser.parse_args()
+
+    store = ArticleStore(args.root)
+    changed = store.refresh()
+    print(f"🗃️  {DB_FILE}: {len(changed)} articles updated")
+    if args.list or args.category or args.since:
+        for article in store.query(category=args.category, since=args.since):
+            marker = 'md' if article['source'] else '  '
+            print(f"{article['published']}  {marker}  {article['category']:<22} {article['title']}")
+    else:
+        for category, count in sorted(store.categories().items()):
+            print(f"   {category}: {count}")
+    store.close()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Render articles.html, the blog index page, from the article index.
+
+Used by the dev server's /api/regenerate-articles-page endpoint and by the
+build pipeline. The header (hero and featured article) and footer of the
+existing page are kept; only the category grids are regenerated.
+"""
+
+import argparse
+import json
+import os
+import re
+
+from article_store import ArticleStore
+from page_templates import TemplateLoader
+
+ARTICLES_PAGE = 'articles.html'
+FEATURED_ARTICLE_FILE = '.featured-article.json'
+
+# Used when articles.html is missing or has lost its header or footer
+DEFAULT_HEADER_TEMPLATE = 'templates/partials/articles-header.html'
+DEFAULT_FOOTER_TEMPLATE = 'templates/partials/articles-footer.html'
+
+
+def generate_articles_html(articles, featured_article, current_content=None, root='.'):
+    """Generate the complete articles.html content.
+
+    current_content is the existing page, whose header and footer are kept.
+    """
+    # Group articles by category
+    categories = {
+        'Product Management': [],
+        'AI': [],
+        'Software Development': [],
+        'Startup Growth': []
+    }
+
+    for article in articles:
+        category = article['category']
+        if category in categories:
+            categories[category].append(article)
+
+    # Generate article cards HTML
+    def generate_article_card(article, is_new=False):
+        new_badge = '<span class="bg-buildly-accent text-white px-2 py-1 rounded text-xs">New!</span>' if is_new else ''
+        border_class = 'border-l-4 border-buildly-accent' if is_new else ''
+
+        return f'''
+                    <div class="bg-white rounded-xl p-6 shadow-sm hover:shadow-lg transition-shadow {border_class}">
+                        <div class="flex items-center gap-2 mb-3">
+                            <span class="bg-buildly-primary text-white px-2 py-1 rounded text-xs">{article['category']}</span>
+                            {new_badge}
+                        </div>
+                        <h4 class="text-lg font-semibold mb-2">{article['title']}</h4>
+                        <p class="text-gray-600 text-sm mb-4">{article['description'][:120]}{'...' if len(article['description']) > 120 else ''}</p>
+                        <a href="{article['filename']}" class="text-buildly-primary font-medium hover:text-buildly-secondary">Read More →</a>
+                    </div>'''
+
+    # Generate category sections
+    pm_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Product Management'])])
+    ai_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['AI'])])
+    dev_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Software Development'])])
+    startup_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Startup Growth'])])
+
+    # Reuse the header and footer of the current articles.html when there is one
+    header_match = re.search(r'(.*?)<!-- Articles Grid -->', current_content or '', re.DOTALL)
+    header = header_match.group(1) if header_match else get_default_header(root)
+
+    footer_match = re.search(r'(<!-- Footer -->.*)', current_content or '', re.DOTALL)
+    footer = footer_match.group(1) if footer_match else get_default_footer(root)
+
+    # Update featured article in header if provided
+    if featured_article and featured_article.get('title'):
+        header = re.sub(
+            r'(<h2 class="text-3xl md:text-4xl font-bold mb-4">)(.*?)(</h2>)',
+            f'\\1{featured_article["title"]}\\3',
+            header
+        )
+        header = re.sub(
+            r'(<p class="text-lg opacity-90 mb-6">)(.*?)(</p>)',
+            f'\\1{featured_article["description"]}\\3',
+            header
+        )
+        header = re.sub(
+            r'(href=")(articles/[^"]*?)(")',
+            f'\\1{featured_article["link"]}\\3',
+            header
+        )
+
+    # Combine everything
+    return f'''{header}
+    <!-- Articles Grid -->
+    <section class="py-16 bg-buildly-light">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <div class="text-center mb-12">
+                <h2 class="text-3xl md:text-4xl font-bold text-buildly-dark mb-4">All Blog Posts</h2>
+                <p class="text-lg text-gray-600">Explore our comprehensive collection of insights and best practices</p>
+            </div>
+
+            <!-- Product Management Articles -->
+            <div class="mb-16">
+                <h3 class="text-2xl font-bold text-buildly-primary mb-8 flex items-center">
+                    <span class="w-8 h-8 bg-buildly-primary rounded-full flex items-center justify-center text-white text-sm mr-3">PM</span>
+                    Product Management
+                </h3>
+                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
+                    {pm_articles}
+                </div>
+            </div>
+
+            <!-- AI Articles -->
+            <div class="mb-16">
+                <h3 class="text-2xl font-bold text-buildly-accent mb-8 flex items-center">
+                    <span class="w-8 h-8 bg-buildly-accent rounded-full flex items-center justify-center text-white text-sm mr-3">AI</span>
+                    Artificial Intelligence
+                </h3>
+                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
+                    {ai_articles}
+                </div>
+            </div>
+
+            <!-- Software Development Articles -->
+            <div class="mb-16">
+                <h3 class="text-2xl font-bold text-buildly-secondary mb-8 flex items-center">
+                    <span class="w-8 h-8 bg-buildly-secondary rounded-full flex items-center justify-center text-white text-sm mr-3">DEV</span>
+                    Software Development
+                </h3>
+                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
+                    {dev_articles}
+                </div>
+            </div>
+
+            <!-- Startup Growth Articles -->
+            <div class="mb-16">
+                <h3 class="text-2xl font-bold text-gray-600 mb-8 flex items-center">
+                    <span class="w-8 h-8 bg-gray-600 rounded-full flex items-center justify-center text-white text-sm mr-3">📈</span>
+                    Startup Growth
+                </h3>
+                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
+                    {startup_articles}
+                </div>
+            </div>
+        </div>
+    </section>
+
+    {footer}'''
+
+def get_default_header(root='.', loader=None):
+    """Return the default header HTML, used when articles.html has none to keep"""
+    return (loader or TemplateLoader(root)).get(DEFAULT_HEADER_TEMPLATE).render({})
+
+
+def get_default_footer(root='.', loader=None):
+    """Return the default footer HTML, used when articles.html has none to keep"""
+    return (loader or TemplateLoader(root)).get(DEFAULT_FOOTER_TEMPLATE).render({})
+
+
+def load_featured_article(root='.'):
+    """Return the featured article saved by the admin, or {}"""
+    try:
+        with open(os.path.join(root, FEATURED_ARTICLE_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_articles_page(root='.', articles=None, featured_article=None):
+    """Regenerate articles.html under root; return True if its content changed"""
+    if articles is None:
+        store = ArticleStore(root)
+        store.refresh()
+        articles = store.all()
+        store.close()
+    if featured_article is None:
+        featured_article = load_featured_article(root)
+
+    page_path = os.path.join(root, ARTICLES_PAGE)
+    try:
+        with open(page_path, 'r', encoding='utf-8') as f:
+            current_content = f.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        current_content = None
+
+    new_content = generate_articles_html(articles, featured_article, current_content, root)
+    if new_content == current_content:
+        return False
+    with open(page_path, 'w', encoding='utf-8') as f:
+        f.write(new_content)
+    return True
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Regenerate articles.html from articles/')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    args = parser.parse_args()
+
+    changed = write_articles_page(args.root)
+    print(f"🚀 Articles page {'regenerated' if changed else 'already up to date'}")
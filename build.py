@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Build the deployable Buildly website into dist/.
+
+The stages that the dev server otherwise runs ad hoc against the source tree
+(generated articles, related-article links, articles.html, navigation
+rewriting, feeds, sitemap), plus build-only code highlighting and Open Graph
+card images, run here as one
+dependency-ordered pipeline against a staging copy of the site in
+.build/site, so the source tree is never modified. The last stage minifies and
+fingerprints the staged site into dist/ (see build_assets.py).
+
+Stages whose dependencies are all finished run in parallel. Each stage is
+skipped when the files it reads, and the code that implements it, are
+unchanged since the last successful build; state is kept in .build/state.json.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from pathlib import Path
+
+import article_store
+import articles_page
+import build_assets
+import generate_articles
+import generate_feeds
+import generate_sitemap
+import highlight_code
+import navigation
+import og_cards
+import related_articles
+
+BUILD_DIR = '.build'
+STAGING_DIR = 'site'
+STATE_FILE = 'state.json'
+
+# Bump to invalidate every stage signature, e.g. when the pipeline itself changes
+STATE_VERSION = 1
+
+# Admin configuration files that stages read; dotfiles are otherwise not staged
+CONFIG_FILES = [articles_page.FEATURED_ARTICLE_FILE, navigation.NAVIGATION_CONFIG_FILE]
+
+
+class Stage:
+    """One pipeline step: what it reads, what must run first, and how to run it"""
+
+    def __init__(self, name, run, after=(), inputs=(), code=()):
+        self.name = name
+        self.run = run
+        self.after = list(after)
+        # Glob patterns relative to the staging tree
+        self.inputs = list(inputs)
+        # Source modules whose changes invalidate the stage
+        self.code = list(code)
+
+
+def file_signature(path):
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def sync_sources(builder):
+    """Copy new and changed source files into the staging tree"""
+    previous = builder.state.get('sources', {})
+    current, copied = {}, 0
+    paths = list(build_assets.discover_files(builder.root))
+    paths += [name for name in CONFIG_FILES if (builder.root / name).exists()]
+    # Article sources are read by the articles stage but never deployed
+    content_dir = builder.root / article_store.CONTENT_DIR
+    paths += sorted(path.relative_to(builder.root).as_posix() for path in content_dir.glob('*.md'))
+    for path in paths:
+        source = builder.root / path
+        current[path] = file_signature(source)
+        target = builder.site / path
+        if previous.get(path) == current[path] and target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        copied += 1
+
+    removed = 0
+    for path in previous:
+        if path not in current and (builder.site / path).exists():
+            (builder.site / path).unlink()
+            removed += 1
+    builder.state['sources'] = current
+    return f'{copied} copied, {removed} removed'
+
+
+def run_generate_articles(builder):
+    articles = generate_articles.load_articles(str(builder.site))
+    written = generate_articles.write_articles(str(builder.site), articles)
+    return f'{len(written)} of {len(articles)} articles written'
+
+
+def run_highlight(builder):
+    highlighter = highlight_code.CodeHighlighter(str(builder.site))
+    result = highlighter.highlight_pages()
+    return f"{result['blocks']} blocks on {len(result['pages'])} pages ({highlighter.misses} tokenized)"
+
+
+def run_og_cards(builder):
+    result = og_cards.build_og_cards(str(builder.site), workers=builder.jobs)
+    return f"{len(result['rendered'])} of {result['cards']} cards rendered, {len(result['pages'])} pages updated"
+
+
+def run_related(builder):
+    written = related_articles.write_related_links(str(builder.site))
+    return f'{len(written)} pages updated'
+
+
+def run_articles_page(builder):
+    changed = articles_page.write_articles_page(str(builder.site))
+    return 'articles.html regenerated' if changed else 'articles.html unchanged'
+
+
+def run_navigation(builder):
+    compiled = navigation.NavigationCache(str(builder.site)).get()
+    if compiled is None:
+        return f'no {navigation.NAVIGATION_CONFIG_FILE}'
+    result = navigation.update_navigation_in_files(compiled, str(builder.site))
+    detail = f"{len(result['updated'])} pages updated (navigation {compiled.hash})"
+    if result['missing']:
+        pages = ', '.join(f"{page} ({'/'.join(regions)})" for page, regions in result['missing'].items())
+        detail += f'; no markers in {pages}'
+    return detail
+
+
+def run_feeds(builder):
+    result = generate_feeds.generate_feeds(str(builder.site))
+    return f"{result['items']} items, {result['rendered']} re-rendered"
+
+
+def run_sitemap(builder):
+    written = generate_sitemap.generate_sitemap(str(builder.site))
+    return f'{len(written)} files written'
+
+
+def run_assets(builder):
+    result = build_assets.build_assets(str(builder.site), str(builder.output), minify=builder.minify)
+    return f"{len(result['written'])} files written, {len(result['removed'])} removed"
+
+
+STAGES = [
+    Stage('sync', sync_sources),
+    Stage(
+        'articles', run_generate_articles, after=['sync'],
+        inputs=[f'{article_store.CONTENT_DIR}/*.md'],
+        code=[
+            'generate_articles.py', 'article_store.py', 'markdown_compiler.py', 'page_templates.py',
+            generate_articles.ARTICLE_TEMPLATE, generate_articles.BODY_TEMPLATE,
+            'templates/partials/article-nav.html', 'templates/partials/article-footer.html',
+            'includes/social-share.html'
+        ]
+    ),
+    Stage(
+        'highlight', run_highlight, after=['articles'],
+        inputs=['**/*.html'],
+        code=['highlight_code.py']
+    ),
+    Stage(
+        'og-cards', run_og_cards, after=['highlight'],
+        inputs=['articles/*.html', og_cards.FONT_IMAGE, og_cards.FONT_METRICS, og_cards.LOGO_IMAGE],
+        code=['og_cards.py', 'article_store.py']
+    ),
+    Stage(
+        'related', run_related, after=['og-cards'],
+        inputs=['articles/*.html'],
+        code=['related_articles.py', 'article_store.py']
+    ),
+    Stage(
+        'articles-page', run_articles_page, after=['related'],
+        inputs=[
+            'articles/*.html', articles_page.ARTICLES_PAGE, articles_page.FEATURED_ARTICLE_FILE,
+            articles_page.DEFAULT_HEADER_TEMPLATE, articles_page.DEFAULT_FOOTER_TEMPLATE
+        ],
+        code=['articles_page.py', 'article_store.py', 'page_templates.py']
+    ),
+    Stage(
+        'navigation', run_navigation, after=['articles-page'],
+        inputs=[navigation.NAVIGATION_CONFIG_FILE] + navigation.NAVIGATION_FILES,
+        code=['navigation.py']
+    ),
+    Stage(
+        'feeds', run_feeds, after=['related'],
+        inputs=['articles/*.html'],
+        code=['generate_feeds.py', 'article_store.py']
+    ),
+    Stage(
+        'sitemap', run_sitemap, after=['navigation', 'feeds'],
+        inputs=['*.html', '*/index.html', 'articles/*.html'] + generate_sitemap.EXTRA_FILES,
+        code=['generate_sitemap.py']
+    ),
+    Stage(
+        'assets', run_assets, after=['sitemap'],
+        inputs=['**/*'],
+        code=['build_assets.py']
+    ),
+]
+
+
+class Builder:
+    """Runs STAGES against the staging tree, skipping stages with unchanged inputs"""
+
+    def __init__(self, root='.', output=build_assets.DEFAULT_OUTPUT, minify=True, force=False, jobs=None):
+        self.root = Path(root).resolve()
+        self.output = Path(output) if Path(output).is_absolute() else self.root / output
+        self.build_dir = self.root / BUILD_DIR
+        self.site = self.build_dir / STAGING_DIR
+        self.state_path = self.build_dir / STATE_FILE
+        self.minify = minify
+        self.force = force
+        self.jobs = jobs
+        self.stages = {stage.name: stage for stage in STAGES}
+        self.state = self.load_state()
+
+    def load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return state if state.get('version') == STATE_VERSION else {}
+
+    def save_state(self):
+        self.state['version'] = STATE_VERSION
+        tmp_path = self.state_path.with_name(STATE_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def signature(self, stage):
+        """Hash the stat signatures of a stage's inputs, its code and the build options"""
+        digest = hashlib.sha256(json.dumps([stage.name, self.minify, str(self.output)]).encode('utf-8'))
+        paths = set()
+        for pattern in stage.inputs:
+            paths.update(p for p in self.site.glob(pattern) if p.is_file())
+        for path in sorted(paths):
+            digest.update(json.dumps([path.relative_to(self.site).as_posix(), file_signature(path)]).encode('utf-8'))
+        for module in stage.code:
+            digest.update(json.dumps([module, file_signature(self.root / module)]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_fresh(self, stage):
+        if self.force or stage.name == 'sync':
+            return False
+        if stage.name == 'assets' and not self.output.is_dir():
+            return False
+        return self.state.get('stages', {}).get(stage.name) == self.signature(stage)
+
+    def run_stage(self, stage):
+        """Run one stage unless it is fresh; return (status, detail, seconds)"""
+        started = time.perf_counter()
+        if self.is_fresh(stage):
+            return 'skipped', 'inputs unchanged', 0.0
+        detail = stage.run(self)
+        return 'built', detail, time.perf_counter() - started
+
+    def build(self, report=print):
+        """Run the pipeline; return {stage name: (status, detail, seconds)}"""
+        self.site.mkdir(parents=True, exist_ok=True)
+        graph = TopologicalSorter({name: stage.after for name, stage in self.stages.items()})
+        graph.prepare()
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            pending = {}
+            while graph.is_active():
+                for name in graph.get_ready():
+                    pending[executor.submit(self.run_stage, self.stages[name])] = name
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    results[name] = future.result()
+                    status, detail, seconds = results[name]
+                    if status == 'skipped':
+                        report(f'⏭️  {name}: {detail}')
+                    else:
+                        report(f'✅ {name}: {detail} ({seconds:.2f}s)')
+                    graph.done(name)
+
+        # Signatures are taken once every stage has finished, since later stages
+        # (navigation, for one) rewrite files that earlier stages read
+        self.state['stages'] = {
+            name: self.signature(self.stages[name]) for name in self.stages if name != 'sync'
+        }
+        self.save_state()
+        return results
+
+
+def build(root='.', output=build_assets.DEFAULT_OUTPUT, minify=True, force=False, jobs=None, report=print):
+    """Run the full build once; see Builder.build for the return value"""
+    return Builder(root, output, minify, force, jobs).build(report)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the deployable site into dist/')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--output', default=build_assets.DEFAULT_OUTPUT, help='Output directory, relative to root')
+    parser.add_argument('--no-minify', action='store_true', help='Only fingerprint assets, keep formatting')
+    parser.add_argument('--force', action='store_true', help='Run every stage even if its inputs are unchanged')
+    parser.add_argument('--jobs', type=int, default=None, help='Maximum number of stages to run in parallel')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = build(args.root, args.output, not args.no_minify, args.force, args.jobs)
+    built = sum(1 for status, _, _ in results.values() if status == 'built')
+    print(f"🏗️  Build finished in {time.perf_counter() - started:.2f}s: {built} of {len(results)} stages ran")
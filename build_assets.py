@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Minify and fingerprint the Buildly website into a deployable directory.
+
+Pages are copied from the website root into the output directory (dist/ by
+default) with HTML, CSS and JS minified. Stylesheets and scripts under css/
+and js/ are renamed with a content hash (style.3f9a1c2b7d.css) and every
+reference to them, in pages and in other assets, is rewritten to the hashed
+name. Because a hashed file never changes, it can be served with
+`Cache-Control: immutable`; dev-server.py does so for any hashed asset name.
+The original-to-hashed mapping is written to asset-manifest.json.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+
+DEFAULT_OUTPUT = 'dist'
+MANIFEST_FILE = 'asset-manifest.json'
+
+# Directories whose .css/.js files are fingerprinted
+ASSET_DIRS = ('css', 'js')
+ASSET_SUFFIXES = ('.css', '.js')
+HASH_LENGTH = 10
+
+# Matches a fingerprinted asset name such as style.3f9a1c2b7d.css
+FINGERPRINT_PATTERN = re.compile(rf'\.[0-9a-f]{{{HASH_LENGTH}}}\.(?:css|js)$')
+
+# Source-only files and directories that are never deployed
+EXCLUDED_DIRS = {
+    '.git', '.github', '.venv', '__pycache__', 'node_modules', DEFAULT_OUTPUT,
+    'ops', 'google-apps-script', 'content',
+}
+EXCLUDED_FILES = {
+    'requests.jsonl', 'requirements.txt', 'package.json', 'package-lock.json',
+    'tailwind.config.js', 'README.md', 'UNSUBSCRIBE_SETUP.md',
+}
+EXCLUDED_SUFFIXES = ('.py', '.pyc', '.sh', '.tmp')
+
+# Quoted or url() references that end in .css/.js
+REFERENCE_PATTERN = re.compile(r'''(["'(])([^"'()\s<>]+\.(?:css|js))(?=[?#"')])''')
+
+PRESERVED_HTML_PATTERN = re.compile(
+    r'(<(pre|textarea|script|style)\b[^>]*>)(.*?)(</\2\s*>)',
+    re.IGNORECASE | re.DOTALL
+)
+HTML_COMMENT_PATTERN = re.compile(r'<!--(?!\[if|<!|>).*?-->', re.DOTALL)
+HTML_WHITESPACE_PATTERN = re.compile(r'\s+')
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_SPACE_PATTERN = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON_PATTERN = re.compile(r':\s+')
+
+# Characters after which a "/" starts a regular expression literal, not a division
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def minify_css(text):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    text = CSS_COMMENT_PATTERN.sub('', text)
+    text = HTML_WHITESPACE_PATTERN.sub(' ', text)
+    text = CSS_SPACE_PATTERN.sub(r'\1', text)
+    text = CSS_COLON_PATTERN.sub(':', text)
+    return text.replace(';}', '}').strip()
+
+
+def minify_js(text):
+    """Strip comments, indentation and blank lines from a script.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source; strings, template literals and regex literals are copied
+    through untouched.
+    """
+    out = []
+    i, length = 0, len(text)
+    last = ''
+
+    def newline():
+        while out and out[-1] in ' \t':
+            out.pop()
+        if out and out[-1] != '\n':
+            out.append('\n')
+
+    while i < length:
+        char = text[i]
+        nxt = text[i + 1] if i + 1 < length else ''
+        if char in '"\'`':
+            end = i + 1
+            while end < length and text[end] != char:
+                end += 2 if text[end] == '\\' else 1
+            out.append(text[i:end + 1])
+            last, i = char, end + 1
+        elif char == '/' and nxt == '/':
+            end = text.find('\n', i)
+            i = length if end == -1 else end
+        elif char == '/' and nxt == '*':
+            end = text.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            if out and out[-1] not in ' \t\n':
+                out.append(' ')
+        elif char == '/' and (last in JS_REGEX_PRECEDERS or last == ''):
+            end, in_class = i + 1, False
+            while end < length and text[end] != '\n':
+                if text[end] == '\\':
+                    end += 2
+                    continue
+                if text[end] == '[':
+                    in_class = True
+                elif text[end] == ']':
+                    in_class = False
+                elif text[end] == '/' and not in_class:
+                    break
+                end += 1
+            out.append(text[i:end + 1])
+            last, i = '/', end + 1
+        elif char == '\n':
+            newline()
+            i += 1
+            while i < length and text[i] in ' \t\r':
+                i += 1
+        elif char in ' \t\r':
+            if out and out[-1] not in ' \t\n':
+                out.append(' ')
+            i += 1
+        else:
+            out.append(char)
+            last, i = char, i + 1
+
+    newline()
+    return ''.join(out).strip() + '\n'
+
+
+def minify_inline_block(opening, tag, body):
+    """Minify the contents of an inline <script> or <style> element"""
+    tag = tag.lower()
+    if tag == 'style':
+        return minify_css(body)
+    if tag != 'script' or not body.strip():
+        return body
+    type_match = SCRIPT_TYPE_PATTERN.search(opening)
+    script_type = type_match.group(1).lower() if type_match else 'text/javascript'
+    if script_type in ('application/ld+json', 'application/json'):
+        try:
+            return json.dumps(json.loads(body), separators=(',', ':'), ensure_ascii=False)
+        except json.JSONDecodeError:
+            return body
+    if script_type in ('text/javascript', 'application/javascript', 'module'):
+        return minify_js(body).strip()
+    return body
+
+
+def minify_html(text):
+    """Drop comments and collapse whitespace, leaving pre/textarea content as-is"""
+    preserved = []
+
+    def stash(match):
+        opening, tag, body, closing = match.groups()
+        preserved.append(opening + minify_inline_block(opening, tag, body) + closing)
+        return f'\x00{len(preserved) - 1}\x00'
+
+    text = PRESERVED_HTML_PATTERN.sub(stash, text)
+    text = HTML_COMMENT_PATTERN.sub('', text)
+    text = HTML_WHITESPACE_PATTERN.sub(
+        lambda match: '\n' if '\n' in match.group(0) else ' ', text
+    )
+    text = re.sub(r'\x00(\d+)\x00', lambda match: preserved[int(match.group(1))], text)
+    return text.strip() + '\n'
+
+
+MINIFIERS = {'.html': minify_html, '.css': minify_css, '.js': minify_js}
+
+
+def is_deployed(path):
+    """Return True if a site-relative path belongs in the build output"""
+    parts = path.split('/')
+    if any(part in EXCLUDED_DIRS or part.startswith('.') for part in parts[:-1]):
+        return False
+    name = parts[-1]
+    if name.startswith('.') or name.endswith(EXCLUDED_SUFFIXES):
+        return False
+    return not (len(parts) == 1 and name in EXCLUDED_FILES)
+
+
+def discover_files(root):
+    """Yield site-relative paths of every file that is deployed"""
+    root = Path(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith('.'))
+        for filename in sorted(filenames):
+            path = (Path(dirpath) / filename).relative_to(root).as_posix()
+            if is_deployed(path):
+                yield path
+
+
+def is_asset(path):
+    return path.split('/')[0] in ASSET_DIRS and path.endswith(ASSET_SUFFIXES)
+
+
+def resolve_reference(source, reference):
+    """Map a reference found in `source` to a site-relative path, or None if external"""
+    if reference.startswith(('http://', 'https://', '//', 'data:')):
+        return None
+    if reference.startswith('/'):
+        return posixpath.normpath(reference.lstrip('/'))
+    # Scripts resolve relative URLs against the page, so only absolute ones are followed
+    if source.endswith('.js'):
+        return None
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), reference))
+
+
+def asset_references(source, text, assets):
+    """Return the set of assets that `text` (the content of `source`) references"""
+    found = set()
+    for _, reference in REFERENCE_PATTERN.findall(text):
+        target = resolve_reference(source, reference)
+        if target in assets:
+            found.add(target)
+    return found
+
+
+def rewrite_references(source, text, manifest):
+    """Point every asset reference in `text` at its fingerprinted name"""
+    def replace(match):
+        quote, reference = match.groups()
+        target = resolve_reference(source, reference)
+        if target not in manifest:
+            return match.group(0)
+        return quote + posixpath.join(posixpath.dirname(reference), posixpath.basename(manifest[target]))
+
+    return REFERENCE_PATTERN.sub(replace, text)
+
+
+def fingerprint(path, data):
+    """Return the hashed name for an asset with the given (final) content"""
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    stem, suffix = posixpath.splitext(path)
+    return f'{stem}.{digest}{suffix}'
+
+
+def write_if_changed(file_path, data):
+    """Write bytes to a file only when its content differs; return True if written"""
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+    return True
+
+
+class AssetBuilder:
+    """Copies the site into an output directory, minified and fingerprinted"""
+
+    def __init__(self, root='.', output=DEFAULT_OUTPUT, minify=True):
+        self.root = Path(root)
+        self.output = Path(output) if Path(output).is_absolute() else self.root / output
+        self.minify = minify
+        self.manifest = {}
+
+    def read(self, path):
+        with open(self.root / path, 'rb') as f:
+            return f.read()
+
+    def transform(self, path, data):
+        """Minify and rewrite asset references in a text file"""
+        suffix = posixpath.splitext(path)[1]
+        if suffix not in MINIFIERS:
+            return data
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return data
+        if self.minify:
+            text = MINIFIERS[suffix](text)
+        return rewrite_references(path, text, self.manifest).encode('utf-8')
+
+    def build_assets(self, assets):
+        """Fingerprint assets in dependency order so hashes cover rewritten references"""
+        sources = {path: self.read(path) for path in assets}
+        graph = {
+            path: asset_references(path, data.decode('utf-8', 'replace'), assets) - {path}
+            for path, data in sources.items()
+        }
+        try:
+            order = list(TopologicalSorter(graph).static_order())
+        except CycleError:
+            # Assets that reference each other in a loop can't all be hashed; keep
+            # going with a stable order so at least the leaves are fingerprinted
+            order = sorted(assets)
+
+        outputs = {}
+        for path in order:
+            data = self.transform(path, sources[path])
+            self.manifest[path] = fingerprint(path, data)
+            outputs[self.manifest[path]] = data
+        return outputs
+
+    def build(self):
+        """Build the output directory; return a summary of the work done"""
+        files = list(discover_files(self.root))
+        assets = {path for path in files if is_asset(path)}
+        self.manifest = {}
+        outputs = self.build_assets(assets)
+        for path in files:
+            if path in assets:
+                continue
+            data = self.read(path)
+            outputs[path] = self.transform(path, data)
+
+        written, bytes_in, bytes_out = [], 0, 0
+        for path in files:
+            bytes_in += (self.root / path).stat().st_size
+        for path, data in outputs.items():
+            bytes_out += len(data)
+            if write_if_changed(self.output / path, data):
+                written.append(path)
+
+        manifest = json.dumps(self.manifest, indent=2, sort_keys=True) + '\n'
+        write_if_changed(self.output / MANIFEST_FILE, manifest.encode('utf-8'))
+        removed = self.remove_stale(set(outputs) | {MANIFEST_FILE})
+        return {
+            'files': len(outputs),
+            'assets': len(assets),
+            'written': written,
+            'removed': removed,
+            'bytes_in': bytes_in,
+            'bytes_out': bytes_out,
+        }
+
+    def remove_stale(self, keep):
+        """Delete output files left over from earlier builds (e.g. old asset hashes)"""
+        removed = []
+        if not self.output.is_dir():
+            return removed
+        for dirpath, _, filenames in os.walk(self.output):
+            for filename in filenames:
+                path = (Path(dirpath) / filename).relative_to(self.output).as_posix()
+                if path not in keep:
+                    (Path(dirpath) / filename).unlink()
+                    removed.append(path)
+        return removed
+
+
+def build_assets(root='.', output=DEFAULT_OUTPUT, minify=True):
+    """Build the output directory once; see AssetBuilder.build for the return value"""
+    return AssetBuilder(root, output, minify).build()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Minify the site and fingerprint css/ and js/ assets')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Output directory, relative to root')
+    parser.add_argument('--no-minify', action='store_true', help='Only fingerprint assets, keep formatting')
+    args = parser.parse_args()
+
+    result = build_assets(args.root, args.output, minify=not args.no_minify)
+    saved = result['bytes_in'] - result['bytes_out']
+    print(
+        f"📦 Built {result['files']} files ({result['assets']} fingerprinted assets) into {args.output}: "
+        f"{len(result['written'])} written, {len(result['removed'])} removed, {saved // 1024} KB saved"
+    )
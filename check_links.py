@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Check every internal link and asset reference on the Buildly website.
+
+Each HTML file is parsed once (across a process pool when many files need
+parsing) for the URLs it references and the ids it defines. References are
+resolved against an in-memory index of every file in the tree, so nothing
+is stat'ed per link. The result is a machine-readable report of:
+
+- broken references: missing files, zero-byte placeholder pages, unknown #anchors
+- orphans: pages that no other page links to
+- the page-to-page link graph
+
+Parse results are cached in .link-check-cache.json by mtime and size, so a
+re-check after saving one page only re-parses that page.
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+
+CACHE_FILE = '.link-check-cache.json'
+REPORT_FILE = '.link-report.json'
+
+# Bump when the parser changes so cached parse results are discarded
+CACHE_VERSION = 1
+
+# Below this many files to parse, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+SKIPPED_DIRS = {'.git', '.build', '.venv', '__pycache__', 'node_modules', 'dist'}
+
+# Pages that are reached directly rather than through links
+ENTRY_POINTS = {'index.html', '404.html', 'admin.html', 'unsubscribe.html'}
+# Trees that are not part of the public site's link graph
+NON_CONTENT_DIRS = ('admin/', 'templates/', 'includes/', 'buildly-cms/', 'docs/')
+# Sources rendered into pages elsewhere in the tree; their links only resolve
+# from where the output lands, so they are checked in the generated pages instead
+TEMPLATE_DIRS = ('templates/',)
+
+# Attributes that hold a URL, per tag
+URL_ATTRIBUTES = {
+    'a': ('href',),
+    'link': ('href',),
+    'script': ('src',),
+    'img': ('src', 'srcset'),
+    'source': ('src', 'srcset'),
+    'iframe': ('src',),
+    'video': ('src', 'poster'),
+    'audio': ('src',),
+    'embed': ('src',),
+    'form': ('action',),
+    'amp-img': ('src', 'srcset'),
+}
+EXTERNAL_SCHEMES = ('http', 'https', 'mailto', 'tel', 'javascript', 'data', 'sms', 'ftp')
+# Fragments in these directories are injected into other pages, and are
+# written either relative to themselves or to the directory one level up
+FRAGMENT_DIR = 'includes'
+# Characters that mark a URL as a template placeholder rather than a real link
+PLACEHOLDER_CHARACTERS = ('{', '}', '$', '[', ']', '<', '>')
+
+
+class LinkParser(HTMLParser):
+    """Collects (tag, attribute, url, line) references and element ids from one page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        line = self.getpos()[0]
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name in ('id', 'name') and tag != 'meta':
+                self.ids.add(value)
+            if name in URL_ATTRIBUTES.get(tag, ()):
+                if name == 'srcset':
+                    for candidate in value.split(','):
+                        url = candidate.strip().split(' ')[0]
+                        if url:
+                            self.links.append((tag, name, url, line))
+                else:
+                    self.links.append((tag, name, value.strip(), line))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_page(args):
+    """Parse one page; runs in a worker process"""
+    root, path = args
+    with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    parser = LinkParser()
+    try:
+        parser.feed(content)
+        parser.close()
+    except Exception:
+        # A page the stdlib parser chokes on still reports what it found so far
+        pass
+    return path, {'links': parser.links, 'ids': sorted(parser.ids)}
+
+
+def index_files(root):
+    """Return {site-relative path: size} for every file in the tree"""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+        for filename in filenames:
+            # Dotfiles (editor previews, caches) are not served as site pages
+            if filename.startswith('.'):
+                continue
+            full_path = os.path.join(dirpath, filename)
+            path = os.path.relpath(full_path, root).replace(os.sep, '/')
+            try:
+                files[path] = os.stat(full_path).st_size
+            except OSError:
+                continue
+    return files
+
+
+def is_external(url):
+    parts = urlsplit(url)
+    return bool(parts.netloc) or parts.scheme.lower() in EXTERNAL_SCHEMES or url.startswith('//')
+
+
+def resolve(source, url, files):
+    """Resolve url as linked from source; return (path, fragment) or (None, None) when not checkable"""
+    target, fragment = resolve_from(posixpath.dirname(source), source, url, files)
+    if target is not None and target not in files and posixpath.basename(posixpath.dirname(source)) == FRAGMENT_DIR:
+        fallback, _ = resolve_from(posixpath.dirname(posixpath.dirname(source)), source, url, files)
+        if fallback in files:
+            return fallback, fragment
+    return target, fragment
+
+
+def resolve_from(base, source, url, files):
+    if not url or is_external(url) or any(char in url for char in PLACEHOLDER_CHARACTERS):
+        return None, None
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    if not path:
+        return source, parts.fragment
+    if path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/')) if path != '/' else ''
+    else:
+        target = posixpath.normpath(posixpath.join(base, path))
+    if target in ('', '.'):
+        target = 'index.html'
+    elif path.endswith('/') or (target not in files and f'{target}/index.html' in files):
+        target = f'{target}/index.html'
+    elif target not in files and f'{target}.html' in files:
+        # GitHub Pages serves /page as page.html
+        target = f'{target}.html'
+    return target, parts.fragment
+
+
+class LinkChecker:
+    """Parses pages (cached by mtime/size) and checks their references"""
+
+    def __init__(self, root='.', workers=None):
+        self.root = root
+        self.workers = workers
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('pages', {})
+
+    def save_cache(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'pages': self.cache}, f)
+
+    def parse_pages(self, pages):
+        """Return {path: parse result}, parsing only pages whose mtime or size changed"""
+        signatures, stale = {}, []
+        for path in pages:
+            stat = os.stat(os.path.join(self.root, path))
+            signatures[path] = [stat.st_mtime_ns, stat.st_size]
+            cached = self.cache.get(path)
+            if cached is None or cached['signature'] != signatures[path]:
+                stale.append(path)
+
+        if len(stale) >= PARALLEL_THRESHOLD and self.workers != 0:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(parse_page, [(self.root, path) for path in stale], chunksize=8))
+        else:
+            results = [parse_page((self.root, path)) for path in stale]
+        for path, result in results:
+            self.cache[path] = {'signature': signatures[path], **result}
+
+        for path in list(self.cache):
+            if path not in signatures:
+                del self.cache[path]
+        return {path: self.cache[path] for path in pages}, len(stale)
+
+    def check(self):
+        """Check the whole site and return the report as a dict"""
+        files = index_files(self.root)
+        pages = sorted(path for path in files if path.endswith('.html') and not path.startswith(TEMPLATE_DIRS))
+        parsed, reparsed = self.parse_pages(pages)
+        ids = {path: set(result['ids']) for path, result in parsed.items()}
+
+        broken, graph, inbound = [], {}, {path: 0 for path in pages}
+        checked = 0
+        for source in pages:
+            targets = set()
+            for tag, attribute, url, line in parsed[source]['links']:
+                target, fragment = resolve(source, url, files)
+                if target is None:
+                    continue
+                checked += 1
+                reason = None
+                if target not in files:
+                    reason = 'missing'
+                elif files[target] == 0:
+                    reason = 'empty'
+                elif fragment and target in ids and fragment not in ids[target] and tag == 'a':
+                    reason = 'missing-anchor'
+                if reason:
+                    broken.append({
+                        'source': source,
+                        'line': line,
+                        'tag': tag,
+                        'attribute': attribute,
+                        'url': url,
+                        'target': target,
+                        'reason': reason,
+                    })
+                if target.endswith('.html') and target != source and target in files:
+                    targets.add(target)
+            graph[source] = sorted(targets)
+            for target in targets:
+                if target in inbound and not source.startswith(NON_CONTENT_DIRS):
+                    inbound[target] += 1
+
+        orphans = [
+            path for path, count in inbound.items()
+            if count == 0 and path not in ENTRY_POINTS and not path.startswith(NON_CONTENT_DIRS)
+        ]
+        self.save_cache()
+        return {
+            'generated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'summary': {
+                'pages': len(pages),
+                'files': len(files),
+                'reparsed': reparsed,
+                'links_checked': checked,
+                'broken': len(broken),
+                'orphans': len(orphans),
+                'empty_pages': sum(1 for path in pages if files[path] == 0),
+            },
+            'broken': broken,
+            'orphans': orphans,
+            'empty_pages': [path for path in pages if files[path] == 0],
+            'graph': graph,
+        }
+
+
+def check_links(root='.', workers=None):
+    """Run one check; see LinkChecker.check for the report format"""
+    return LinkChecker(root, workers).check()
+
+
+def write_report(report, file_path):
+    tmp_path = f'{file_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, file_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Find broken links, missing assets and orphan pages')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--output', default=None, help=f'Write the JSON report here (e.g. {REPORT_FILE}); "-" for stdout')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes (0 parses in-process)')
+    args = parser.parse_args()
+
+    report = check_links(args.root, args.workers)
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        sys.exit(1 if report['broken'] else 0)
+    if args.output:
+        write_report(report, args.output)
+
+    summary = report['summary']
+    for item in report['broken']:
+        print(f"❌ {item['source']}:{item['line']} {item['url']} ({item['reason']})")
+    for path in report['orphans']:
+        print(f"👻 Orphan page: {path}")
+    print(
+        f"🔍 Checked {summary['links_checked']} links on {summary['pages']} pages "
+        f"({summary['reparsed']} parsed): {summary['broken']} broken, {summary['orphans']} orphans"
+    )
+    sys.exit(1 if report['broken'] else 0)
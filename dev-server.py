@@ -6,96 +6,1316 @@ This extends Python's simple HTTP server to handle POST requests for saving file
 
 import os
 import json
+import hashlib
 import urllib.parse
+import urllib.request
 import re
+import fnmatch
 import glob
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from graphlib import TopologicalSorter
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 
-class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
-    def do_GET(self):
-        print(f"GET request: {self.path}")
-        if self.path == '/api/articles-list':
-            self.handle_articles_list()
-        elif self.path == '/api/social-accounts':
-            self.handle_get_social_accounts()
-        elif self.path == '/admin/get-navigation':
-            self.handle_get_navigation()
-        elif self.path.startswith('/api/read-file?'):
-            self.handle_read_file()
-        elif self.path == '/api/list-html-files':
-            self.handle_list_html_files()
-        elif self.path.startswith('/preview/'):
-            self.handle_preview()
+import article_facets
+import article_store
+import articles_page
+import build_assets
+import check_links
+import generate_articles
+import generate_feeds
+import generate_sitemap
+import markdown_compiler
+import navigation
+import page_templates
+import file_history
+import social_publisher
+import unsubscribe_store
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def escape_label(value):
+    """Escape a label value for the Prometheus text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ServerMetrics:
+    """Thread-safe request metrics rendered in Prometheus text format"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.lock = threading.Lock()
+        self.buckets = tuple(buckets)
+        self.started = time.time()
+        self.in_flight = 0
+        self.requests = {}    # (method, route, status) -> count
+        self.latency = {}     # (method, route) -> [bucket counts..., +Inf count, sum]
+        self.bytes_in = {}    # (method, route) -> bytes
+        self.bytes_out = {}   # (method, route) -> bytes
+        self.cache = {}       # cache name -> [hits, misses]
+
+    def request_started(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def request_finished(self, method, route, status, duration, bytes_in, bytes_out):
+        key = (method, route)
+        with self.lock:
+            self.in_flight -= 1
+            status_key = (method, route, str(status))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    histogram[i] += 1
+                    break
+            else:
+                histogram[len(self.buckets)] += 1
+            histogram[-1] += duration
+
+            self.bytes_in[key] = self.bytes_in.get(key, 0) + bytes_in
+            self.bytes_out[key] = self.bytes_out.get(key, 0) + bytes_out
+
+    def record_cache(self, name, hit):
+        """Count a hit or miss for a named cache"""
+        with self.lock:
+            counts = self.cache.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format"""
+        with self.lock:
+            requests = dict(self.requests)
+            latency = {key: list(value) for key, value in self.latency.items()}
+            bytes_in = dict(self.bytes_in)
+            bytes_out = dict(self.bytes_out)
+            cache = {key: list(value) for key, value in self.cache.items()}
+            in_flight = self.in_flight
+
+        lines = [
+            '# HELP buildly_http_requests_total Total HTTP requests by method, route and status.',
+            '# TYPE buildly_http_requests_total counter'
+        ]
+        for (method, route, status), count in sorted(requests.items()):
+            lines.append(f'buildly_http_requests_total{{method="{method}",route="{escape_label(route)}",status="{status}"}} {count}')
+
+        lines.append('# HELP buildly_http_request_duration_seconds Request latency by method and route.')
+        lines.append('# TYPE buildly_http_request_duration_seconds histogram')
+        for (method, route), histogram in sorted(latency.items()):
+            labels = f'method="{method}",route="{escape_label(route)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram):
+                cumulative += count
+                lines.append(f'buildly_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += histogram[len(self.buckets)]
+            lines.append(f'buildly_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f'buildly_http_request_duration_seconds_sum{{{labels}}} {histogram[-1]:.6f}')
+            lines.append(f'buildly_http_request_duration_seconds_count{{{labels}}} {cumulative}')
+
+        for name, help_text, values in (
+            ('buildly_http_request_bytes_total', 'Request body bytes received.', bytes_in),
+            ('buildly_http_response_bytes_total', 'Response bytes sent, headers included.', bytes_out)
+        ):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for (method, route), count in sorted(values.items()):
+                lines.append(f'{name}{{method="{method}",route="{escape_label(route)}"}} {count}')
+
+        lines.append('# HELP buildly_cache_requests_total Cache lookups by cache and result.')
+        lines.append('# TYPE buildly_cache_requests_total counter')
+        for name, (hits, misses) in sorted(cache.items()):
+            lines.append(f'buildly_cache_requests_total{{cache="{escape_label(name)}",result="hit"}} {hits}')
+            lines.append(f'buildly_cache_requests_total{{cache="{escape_label(name)}",result="miss"}} {misses}')
+        lines.append('# HELP buildly_cache_hit_ratio Fraction of cache lookups that were hits.')
+        lines.append('# TYPE buildly_cache_hit_ratio gauge')
+        for name, (hits, misses) in sorted(cache.items()):
+            total = hits + misses
+            ratio = hits / total if total else 0.0
+            lines.append(f'buildly_cache_hit_ratio{{cache="{escape_label(name)}"}} {ratio:.6f}')
+
+        lines.append('# HELP buildly_http_requests_in_flight Requests currently being served.')
+        lines.append('# TYPE buildly_http_requests_in_flight gauge')
+        lines.append(f'buildly_http_requests_in_flight {in_flight}')
+        lines.append('# HELP buildly_process_uptime_seconds Seconds since the server started.')
+        lines.append('# TYPE buildly_process_uptime_seconds gauge')
+        lines.append(f'buildly_process_uptime_seconds {time.time() - self.started:.3f}')
+        return '\n'.join(lines) + '\n'
+
+
+METRICS = ServerMetrics()
+
+LOG_LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+
+
+class EventLog:
+    """Structured JSON-lines event log written in batches by a background thread.
+
+    Request handlers only build a dict and put it on a queue; formatting,
+    file writes, console echo and rotation all happen on the writer thread.
+    """
+
+    def __init__(self, path='.admin-server-events.jsonl', level='info', echo=True,
+                 batch_size=256, flush_interval=0.5, max_bytes=10 * 1024 * 1024, backups=3):
+        self.path = Path(path)
+        self.level = LOG_LEVELS.get(level, LOG_LEVELS['info'])
+        self.echo = echo
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue = queue.SimpleQueue()
+        self.stopped = threading.Event()
+        self.writer = threading.Thread(target=self.run, name='event-log-writer', daemon=True)
+        self.writer.start()
+
+    def log(self, level, event, message=None, **fields):
+        if LOG_LEVELS[level] < self.level:
+            return
+        record = {'ts': round(time.time(), 3), 'level': level, 'event': event}
+        if message:
+            record['msg'] = message
+        record.update(fields)
+        self.queue.put(record)
+
+    def debug(self, event, message=None, **fields):
+        self.log('debug', event, message, **fields)
+
+    def info(self, event, message=None, **fields):
+        self.log('info', event, message, **fields)
+
+    def warning(self, event, message=None, **fields):
+        self.log('warning', event, message, **fields)
+
+    def error(self, event, message=None, **fields):
+        self.log('error', event, message, **fields)
+
+    def run(self):
+        while True:
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                if self.stopped.is_set():
+                    return
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                self.write_batch([record for record in batch if record is not None])
+                self.drain()
+                return
+            self.write_batch(batch)
+
+    def drain(self):
+        remaining = []
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                remaining.append(record)
+        self.write_batch(remaining)
+
+    def write_batch(self, batch):
+        if not batch:
+            return
+        try:
+            payload = ''.join(json.dumps(record, default=str, ensure_ascii=False) + '\n' for record in batch)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(payload)
+            if self.echo:
+                lines = [record['msg'] for record in batch if 'msg' in record]
+                if lines:
+                    sys.stdout.write('\n'.join(lines) + '\n')
+                    sys.stdout.flush()
+            self.rotate_if_needed()
+        except Exception as e:
+            sys.stderr.write(f"❌ Event log write failed: {e}\n")
+
+    def rotate_if_needed(self):
+        if self.max_bytes <= 0 or not self.path.exists() or self.path.stat().st_size < self.max_bytes:
+            return
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f'{self.path.name}.{index}')
+            if older.exists():
+                os.replace(older, self.path.with_name(f'{self.path.name}.{index + 1}'))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f'{self.path.name}.1'))
         else:
-            super().do_GET()
+            self.path.unlink()
+
+    def close(self):
+        """Flush pending records and stop the writer thread"""
+        self.stopped.set()
+        self.queue.put(None)
+        self.writer.join(timeout=5)
+
+
+LOG = EventLog(
+    path=os.environ.get('BUILDLY_LOG_FILE', '.admin-server-events.jsonl'),
+    level=os.environ.get('BUILDLY_LOG_LEVEL', 'info').lower()
+)
+
+
+class CountingWriter:
+    """Wrap a response stream and count the bytes written through it"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_written = 0
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return self.stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+ARTICLE_INDEX = article_store.ArticleStore('.')
+ARTICLE_FACETS = article_facets.FacetIndex(ARTICLE_INDEX)
+FEEDS = generate_feeds.FeedBuilder('.')
+PAGE_TEMPLATES = page_templates.PageTemplates('.')
+# Editor previews; builds keep their own on-disk cache (see generate_articles.write_articles)
+MARKDOWN_PREVIEW = markdown_compiler.MarkdownCompiler(root=None)
+# Validated navigation and its rendered fragments, recompiled when the config file changes
+NAVIGATION = navigation.NavigationCache('.')
+# Share posts waiting for their platform's rate limit; the worker starts with the server
+SOCIAL_QUEUE = social_publisher.SocialPublisher('.', log=LOG.log)
+# Local stand-in for the Google Sheet behind unsubscribe.html
+UNSUBSCRIBES = unsubscribe_store.UnsubscribeStore('.')
+# Every version of files saved from the editor, recorded before the file is overwritten
+HISTORY = file_history.FileHistory('.')
+
+SITEMAP_LOCK = threading.Lock()
+SITEMAP = None
+
+
+def update_sitemap(paths):
+    """Refresh sitemap.xml entries for changed pages, rewriting it only when needed.
+
+    Returns the site-relative sitemap files that were written.
+    """
+    global SITEMAP
+    written = []
+    try:
+        with SITEMAP_LOCK:
+            if SITEMAP is None:
+                SITEMAP = generate_sitemap.SitemapIndex('.')
+                changed = True
+            else:
+                changed = SITEMAP.update(paths)
+            if changed:
+                written = [Path(os.path.relpath(path)).as_posix() for path in SITEMAP.write()]
+                LOG.info('sitemap_updated', f"🗺️  Sitemap updated ({len(SITEMAP.entries)} URLs)", paths=list(paths))
+    except Exception as e:
+        LOG.error('sitemap_update_failed', f"❌ Error updating sitemap: {e}", error=str(e))
+    return written
+
+
+ARTICLES_PAGE_LOCK = threading.Lock()
+FEEDS_LOCK = threading.Lock()
+
+
+def write_articles_page(articles=None, featured_article=None):
+    """Regenerate articles.html; the featured article defaults to the saved one"""
+    if articles is None:
+        ARTICLE_INDEX.refresh()
+        articles = ARTICLE_INDEX.all()
+    with ARTICLES_PAGE_LOCK:
+        return articles_page.write_articles_page('.', articles, featured_article)
+
+
+def build_feeds():
+    """Rebuild feed.xml and atom.xml from the article index"""
+    with FEEDS_LOCK:
+        feeds = FEEDS.build(ARTICLE_INDEX)
+    LOG.info('feeds_built', f"📰 Feeds built: {feeds['rendered']} of {feeds['items']} items re-rendered", **feeds)
+    return feeds
+
+
+def update_navigation_pages(compiled, progress=None):
+    """Splice a CompiledNavigation into every page that carries the full nav bar; return the pages changed"""
+    updated = []
+    for file_path in navigation.NAVIGATION_FILES:
+        if not os.path.exists(file_path):
+            continue
+        try:
+            changed, missing = navigation.update_navigation_in_file(file_path, compiled.desktop, compiled.mobile)
+            if missing:
+                LOG.warning('navigation_markers_missing', f"⚠️  No {', '.join(missing)} navigation markers in {file_path}", path=file_path, regions=missing)
+            if changed:
+                updated.append(file_path)
+                LOG.info('navigation_file_updated', f"✅ Updated navigation in {file_path}", path=file_path)
+                if progress:
+                    progress(f"Updated navigation in {file_path}", path=file_path)
+        except Exception as e:
+            LOG.error('navigation_file_failed', f"❌ Error updating navigation in {file_path}: {e}", path=file_path, error=str(e))
     
-    def do_POST(self):
-        print(f"POST request: {self.path}")
-        if self.path == '/save-file':
-            self.handle_save_file()
-        elif self.path == '/api/set-featured-article':
-            self.handle_set_featured_article()
-        elif self.path == '/api/regenerate-articles-page':
-            self.handle_regenerate_articles_page()
-        elif self.path == '/api/social-accounts':
-            self.handle_save_social_accounts()
-        elif self.path == '/admin/save-navigation':
-            self.handle_save_navigation()
-        elif self.path == '/api/create-new-page':
-            self.handle_create_new_page()
-        elif self.path == '/api/create-preview':
-            self.handle_create_preview()
+    update_sitemap(navigation.NAVIGATION_FILES)
+    return updated
+
+
+# Seconds of quiet after the last save before dependent outputs are rebuilt
+REBUILD_DEBOUNCE = 0.5
+
+
+def path_matches(path, pattern):
+    """fnmatch for site-relative paths, where '*' never crosses a '/'"""
+    return path.count('/') == pattern.count('/') and fnmatch.fnmatchcase(path, pattern)
+
+
+class DependencyGraph:
+    """Which generated outputs read which source files.
+
+    Each target names the files it reads (glob patterns or a predicate), the
+    files it may write (patterns, used to order targets) and a rebuild
+    callable that returns the concrete files it actually wrote. Targets that
+    read another target's output are rebuilt after it.
+    """
+
+    def __init__(self):
+        self.targets = {}
+
+    def add(self, name, inputs, produces, rebuild):
+        self.targets[name] = {'inputs': inputs, 'produces': list(produces), 'rebuild': rebuild}
+
+    def reads(self, name, path):
+        inputs = self.targets[name]['inputs']
+        if callable(inputs):
+            return inputs(path)
+        return any(path_matches(path, pattern) for pattern in inputs)
+
+    def affected(self, paths):
+        """Return the targets that depend on any of paths, directly or transitively, in build order"""
+        pending, seen, affected = list(paths), set(paths), set()
+        while pending:
+            path = pending.pop()
+            for name, target in self.targets.items():
+                if name in affected or not self.reads(name, path):
+                    continue
+                affected.add(name)
+                for produced in target['produces']:
+                    if produced not in seen:
+                        seen.add(produced)
+                        pending.append(produced)
+
+        graph = {
+            name: {
+                other for other in affected
+                if other != name and any(self.reads(name, produced) for produced in self.targets[other]['produces'])
+            }
+            for name in affected
+        }
+        return list(TopologicalSorter(graph).static_order())
+
+    def describe(self):
+        return {
+            name: {
+                'inputs': target['inputs'] if not callable(target['inputs']) else target['inputs'].__doc__,
+                'produces': target['produces'],
+            }
+            for name, target in self.targets.items()
+        }
+
+
+class RebuildScheduler:
+    """Collects saved paths and rebuilds their dependent outputs once saves go quiet"""
+
+    def __init__(self, graph, debounce=REBUILD_DEBOUNCE):
+        self.graph = graph
+        self.debounce = debounce
+        self.condition = threading.Condition()
+        self.pending = set()
+        self.deadline = 0
+        self.running = False
+        self.thread = threading.Thread(target=self.run, name='rebuild-worker', daemon=True)
+        self.thread.start()
+
+    def schedule(self, paths):
+        """Queue paths for a rebuild; each call pushes the deadline back by debounce"""
+        with self.condition:
+            self.pending.update(paths)
+            self.deadline = time.monotonic() + self.debounce
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                while (remaining := self.deadline - time.monotonic()) > 0:
+                    self.condition.wait(remaining)
+                paths, self.pending = self.pending, set()
+                self.running = True
+            try:
+                self.rebuild(paths)
+            finally:
+                with self.condition:
+                    self.running = False
+
+    def rebuild(self, paths):
+        """Rebuild every target affected by paths, passing each the files changed so far.
+
+        Only the files a target reports writing are added to the changed set,
+        so downstream targets see concrete paths rather than its patterns.
+        """
+        changed = set(paths)
+        for name in self.graph.affected(paths):
+            target = self.graph.targets[name]
+            started = time.perf_counter()
+            try:
+                written = target['rebuild'](sorted(changed)) or []
+            except Exception as e:
+                LOG.error('rebuild_failed', f"❌ Error rebuilding {name}: {e}", target=name, error=str(e))
+                continue
+            changed.update(written)
+            LOG.info(
+                'rebuild_finished',
+                f"🔁 Rebuilt {name}",
+                target=name,
+                duration_ms=round((time.perf_counter() - started) * 1000, 3),
+                sources=sorted(paths),
+                written=sorted(written)
+            )
+
+    def status(self):
+        with self.condition:
+            return {'pending': sorted(self.pending), 'running': self.running}
+
+
+def rebuild_navigation(paths):
+    compiled = NAVIGATION.get()
+    if compiled is None:
+        return []
+    return update_navigation_pages(compiled)
+
+
+DEPENDENCIES = DependencyGraph()
+DEPENDENCIES.add(
+    'articles',
+    # The article templates and every partial they may include (see generate_articles.ARTICLE_TEMPLATE)
+    inputs=[f'{article_store.CONTENT_DIR}/*.md', 'templates/articles/*.html', 'templates/partials/*.html', 'includes/*.html'],
+    produces=['articles/*.html'],
+    rebuild=lambda paths: [f'articles/{filename}' for filename in generate_articles.write_articles('.')]
+)
+DEPENDENCIES.add(
+    'articles-page',
+    inputs=['articles/*.html', articles_page.FEATURED_ARTICLE_FILE],
+    produces=[articles_page.ARTICLES_PAGE],
+    rebuild=lambda paths: [articles_page.ARTICLES_PAGE] if write_articles_page() else []
+)
+DEPENDENCIES.add(
+    'feeds',
+    inputs=['articles/*.html'],
+    produces=[generate_feeds.RSS_FILE, generate_feeds.ATOM_FILE],
+    rebuild=lambda paths: build_feeds()['written']
+)
+DEPENDENCIES.add(
+    'navigation',
+    inputs=[navigation.NAVIGATION_CONFIG_FILE],
+    produces=navigation.NAVIGATION_FILES,
+    rebuild=rebuild_navigation
+)
+DEPENDENCIES.add(
+    'sitemap',
+    inputs=generate_sitemap.is_sitemap_page,
+    produces=['sitemap.xml'],
+    rebuild=update_sitemap
+)
+LINK_CHECKER = check_links.LinkChecker('.', workers=0)
+LINK_REPORT = None
+LINK_REPORT_LOCK = threading.Lock()
+
+
+def is_html_page(path):
+    """Any HTML page, for the link checker"""
+    return path.endswith('.html')
+
+
+def update_link_report(paths=None):
+    """Re-check links (re-parsing only changed pages) and write .link-report.json"""
+    global LINK_REPORT
+    with LINK_REPORT_LOCK:
+        report = LINK_CHECKER.check()
+        check_links.write_report(report, check_links.REPORT_FILE)
+        LINK_REPORT = report
+    summary = report['summary']
+    LOG.info(
+        'links_checked',
+        f"🔍 Links checked: {summary['broken']} broken, {summary['orphans']} orphans",
+        **summary
+    )
+    return report
+
+
+def rebuild_link_report(paths):
+    update_link_report()
+    return [check_links.REPORT_FILE]
+
+
+DEPENDENCIES.add(
+    'links',
+    inputs=is_html_page,
+    produces=[check_links.REPORT_FILE],
+    rebuild=rebuild_link_report
+)
+REBUILDS = RebuildScheduler(DEPENDENCIES)
+
+
+JOB_WORKERS = 2
+# Finished jobs kept for status lookups before the oldest are forgotten
+JOB_HISTORY = 200
+JOB_FINISHED_STATES = ('succeeded', 'failed')
+
+
+class Job:
+    """One queued admin operation, with a progress log that SSE clients can follow"""
+
+    def __init__(self, job_id, kind, params, run):
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+        self.run = run
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.events = []
+        self.condition = threading.Condition()
+
+    def progress(self, message, **fields):
+        """Record a progress event and wake any clients streaming this job"""
+        with self.condition:
+            self.events.append({'time': time.time(), 'message': message, **fields})
+            self.condition.notify_all()
+
+    def set_status(self, status, result=None, error=None):
+        with self.condition:
+            self.status = status
+            if status == 'running':
+                self.started = time.time()
+            elif status in JOB_FINISHED_STATES:
+                self.finished = time.time()
+                self.result = result
+                self.error = error
+            self.condition.notify_all()
+
+    def follow(self, timeout=15):
+        """Yield ('progress', event) as events arrive, ('keepalive', None) while idle, then ('done', job)"""
+        seen = 0
+        while True:
+            with self.condition:
+                if seen == len(self.events) and self.status not in JOB_FINISHED_STATES:
+                    self.condition.wait(timeout)
+                events = self.events[seen:]
+                finished = self.status in JOB_FINISHED_STATES
+            seen += len(events)
+            for event in events:
+                yield 'progress', event
+            if finished:
+                yield 'done', self.to_dict()
+                return
+            if not events:
+                yield 'keepalive', None
+
+    def to_dict(self):
+        with self.condition:
+            return {
+                'id': self.id,
+                'kind': self.kind,
+                'status': self.status,
+                'result': self.result,
+                'error': self.error,
+                'created': self.created,
+                'started': self.started,
+                'finished': self.finished,
+                'events': list(self.events),
+            }
+
+
+class JobQueue:
+    """Worker threads for slow admin operations.
+
+    submit() returns at once with a Job. An identical job (same kind and
+    parameters) that is still queued is returned instead of adding another.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, history=JOB_HISTORY):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.jobs = OrderedDict()
+        self.pending = {}
+        self.history = history
+        self.counter = 0
+        self.closed = False
+        self.workers = [
+            threading.Thread(target=self.work, name=f'job-worker-{n}', daemon=True)
+            for n in range(workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, kind, params, run):
+        """Queue run(job) under kind/params; return (job, deduplicated)"""
+        key = (kind, json.dumps(params, sort_keys=True))
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('Job queue is shutting down')
+            existing = self.pending.get(key)
+            if existing is not None:
+                return existing, True
+            self.counter += 1
+            job = Job(f'{int(time.time())}-{self.counter}', kind, params, run)
+            self.jobs[job.id] = job
+            self.pending[key] = job
+            self.forget_finished()
+        self.queue.put((key, job))
+        LOG.info('job_queued', job_id=job.id, kind=kind)
+        return job, False
+
+    def forget_finished(self):
+        while len(self.jobs) > self.history:
+            oldest = next((job_id for job_id, job in self.jobs.items() if job.status in JOB_FINISHED_STATES), None)
+            if oldest is None:
+                break
+            del self.jobs[oldest]
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def recent(self, limit=50):
+        with self.lock:
+            jobs = list(self.jobs.values())[-limit:]
+        return [job.to_dict() for job in reversed(jobs)]
+
+    def work(self):
+        while True:
+            key, job = self.queue.get()
+            if job is None:
+                self.queue.task_done()
+                return
+            with self.lock:
+                # Once running, an identical submission queues a fresh job
+                if self.pending.get(key) is job:
+                    del self.pending[key]
+            job.set_status('running')
+            started = time.perf_counter()
+            try:
+                result = job.run(job)
+            except Exception as e:
+                job.set_status('failed', error=str(e))
+                LOG.error('job_failed', f"❌ Job {job.kind} failed: {e}", job_id=job.id, kind=job.kind, error=str(e))
+            else:
+                job.set_status('succeeded', result=result)
+                LOG.info(
+                    'job_finished',
+                    job_id=job.id,
+                    kind=job.kind,
+                    duration_ms=round((time.perf_counter() - started) * 1000, 3)
+                )
+            finally:
+                self.queue.task_done()
+
+    def close(self, timeout=10):
+        """Stop accepting jobs and give queued ones up to timeout seconds to finish"""
+        with self.lock:
+            self.closed = True
+        for _ in self.workers:
+            self.queue.put((None, None))
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            worker.join(max(0, deadline - time.monotonic()))
+
+
+JOBS = JobQueue()
+
+
+# Upstream endpoints used when a request does not carry its own endpoint
+AI_PROVIDER_ENDPOINTS = {
+    'ollama': os.environ.get('BUILDLY_OLLAMA_URL', 'http://localhost:11434'),
+    'openai': os.environ.get('BUILDLY_OPENAI_URL', 'https://api.openai.com/v1'),
+    'gemini': os.environ.get('BUILDLY_GEMINI_URL', 'https://generativelanguage.googleapis.com/v1'),
+}
+
+# Upstreams a request may name in addition to the defaults above (comma-separated)
+AI_EXTRA_ENDPOINTS = [
+    url.strip().rstrip('/') for url in os.environ.get('BUILDLY_AI_ENDPOINTS', '').split(',') if url.strip()
+]
+
+# Maximum simultaneous upstream generations per provider; extra requests queue
+AI_PROVIDER_CONCURRENCY = {'ollama': 1, 'openai': 4, 'gemini': 4}
+
+AI_CACHE_SIZE = 256
+AI_CACHE_TTL = 3600
+AI_UPSTREAM_TIMEOUT = 300
+
+
+def stream_ollama(request):
+    """Yield (text, usage) pieces from an Ollama /api/generate stream"""
+    body = json.dumps({
+        'model': request['model'],
+        'prompt': request['prompt'],
+        'stream': True,
+        'options': {'temperature': request['temperature'], 'num_predict': request['maxTokens']}
+    }).encode('utf-8')
+    upstream = urllib.request.Request(
+        f"{request['endpoint']}/api/generate", data=body, headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(upstream, timeout=AI_UPSTREAM_TIMEOUT) as response:
+        for line in response:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            usage = None
+            if data.get('done'):
+                usage = {
+                    'promptTokens': data.get('prompt_eval_count', 0),
+                    'completionTokens': data.get('eval_count', 0),
+                    'totalTokens': data.get('prompt_eval_count', 0) + data.get('eval_count', 0)
+                }
+            yield data.get('response', ''), usage
+
+
+def stream_openai(request):
+    """Yield (text, usage) pieces from an OpenAI-compatible chat completions stream"""
+    body = json.dumps({
+        'model': request['model'],
+        'messages': [{'role': 'user', 'content': request['prompt']}],
+        'max_tokens': request['maxTokens'],
+        'temperature': request['temperature'],
+        'stream': True
+    }).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    if request.get('apiKey'):
+        headers['Authorization'] = f"Bearer {request['apiKey']}"
+    upstream = urllib.request.Request(f"{request['endpoint']}/chat/completions", data=body, headers=headers)
+    with urllib.request.urlopen(upstream, timeout=AI_UPSTREAM_TIMEOUT) as response:
+        for line in response:
+            line = line.decode('utf-8').strip()
+            if not line.startswith('data:'):
+                continue
+            payload = line[len('data:'):].strip()
+            if payload == '[DONE]':
+                break
+            data = json.loads(payload)
+            choices = data.get('choices') or [{}]
+            yield (choices[0].get('delta') or {}).get('content') or '', data.get('usage')
+
+
+def stream_gemini(request):
+    """Yield the whole Gemini completion as a single piece (no streaming upstream)"""
+    body = json.dumps({
+        'contents': [{'parts': [{'text': request['prompt']}]}],
+        'generationConfig': {'temperature': request['temperature'], 'maxOutputTokens': request['maxTokens']}
+    }).encode('utf-8')
+    url = f"{request['endpoint']}/models/{request['model']}:generateContent?key={urllib.parse.quote(request.get('apiKey') or '')}"
+    upstream = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(upstream, timeout=AI_UPSTREAM_TIMEOUT) as response:
+        data = json.loads(response.read())
+    candidate = (data.get('candidates') or [{}])[0]
+    parts = (candidate.get('content') or {}).get('parts') or [{}]
+    yield parts[0].get('text', ''), data.get('usageMetadata', {})
+
+
+AI_PROVIDERS = {'ollama': stream_ollama, 'openai': stream_openai, 'gemini': stream_gemini}
+
+
+def resolve_ai_endpoint(provider, endpoint=None):
+    """Return the upstream URL for a request, or None if it is not an allowed endpoint"""
+    if not endpoint:
+        return AI_PROVIDER_ENDPOINTS[provider].rstrip('/')
+    endpoint = endpoint.rstrip('/')
+    allowed = {url.rstrip('/') for url in AI_PROVIDER_ENDPOINTS.values()}
+    allowed.update(AI_EXTRA_ENDPOINTS)
+    return endpoint if endpoint in allowed else None
+
+
+class Generation:
+    """One upstream completion shared by every request for the same prompt"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.chunks = []
+        self.usage = {}
+        self.done = False
+        self.error = None
+
+    def append(self, text):
+        with self.condition:
+            self.chunks.append(text)
+            self.condition.notify_all()
+
+    def finish(self, error=None):
+        with self.condition:
+            self.done = True
+            self.error = error
+            self.condition.notify_all()
+
+    def stream(self):
+        """Yield chunks as they arrive, replaying any already received"""
+        index = 0
+        while True:
+            with self.condition:
+                while index >= len(self.chunks) and not self.done:
+                    self.condition.wait()
+                pending = self.chunks[index:]
+                index = len(self.chunks)
+                done, error = self.done, self.error
+            for chunk in pending:
+                yield chunk
+            if done and index >= len(self.chunks):
+                if error:
+                    raise error
+                return
+
+    def content(self):
+        return ''.join(self.stream())
+
+
+class AIProxy:
+    """Coalescing, caching proxy in front of the AI providers.
+
+    Identical requests (same provider, endpoint, model, prompt and options) that arrive
+    while one is in flight subscribe to the same Generation instead of
+    calling the model again. Finished completions are kept in an LRU cache
+    with a TTL, and each provider has a semaphore bounding upstream calls.
+    """
+
+    def __init__(self, cache_size=AI_CACHE_SIZE, ttl=AI_CACHE_TTL, concurrency=AI_PROVIDER_CONCURRENCY):
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()   # key -> (expires_at, result)
+        self.in_flight = {}          # key -> Generation
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.limits = {name: threading.BoundedSemaphore(limit) for name, limit in concurrency.items()}
+
+    def cache_key(self, request):
+        options = json.dumps([request['prompt'], request['temperature'], request['maxTokens']])
+        digest = hashlib.sha256(options.encode('utf-8')).hexdigest()
+        return (request['provider'], request['endpoint'], request['model'], digest)
+
+    def lookup(self, request):
+        """Return ('cached', result) or ('coalesced'|'started', Generation)"""
+        key = self.cache_key(request)
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                expires_at, result = cached
+                if expires_at > time.time():
+                    self.cache.move_to_end(key)
+                    METRICS.record_cache('ai-completions', True)
+                    return 'cached', result
+                del self.cache[key]
+            METRICS.record_cache('ai-completions', False)
+
+            generation = self.in_flight.get(key)
+            if generation is not None:
+                return 'coalesced', generation
+            generation = self.in_flight[key] = Generation()
+
+        threading.Thread(
+            target=self.run, args=(key, request, generation), name='ai-generation', daemon=True
+        ).start()
+        return 'started', generation
+
+    def run(self, key, request, generation):
+        error = None
+        try:
+            with self.limits.setdefault(request['provider'], threading.BoundedSemaphore(1)):
+                for text, usage in AI_PROVIDERS[request['provider']](request):
+                    if text:
+                        generation.append(text)
+                    if usage:
+                        generation.usage = usage
+        except Exception as e:
+            error = e
+            LOG.error('ai_generation_failed', f"❌ AI generation failed ({request['provider']}/{request['model']}): {e}",
+                      provider=request['provider'], model=request['model'], error=str(e))
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+                if error is None:
+                    self.cache[key] = (time.time() + self.ttl, {
+                        'provider': request['provider'],
+                        'model': request['model'],
+                        'content': ''.join(generation.chunks),
+                        'usage': generation.usage,
+                        'finishReason': 'stop'
+                    })
+                    self.cache.move_to_end(key)
+                    while len(self.cache) > self.cache_size:
+                        self.cache.popitem(last=False)
+            generation.finish(error)
+
+    def status(self):
+        with self.lock:
+            return {
+                'cacheSize': len(self.cache),
+                'cacheLimit': self.cache_size,
+                'inFlight': len(self.in_flight),
+                'concurrency': AI_PROVIDER_CONCURRENCY
+            }
+
+
+AI_PROXY = AIProxy()
+
+
+class Route:
+    """A registered endpoint: method, path pattern, handler and body parsing mode"""
+
+    PARAM_PATTERN = re.compile(r'<(?:(path):)?([A-Za-z_][A-Za-z0-9_]*)>')
+
+    def __init__(self, method, pattern, handler, body=None):
+        self.method = method
+        self.pattern = pattern
+        self.handler = handler
+        self.body = body
+        self.regex = None
+        if self.PARAM_PATTERN.search(pattern):
+            regex, position = '', 0
+            for match in self.PARAM_PATTERN.finditer(pattern):
+                regex += re.escape(pattern[position:match.start()])
+                regex += f'(?P<{match.group(2)}>.+)' if match.group(1) else f'(?P<{match.group(2)}>[^/]+)'
+                position = match.end()
+            regex += re.escape(pattern[position:])
+            self.regex = re.compile(regex + '$')
+
+
+class Router:
+    """Routing table keyed by method, compiled once at registration time.
+
+    Literal paths resolve with a single dict lookup; patterned paths
+    (``/preview/<path:filename>``, ``/api/jobs/<job_id>``) are tried in
+    registration order only when no literal route matches.
+    """
+
+    def __init__(self):
+        self.literal = {}    # (method, path) -> Route
+        self.patterned = {}  # method -> [Route]
+
+    def add(self, method, pattern, handler, body=None):
+        route = Route(method, pattern, handler, body)
+        if route.regex is None:
+            self.literal[(method, pattern)] = route
         else:
-            self.send_error(404, "Not Found")
+            self.patterned.setdefault(method, []).append(route)
+        return route
+
+    def route(self, method, pattern, body=None):
+        """Decorator registering a handler method for ``method`` and ``pattern``"""
+        def register(handler):
+            self.add(method, pattern, handler, body)
+            return handler
+        return register
+
+    def get(self, pattern):
+        return self.route('GET', pattern)
+
+    def post(self, pattern, body='json'):
+        return self.route('POST', pattern, body)
+
+    def match(self, method, path):
+        """Return ``(route, path_params)`` for a request, or ``(None, None)``"""
+        route = self.literal.get((method, path))
+        if route is not None:
+            return route, {}
+        for route in self.patterned.get(method, ()):
+            match = route.regex.match(path)
+            if match:
+                return route, match.groupdict()
+        return None, None
+
+
+ROUTES = Router()
+
+
+class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def setup(self):
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+
+    def send_response(self, code, message=None):
+        self.response_status = code
+        super().send_response(code, message)
+
+    def dispatch(self, fallback):
+        """Route the request through ROUTES, recording metrics and an access record"""
+        METRICS.request_started()
+        started = time.perf_counter()
+        self.response_status = None
+        bytes_out_before = self.wfile.bytes_written
+        parsed = urllib.parse.urlsplit(self.path)
+        route, self.path_params = ROUTES.match(self.command, parsed.path)
+        if route is not None:
+            route_label = route.pattern
+        elif self.command in ('GET', 'HEAD'):
+            route_label = 'static'
+        else:
+            route_label = 'unmatched'
+        self.content_length = self.parse_content_length()
+        try:
+            if self.content_length is None:
+                self.send_error(400, "Invalid Content-Length")
+            elif route is None:
+                fallback()
+            elif self.parse_request_data(route, parsed.query):
+                route.handler(self)
+        finally:
+            duration = time.perf_counter() - started
+            bytes_in = self.content_length or 0
+            bytes_out = self.wfile.bytes_written - bytes_out_before
+            if route_label == 'static' and self.command == 'GET':
+                METRICS.record_cache('http-static', self.response_status == 304)
+            METRICS.request_finished(
+                self.command, route_label, self.response_status or 0, duration, bytes_in, bytes_out
+            )
+            LOG.info(
+                'access',
+                method=self.command,
+                path=self.path,
+                route=route_label,
+                status=self.response_status or 0,
+                duration_ms=round(duration * 1000, 3),
+                bytes_in=bytes_in,
+                bytes_out=bytes_out,
+                client=self.client_address[0]
+            )
+
+    def parse_content_length(self):
+        """Return the request's Content-Length, 0 when absent or None when malformed"""
+        value = self.headers.get('Content-Length')
+        if value is None or not value.strip():
+            return 0
+        try:
+            length = int(value)
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def parse_request_data(self, route, query_string):
+        """Parse the query string and request body once, before the handler runs"""
+        self.query = {key: values[0] for key, values in urllib.parse.parse_qs(query_string).items()}
+        self.raw_body = b''
+        self.json_body = None
+
+        if route.body and self.content_length > 0:
+            self.raw_body = self.rfile.read(self.content_length)
+            if route.body == 'form' and self.headers.get_content_type() == 'application/x-www-form-urlencoded':
+                # Form posts land in json_body too, so handlers read one dict either way
+                try:
+                    form = urllib.parse.parse_qs(self.raw_body.decode('utf-8'))
+                except UnicodeDecodeError:
+                    self.send_error(400, "Invalid form data")
+                    return False
+                self.json_body = {key: values[0] for key, values in form.items()}
+            elif route.body in ('json', 'form'):
+                try:
+                    self.json_body = json.loads(self.raw_body.decode('utf-8'))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    self.send_error(400, "Invalid JSON")
+                    return False
+        return True
+
+    def log_request(self, code='-', size='-'):
+        # Access records are emitted by dispatch once the response is complete
+        pass
+
+    def log_error(self, format, *args):
+        LOG.warning('http_error', client=self.client_address[0], detail=format % args)
+
+    def log_message(self, format, *args):
+        LOG.debug('http_message', client=self.client_address[0], detail=format % args)
+
+    def do_GET(self):
+        self.dispatch(super().do_GET)
+
+    def do_HEAD(self):
+        self.dispatch(super().do_HEAD)
+
+    def do_POST(self):
+        self.dispatch(lambda: self.send_error(404, "Not Found"))
     
-    def handle_articles_list(self):
-        """Get list of all articles with metadata"""
+    @ROUTES.get('/metrics')
+    def handle_metrics(self):
+        """Expose request metrics in Prometheus text exposition format"""
+        body = METRICS.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    @ROUTES.get('/api/jobs')
+    def handle_list_jobs(self):
+        """List recent jobs, newest first"""
+        self.send_json_response({'jobs': JOBS.recent()})
+
+    @ROUTES.get('/api/jobs/<job_id>')
+    def handle_job_status(self):
+        """Return the status, result and progress log of one job"""
+        job = JOBS.get(self.path_params['job_id'])
+        if job is None:
+            self.send_json_response({'error': 'Job not found'}, status_code=404)
+            return
+        self.send_json_response(job.to_dict())
+
+    @ROUTES.get('/api/jobs/<job_id>/events')
+    def handle_job_events(self):
+        """Stream a job's progress as server-sent events until it finishes"""
+        job = JOBS.get(self.path_params['job_id'])
+        if job is None:
+            self.send_json_response({'error': 'Job not found'}, status_code=404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        try:
+            for event, data in job.follow():
+                if event == 'keepalive':
+                    self.wfile.write(b': keepalive\n\n')
+                else:
+                    self.wfile.write(f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            LOG.debug('job_events_disconnected', job_id=job.id)
+
+    @ROUTES.get('/api/link-report')
+    def handle_link_report(self):
+        """Return the latest broken-link and orphan report (?refresh=1 re-checks now)"""
+        try:
+            report = LINK_REPORT
+            if report is None or self.query.get('refresh'):
+                report = update_link_report()
+            self.send_json_response(report)
+        except Exception as e:
+            LOG.error('link_report_failed', f"❌ Error checking links: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.get('/api/dependencies')
+    def handle_dependencies(self):
+        """Show the output dependency graph, or the outputs a given path would rebuild"""
+        path = self.query.get('path')
+        if path:
+            targets = DEPENDENCIES.affected([path.lstrip('/')])
+            self.send_json_response({
+                'path': path,
+                'rebuilds': targets,
+                'outputs': [output for name in targets for output in DEPENDENCIES.targets[name]['produces']]
+            })
+        else:
+            self.send_json_response({'targets': DEPENDENCIES.describe(), 'scheduler': REBUILDS.status()})
+
+    @ROUTES.post('/api/ai/generate')
+    def handle_ai_generate(self):
+        """Generate a completion through the coalescing, caching AI proxy"""
         try:
-            articles = []
-            articles_dir = Path('articles')
+            data = self.json_body or {}
+            provider = data.get('provider', 'ollama')
+            if provider not in AI_PROVIDERS:
+                self.send_error(400, f"Unknown AI provider: {provider}")
+                return
+            if not data.get('prompt') or not data.get('model'):
+                self.send_error(400, "Model and prompt are required")
+                return
+            endpoint = resolve_ai_endpoint(provider, data.get('endpoint'))
+            if endpoint is None:
+                self.send_error(403, "AI endpoint is not allowed; add it to BUILDLY_AI_ENDPOINTS")
+                return
             
-            if articles_dir.exists():
-                for html_file in articles_dir.glob('*.html'):
-                    try:
-                        with open(html_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        # Extract metadata from HTML
-                        title = self.extract_html_title(content)
-                        description = self.extract_html_meta(content, 'description')
-                        keywords = self.extract_html_meta(content, 'keywords')
-                        category = self.categorize_article(title, content, keywords)
-                        
-                        articles.append({
-                            'filename': f'articles/{html_file.name}',
-                            'title': title or html_file.stem.replace('-', ' ').title(),
-                            'description': description or 'No description available',
-                            'keywords': keywords or '',
-                            'category': category
-                        })
-                    except Exception as e:
-                        print(f"❌ Error processing {html_file}: {e}")
-                        continue
+            request = {
+                'provider': provider,
+                'model': data['model'],
+                'prompt': data['prompt'],
+                'temperature': float(data.get('temperature', 0.7)),
+                'maxTokens': int(data.get('maxTokens', 1000)),
+                'endpoint': endpoint,
+                'apiKey': data.get('apiKey') or os.environ.get(f'BUILDLY_{provider.upper()}_API_KEY')
+            }
+            outcome, value = AI_PROXY.lookup(request)
+            LOG.info('ai_request', provider=provider, model=request['model'], outcome=outcome,
+                     prompt_chars=len(request['prompt']))
             
-            # Sort articles by title
-            articles.sort(key=lambda x: x['title'])
+            if data.get('stream'):
+                self.stream_ai_response(outcome, value)
+                return
             
-            self.send_json_response({'articles': articles})
+            if outcome == 'cached':
+                result = dict(value)
+            else:
+                content = value.content()
+                result = {
+                    'provider': provider,
+                    'model': request['model'],
+                    'content': content,
+                    'usage': value.usage,
+                    'finishReason': 'stop'
+                }
+            result['source'] = outcome
+            self.send_json_response(result)
             
         except Exception as e:
-            print(f"❌ Error loading articles: {e}")
+            LOG.error('ai_generate_failed', f"❌ Error generating AI content: {e}", error=str(e))
+            self.send_error(502, f"AI provider error: {str(e)}")
+    
+    def stream_ai_response(self, outcome, value):
+        """Stream a completion as newline-delimited JSON chunks"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        
+        if outcome == 'cached':
+            chunks = [value['content']]
+        else:
+            chunks = value.stream()
+        try:
+            for chunk in chunks:
+                self.wfile.write(json.dumps({'content': chunk, 'done': False}).encode('utf-8') + b'\n')
+                self.wfile.flush()
+            self.wfile.write(json.dumps({'content': '', 'done': True, 'source': outcome}).encode('utf-8') + b'\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; the shared generation keeps running for other subscribers
+            pass
+        except Exception as e:
+            self.wfile.write(json.dumps({'error': str(e), 'done': True}).encode('utf-8') + b'\n')
+    
+    @ROUTES.get('/api/ai/status')
+    def handle_ai_status(self):
+        """Report AI proxy cache and queue state"""
+        self.send_json_response(AI_PROXY.status())
+    
+    @ROUTES.get('/api/articles-list')
+    def handle_articles_list(self):
+        """One page of articles, filtered by category, keyword, prefix and date (see article_facets)"""
+        try:
+            self.send_json_response(ARTICLE_FACETS.search(self.query))
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 400)
+        except Exception as e:
+            LOG.error('articles_list_failed', f"❌ Error loading articles: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.get('/api/read-file')
     def handle_read_file(self):
         """Read file content for editing"""
         try:
-            # Parse query parameters
-            from urllib.parse import parse_qs, urlparse
-            parsed = urlparse(self.path)
-            params = parse_qs(parsed.query)
-            
-            file_path = params.get('file', [None])[0]
+            file_path = self.query.get('file')
             if not file_path:
                 self.send_error(400, "Missing file parameter")
                 return
@@ -116,23 +1336,20 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 self.wfile.write(content.encode('utf-8'))
-                print(f"📖 File read: {file_path} ({len(content)} chars)")
+                LOG.info('file_read', f"📖 File read: {file_path} ({len(content)} chars)", path=file_path, chars=len(content))
             else:
                 self.send_error(404, f"File not found: {file_path}")
                 
         except Exception as e:
-            print(f"❌ Error reading file: {e}")
+            LOG.error('file_read_failed', f"❌ Error reading file: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.get('/preview/<path:filename>')
     def handle_preview(self):
         """Handle preview requests with corrected asset paths"""
         try:
             # Extract the actual file path from /preview/filename.html
-            preview_path = self.path[9:]  # Remove '/preview/' prefix
-            
-            # Remove query parameters if they exist
-            if '?' in preview_path:
-                preview_path = preview_path.split('?')[0]
+            preview_path = self.path_params['filename']
             
             if not os.path.exists(preview_path):
                 self.send_error(404, f"Preview file not found: {preview_path}")
@@ -153,18 +1370,26 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(content.encode('utf-8'))
             
-            print(f"🔍 Preview served: {preview_path}")
+            LOG.info('preview_served', f"🔍 Preview served: {preview_path}", path=preview_path)
             
         except Exception as e:
-            print(f"❌ Error serving preview: {e}")
+            LOG.error('preview_failed', f"❌ Error serving preview: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.get('/api/page-types')
+    def handle_page_types(self):
+        """List the page types new pages can be created from"""
+        try:
+            self.send_json_response({'pageTypes': PAGE_TEMPLATES.page_types()})
+        except Exception as e:
+            LOG.error('page_types_failed', f"❌ Error loading page types: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+    
+    @ROUTES.post('/api/create-new-page')
     def handle_create_new_page(self):
         """Create a new page from template based on page type"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self.json_body or {}
             
             title = data.get('title', '')
             filename = data.get('filename', '')
@@ -187,31 +1412,51 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 }, status_code=409)
                 return
             
-            # Generate content based on page type
-            new_content = self.generate_page_template(title, filename, page_type)
-            
-            # Create the new file
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
+            job, deduplicated = JOBS.submit(
+                'create-new-page',
+                {'title': title, 'filename': filename, 'pageType': page_type},
+                lambda job: self.create_new_page(job, title, filename, page_type)
+            )
             self.send_json_response({
                 'success': True, 
-                'message': f'Page {filename} created successfully',
+                'message': f'Page {filename} creation queued',
                 'filename': filename,
-                'pageType': page_type
-            })
-            print(f"📄 New {page_type} page created: {filename}")
+                'pageType': page_type,
+                'jobId': job.id,
+                'status': job.status,
+                'deduplicated': deduplicated,
+                'statusUrl': f'/api/jobs/{job.id}',
+                'eventsUrl': f'/api/jobs/{job.id}/events'
+            }, status_code=202)
             
         except Exception as e:
-            print(f"❌ Error creating new page: {e}")
+            LOG.error('page_create_failed', f"❌ Error creating new page: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    def create_new_page(self, job, title, filename, page_type):
+        """Job body: render the page template and write the new file"""
+        # Another job may have created the file since the request was accepted
+        if os.path.exists(filename):
+            raise FileExistsError(f'File {filename} already exists')
+        
+        # Generate content based on page type
+        new_content = PAGE_TEMPLATES.render(title, filename, page_type)
+        job.progress(f"Rendered {page_type} template", page_type=page_type)
+        
+        # Create the new file
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        job.progress(f"Wrote {filename}", path=filename)
+        
+        REBUILDS.schedule([filename])
+        LOG.info('page_created', f"📄 New {page_type} page created: {filename}", path=filename, page_type=page_type)
+        return {'filename': filename, 'pageType': page_type}
+    
+    @ROUTES.post('/api/create-preview')
     def handle_create_preview(self):
         """Create a temporary preview file for live preview"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self.json_body or {}
             
             content = data.get('content', '')
             filename = data.get('filename', 'preview.html')
@@ -244,12 +1489,13 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 'message': 'Preview file created'
             })
             
-            print(f"🔍 Preview file created: {preview_filename}")
+            LOG.info('preview_created', f"🔍 Preview file created: {preview_filename}", path=preview_filename)
             
         except Exception as e:
-            print(f"❌ Error creating preview: {e}")
+            LOG.error('preview_create_failed', f"❌ Error creating preview: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.get('/api/list-html-files')
     def handle_list_html_files(self):
         """Get list of all HTML files in the website directory"""
         try:
@@ -297,369 +1543,32 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 'count': len(html_files)
             })
             
-            print(f"📁 Listed {len(html_files)} HTML files")
+            LOG.debug('html_files_listed', f"📁 Listed {len(html_files)} HTML files", count=len(html_files))
             
         except Exception as e:
-            print(f"❌ Error listing HTML files: {e}")
+            LOG.error('html_files_list_failed', f"❌ Error listing HTML files: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
-    def generate_page_template(self, title, filename, page_type):
-        """Generate HTML content based on page type"""
-        page_url = f"https://www.buildly.io/{filename}"
-        
-        # Common head section
-        head_section = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <!-- Load common elements -->
-    <script src="/js/buildly-head.js"></script>
-    
-    <!-- Page-specific customization -->
-    <title>{title} - Buildly</title>
-    <meta name="description" content="{self.get_page_description(title, page_type)}">
-    <meta name="keywords" content="{self.get_page_keywords(title, page_type)}">
-    <link rel="canonical" href="{page_url}">
-    
-    <!-- Open Graph tags -->
-    <meta property="og:type" content="website">
-    <meta property="og:url" content="{page_url}">
-    <meta property="og:title" content="{title} - Buildly">
-    <meta property="og:description" content="{self.get_page_description(title, page_type)}">
-    <meta property="og:image" content="https://www.buildly.io/media/buildly-logo.svg">
-</head>
-<body>
-    <!-- Navigation -->
-    <nav class="bg-white shadow-lg">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between h-16">
-                <div class="flex items-center">
-                    <a href="/">
-                        <img src="/media/buildly-logo.svg" alt="Buildly" class="h-8 w-auto">
-                    </a>
-                </div>
-                <div class="hidden md:flex items-center space-x-8">
-                    <a href="/" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Home</a>
-                    <a href="/labs.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Labs</a>
-                    <a href="/use-cases.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Use Cases</a>
-                    <a href="/pricing.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Pricing</a>
-                    <a href="https://labs.buildly.io" class="bg-buildly-primary text-white px-4 py-2 rounded-md hover:bg-buildly-secondary">Try for Free</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Main Content -->'''
-
-        # Page-specific content based on type
-        main_content = self.get_page_content(title, page_type)
-        
-        # Common footer
-        footer_section = '''
-    <!-- Footer -->
-    <footer class="bg-buildly-dark text-white">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-            <div class="text-center">
-                <img src="/media/buildly-logo.svg" alt="Buildly" class="h-8 w-auto mx-auto mb-4 brightness-0 invert">
-                <p>&copy; 2024 Buildly. All rights reserved.</p>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>'''
-
-        return head_section + main_content + footer_section
-    
-    def get_page_description(self, title, page_type):
-        """Generate appropriate description based on page type"""
-        descriptions = {
-            'landing': f"{title} - AI-powered software development platform by Buildly. Accelerate your development with intelligent automation and team collaboration tools.",
-            'service': f"{title} - Advanced development features and tools by Buildly. Discover how AI-powered solutions can transform your software development process.",
-            'company': f"{title} - Learn more about Buildly, our mission, and how we're revolutionizing software development with AI-powered tools and collaborative platforms.",
-            'pricing': f"{title} - Transparent pricing for Buildly's AI-powered development platform. Choose the plan that fits your team's needs with flexible options.",
-            'documentation': f"{title} - Comprehensive guides and documentation for Buildly's AI development platform. Learn how to maximize your productivity.",
-            'basic': f"{title} - Buildly AI-powered software development platform information and resources."
-        }
-        return descriptions.get(page_type, descriptions['basic'])
-    
-    def get_page_keywords(self, title, page_type):
-        """Generate appropriate keywords based on page type"""
-        base_keywords = "buildly, AI development, software development, team collaboration"
-        type_keywords = {
-            'landing': "AI platform, development tools, productivity",
-            'service': "development features, AI tools, automation",
-            'company': "about buildly, team, company info",
-            'pricing': "pricing plans, subscription, development costs",
-            'documentation': "guides, tutorials, documentation, help",
-            'basic': "information, resources"
-        }
-        return f"{base_keywords}, {type_keywords.get(page_type, '')}, {title.lower()}"
-    
-    def get_page_content(self, title, page_type):
-        """Generate page-specific content based on type"""
-        
-        if page_type == 'landing':
-            return f'''
-    <main>
-        <!-- Hero Section -->
-        <section class="bg-gradient-to-r from-buildly-primary to-buildly-secondary text-white py-20">
-            <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
-                <h1 class="text-4xl md:text-6xl font-bold mb-6">{title}</h1>
-                <p class="text-xl md:text-2xl mb-8 max-w-3xl mx-auto">Accelerate your development with AI-powered tools and collaborative workflows</p>
-                <div class="flex flex-col sm:flex-row gap-4 justify-center">
-                    <a href="https://labs.buildly.io" class="bg-buildly-accent text-white px-8 py-3 rounded-lg font-semibold hover:bg-orange-600 transition-colors">Get Started Free</a>
-                    <a href="#learn-more" class="border border-white text-white px-8 py-3 rounded-lg font-semibold hover:bg-white hover:text-buildly-primary transition-colors">Learn More</a>
-                </div>
-            </div>
-        </section>
-
-        <!-- Content Section -->
-        <section class="py-20 bg-white">
-            <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-                <div class="text-center mb-16">
-                    <h2 class="text-3xl md:text-4xl font-bold text-buildly-dark mb-4">Why Choose {title}?</h2>
-                    <p class="text-xl text-gray-600">Add your compelling value propositions here</p>
-                </div>
-                
-                <!-- Feature Grid -->
-                <div class="grid md:grid-cols-3 gap-8">
-                    <div class="text-center">
-                        <div class="bg-buildly-light rounded-full w-16 h-16 flex items-center justify-center mx-auto mb-4">
-                            <span class="text-2xl">🚀</span>
-                        </div>
-                        <h3 class="text-xl font-semibold mb-2">Fast Development</h3>
-                        <p class="text-gray-600">Accelerate your development process with AI-powered tools</p>
-                    </div>
-                    
-                    <div class="text-center">
-                        <div class="bg-buildly-light rounded-full w-16 h-16 flex items-center justify-center mx-auto mb-4">
-                            <span class="text-2xl">🤝</span>
-                        </div>
-                        <h3 class="text-xl font-semibold mb-2">Team Collaboration</h3>
-                        <p class="text-gray-600">Seamless collaboration tools for distributed teams</p>
-                    </div>
-                    
-                    <div class="text-center">
-                        <div class="bg-buildly-light rounded-full w-16 h-16 flex items-center justify-center mx-auto mb-4">
-                            <span class="text-2xl">⚡</span>
-                        </div>
-                        <h3 class="text-xl font-semibold mb-2">AI-Powered</h3>
-                        <p class="text-gray-600">Intelligent automation and code assistance</p>
-                    </div>
-                </div>
-            </div>
-        </section>
-    </main>'''
-        
-        elif page_type == 'service':
-            return f'''
-    <main class="py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <!-- Page Header -->
-            <div class="text-center mb-16">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">{title}</h1>
-                <p class="text-xl text-gray-600 max-w-3xl mx-auto">Comprehensive service description and benefits</p>
-            </div>
-
-            <!-- Service Overview -->
-            <div class="bg-white rounded-lg shadow-lg p-8 mb-12">
-                <h2 class="text-2xl font-bold text-buildly-dark mb-4">Service Overview</h2>
-                <p class="text-gray-600 mb-6">Detailed description of what this service provides and how it benefits users.</p>
-                
-                <div class="grid md:grid-cols-2 gap-8">
-                    <div>
-                        <h3 class="text-lg font-semibold mb-3">Key Features</h3>
-                        <ul class="space-y-2 text-gray-600">
-                            <li class="flex items-center"><span class="text-green-500 mr-2">✓</span> Feature one</li>
-                            <li class="flex items-center"><span class="text-green-500 mr-2">✓</span> Feature two</li>
-                            <li class="flex items-center"><span class="text-green-500 mr-2">✓</span> Feature three</li>
-                        </ul>
-                    </div>
-                    <div>
-                        <h3 class="text-lg font-semibold mb-3">Benefits</h3>
-                        <ul class="space-y-2 text-gray-600">
-                            <li class="flex items-center"><span class="text-blue-500 mr-2">→</span> Benefit one</li>
-                            <li class="flex items-center"><span class="text-blue-500 mr-2">→</span> Benefit two</li>
-                            <li class="flex items-center"><span class="text-blue-500 mr-2">→</span> Benefit three</li>
-                        </ul>
-                    </div>
-                </div>
-            </div>
-
-            <!-- CTA Section -->
-            <div class="text-center">
-                <a href="https://labs.buildly.io" class="bg-buildly-primary text-white px-8 py-3 rounded-lg font-semibold hover:bg-buildly-secondary transition-colors">Try {title}</a>
-            </div>
-        </div>
-    </main>'''
-        
-        elif page_type == 'company':
-            return f'''
-    <main class="py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <!-- Page Header -->
-            <div class="text-center mb-16">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">{title}</h1>
-                <p class="text-xl text-gray-600 max-w-3xl mx-auto">Learn more about our company, mission, and team</p>
-            </div>
-
-            <!-- Company Info -->
-            <div class="bg-white rounded-lg shadow-lg p-8 mb-12">
-                <div class="grid md:grid-cols-2 gap-12 items-center">
-                    <div>
-                        <h2 class="text-2xl font-bold text-buildly-dark mb-4">Our Mission</h2>
-                        <p class="text-gray-600 mb-6">We're revolutionizing software development by providing AI-powered tools that enhance productivity and foster collaboration.</p>
-                        <p class="text-gray-600">Add more details about your company mission, values, and what makes you unique in the market.</p>
-                    </div>
-                    <div class="bg-gray-100 rounded-lg p-8 text-center">
-                        <p class="text-4xl mb-4">🏢</p>
-                        <p class="text-gray-600">Company image or additional content</p>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Contact Info -->
-            <div class="text-center">
-                <h2 class="text-2xl font-bold text-buildly-dark mb-6">Get in Touch</h2>
-                <p class="text-gray-600 mb-8">Ready to transform your development process?</p>
-                <a href="https://labs.buildly.io" class="bg-buildly-primary text-white px-8 py-3 rounded-lg font-semibold hover:bg-buildly-secondary transition-colors">Contact Us</a>
-            </div>
-        </div>
-    </main>'''
-        
-        elif page_type == 'pricing':
-            return f'''
-    <main class="py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <!-- Page Header -->
-            <div class="text-center mb-16">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">{title}</h1>
-                <p class="text-xl text-gray-600 max-w-3xl mx-auto">Choose the plan that fits your team's needs</p>
-            </div>
-
-            <!-- Pricing Grid -->
-            <div class="grid md:grid-cols-3 gap-8">
-                <!-- Free Plan -->
-                <div class="bg-white rounded-lg shadow-lg p-8 text-center">
-                    <h3 class="text-xl font-bold text-buildly-dark mb-4">Free</h3>
-                    <div class="text-4xl font-bold text-buildly-primary mb-4">$0</div>
-                    <p class="text-gray-600 mb-6">Perfect for getting started</p>
-                    <ul class="space-y-2 text-gray-600 mb-8">
-                        <li>Basic features</li>
-                        <li>Limited projects</li>
-                        <li>Community support</li>
-                    </ul>
-                    <a href="https://labs.buildly.io" class="block bg-gray-200 text-gray-800 px-6 py-2 rounded-lg font-semibold hover:bg-gray-300 transition-colors">Get Started</a>
-                </div>
-
-                <!-- Pro Plan -->
-                <div class="bg-white rounded-lg shadow-lg p-8 text-center border-2 border-buildly-primary">
-                    <h3 class="text-xl font-bold text-buildly-dark mb-4">Pro</h3>
-                    <div class="text-4xl font-bold text-buildly-primary mb-4">$29</div>
-                    <p class="text-gray-600 mb-6">For growing teams</p>
-                    <ul class="space-y-2 text-gray-600 mb-8">
-                        <li>All basic features</li>
-                        <li>Unlimited projects</li>
-                        <li>Priority support</li>
-                        <li>Advanced AI tools</li>
-                    </ul>
-                    <a href="https://labs.buildly.io" class="block bg-buildly-primary text-white px-6 py-2 rounded-lg font-semibold hover:bg-buildly-secondary transition-colors">Start Free Trial</a>
-                </div>
-
-                <!-- Enterprise Plan -->
-                <div class="bg-white rounded-lg shadow-lg p-8 text-center">
-                    <h3 class="text-xl font-bold text-buildly-dark mb-4">Enterprise</h3>
-                    <div class="text-4xl font-bold text-buildly-primary mb-4">Custom</div>
-                    <p class="text-gray-600 mb-6">For large organizations</p>
-                    <ul class="space-y-2 text-gray-600 mb-8">
-                        <li>Everything in Pro</li>
-                        <li>Custom integrations</li>
-                        <li>Dedicated support</li>
-                        <li>SLA guarantees</li>
-                    </ul>
-                    <a href="https://labs.buildly.io" class="block bg-buildly-accent text-white px-6 py-2 rounded-lg font-semibold hover:bg-orange-600 transition-colors">Contact Sales</a>
-                </div>
-            </div>
-        </div>
-    </main>'''
-        
-        elif page_type == 'documentation':
-            return f'''
-    <main class="py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <!-- Page Header -->
-            <div class="text-center mb-16">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">{title}</h1>
-                <p class="text-xl text-gray-600 max-w-3xl mx-auto">Comprehensive guides and documentation</p>
-            </div>
-
-            <div class="grid lg:grid-cols-4 gap-8">
-                <!-- Sidebar Navigation -->
-                <div class="lg:col-span-1">
-                    <div class="bg-white rounded-lg shadow-lg p-6">
-                        <h3 class="font-semibold mb-4">Documentation</h3>
-                        <nav class="space-y-2">
-                            <a href="#getting-started" class="block text-buildly-primary hover:underline">Getting Started</a>
-                            <a href="#guides" class="block text-gray-600 hover:text-buildly-primary">User Guides</a>
-                            <a href="#api" class="block text-gray-600 hover:text-buildly-primary">API Reference</a>
-                            <a href="#examples" class="block text-gray-600 hover:text-buildly-primary">Examples</a>
-                        </nav>
-                    </div>
-                </div>
-
-                <!-- Main Content -->
-                <div class="lg:col-span-3">
-                    <div class="bg-white rounded-lg shadow-lg p-8">
-                        <h2 class="text-2xl font-bold text-buildly-dark mb-6">Getting Started</h2>
-                        <div class="prose max-w-none">
-                            <p class="text-gray-600 mb-4">Welcome to the {title}. This guide will help you get up and running quickly.</p>
-                            
-                            <h3 class="text-lg font-semibold mb-3">Quick Setup</h3>
-                            <ol class="list-decimal list-inside space-y-2 text-gray-600 mb-6">
-                                <li>Step one of the setup process</li>
-                                <li>Step two of the setup process</li>
-                                <li>Step three of the setup process</li>
-                            </ol>
-
-                            <div class="bg-gray-50 rounded-lg p-4 mb-6">
-                                <h4 class="font-semibold mb-2">💡 Pro Tip</h4>
-                                <p class="text-gray-600">Add helpful tips and best practices here.</p>
-                            </div>
-
-                            <h3 class="text-lg font-semibold mb-3">Next Steps</h3>
-                            <p class="text-gray-600">Continue with the advanced guides to unlock more features.</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>'''
-        
-        else:  # basic page
-            return f'''
-    <main class="py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="text-center mb-16">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">{title}</h1>
-                <p class="text-xl text-gray-600 max-w-3xl mx-auto">Welcome to your new page!</p>
-            </div>
-            
-            <div class="bg-white rounded-lg shadow-lg p-8">
-                <h2 class="text-2xl font-bold text-buildly-dark mb-4">Page Content</h2>
-                <p class="text-gray-600 mb-6">This is your new page. Start editing to add your content here.</p>
-                
-                <div class="bg-gray-50 rounded-lg p-6">
-                    <p class="text-gray-600">Add your content, images, and other elements to make this page unique and valuable for your visitors.</p>
-                </div>
-            </div>
-        </div>
-    </main>'''
-    
+    @ROUTES.post('/api/render-markdown')
+    def handle_render_markdown(self):
+        """Compile a Markdown article body to HTML for the editor preview"""
+        try:
+            data = self.json_body or {}
+            markdown = data.get('markdown', '')
+            if markdown.startswith('---'):
+                markdown = article_store.parse_front_matter(markdown)[1]
+            self.send_json_response({'html': MARKDOWN_PREVIEW.render(markdown), **MARKDOWN_PREVIEW.stats()})
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 400)
+        except Exception as e:
+            LOG.error('markdown_render_failed', f"❌ Error rendering Markdown: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/set-featured-article')
     def handle_set_featured_article(self):
         """Set the featured article"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self.json_body or {}
             
             # Store featured article data (in a real app, this would go to a database)
             # For now, we'll store it in a simple JSON file
@@ -672,346 +1581,52 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
             
             with open('.featured-article.json', 'w', encoding='utf-8') as f:
                 json.dump(featured_data, f, indent=2)
+            REBUILDS.schedule([articles_page.FEATURED_ARTICLE_FILE])
             
             self.send_json_response({'success': True, 'message': 'Featured article updated'})
-            print(f"⭐ Featured article set: {featured_data['title']}")
+            LOG.info('featured_article_set', f"⭐ Featured article set: {featured_data['title']}", title=featured_data['title'])
             
         except Exception as e:
-            print(f"❌ Error setting featured article: {e}")
+            LOG.error('featured_article_failed', f"❌ Error setting featured article: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.post('/api/regenerate-articles-page')
     def handle_regenerate_articles_page(self):
-        """Regenerate the articles.html page with current articles and featured article"""
+        """Queue a regeneration of articles.html with current articles and featured article"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
+            data = self.json_body or {}
             featured_article = data.get('featuredArticle', {})
-            
-            # Get all articles
-            articles = []
-            articles_dir = Path('articles')
-            
-            if articles_dir.exists():
-                for html_file in articles_dir.glob('*.html'):
-                    try:
-                        with open(html_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        title = self.extract_html_title(content)
-                        description = self.extract_html_meta(content, 'description')
-                        keywords = self.extract_html_meta(content, 'keywords')
-                        category = self.categorize_article(title, content, keywords)
-                        
-                        articles.append({
-                            'filename': f'articles/{html_file.name}',
-                            'title': title or html_file.stem.replace('-', ' ').title(),
-                            'description': description or 'No description available',
-                            'keywords': keywords or '',
-                            'category': category
-                        })
-                    except Exception as e:
-                        print(f"❌ Error processing {html_file}: {e}")
-                        continue
-            
-            # Generate the new articles.html content
-            new_content = self.generate_articles_html(articles, featured_article)
-            
-            # Write the new articles.html
-            with open('articles.html', 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.send_json_response({'success': True, 'message': 'Articles page regenerated'})
-            print(f"🚀 Articles page regenerated with {len(articles)} articles")
+            job, deduplicated = JOBS.submit(
+                'regenerate-articles-page',
+                {'featuredArticle': featured_article},
+                lambda job: self.regenerate_articles_page(job, featured_article)
+            )
+            self.send_job_response(job, deduplicated, 'Articles page regeneration queued')
             
         except Exception as e:
-            print(f"❌ Error regenerating articles page: {e}")
+            LOG.error('articles_page_failed', f"❌ Error regenerating articles page: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
-    def extract_html_title(self, content):
-        """Extract title from HTML content"""
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
-        if title_match:
-            title = title_match.group(1).strip()
-            # Remove " - Buildly" suffix if present
-            return re.sub(r'\s*-\s*Buildly\s*$', '', title).strip()
+    def regenerate_articles_page(self, job, featured_article):
+        """Job body: rewrite articles.html, then the sitemap and feeds"""
+        ARTICLE_INDEX.refresh()
+        articles = ARTICLE_INDEX.all()
+        job.progress(f"Indexed {len(articles)} articles", count=len(articles))
         
-        # Fallback: look for h1
-        h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE | re.DOTALL)
-        if h1_match:
-            return re.sub(r'<[^>]+>', '', h1_match.group(1)).strip()
+        # Regenerate articles.html, keeping its header and footer
+        write_articles_page(articles, featured_article)
+        job.progress("Wrote articles.html", path='articles.html')
         
-        return None
-    
-    def extract_html_meta(self, content, meta_name):
-        """Extract meta tag content from HTML"""
-        pattern = rf'<meta[^>]*name=["\']({meta_name})["\'][^>]*content=["\']([^"\']*)["\']'
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            return match.group(2).strip()
+        update_sitemap(['articles.html'])
+        job.progress("Updated sitemap")
         
-        # Try the other way around (content first, then name)
-        pattern = rf'<meta[^>]*content=["\']([^"\']*)["\'][^>]*name=["\']({meta_name})["\']'
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+        feeds = build_feeds()
+        job.progress("Built feeds", **feeds)
         
-        return None
-    
-    def categorize_article(self, title, content, keywords):
-        """Categorize article based on title, content, and keywords"""
-        text_to_analyze = f"{title} {content} {keywords}".lower()
-        
-        # AI related keywords
-        if any(word in text_to_analyze for word in ['artificial intelligence', 'machine learning', 'ai-powered', 'ai ', ' ai', 'neural', 'automation', 'intelligent']):
-            return 'AI'
-        
-        # Product Management keywords
-        if any(word in text_to_analyze for word in ['product management', 'product manager', 'roadmap', 'feature', 'prioritization', 'lifecycle', 'mvp', 'product strategy']):
-            return 'Product Management'
-        
-        # Startup keywords
-        if any(word in text_to_analyze for word in ['startup', 'scaling', 'growth', 'founder', 'entrepreneur', 'venture', 'funding', 'market']):
-            return 'Startup Growth'
-        
-        # Default to Software Development
-        return 'Software Development'
-    
-    def generate_articles_html(self, articles, featured_article):
-        """Generate the complete articles.html content"""
-        # Group articles by category
-        categories = {
-            'Product Management': [],
-            'AI': [],
-            'Software Development': [],
-            'Startup Growth': []
-        }
-        
-        for article in articles:
-            category = article['category']
-            if category in categories:
-                categories[category].append(article)
-        
-        # Generate article cards HTML
-        def generate_article_card(article, is_new=False):
-            new_badge = '<span class="bg-buildly-accent text-white px-2 py-1 rounded text-xs">New!</span>' if is_new else ''
-            border_class = 'border-l-4 border-buildly-accent' if is_new else ''
-            
-            return f'''
-                    <div class="bg-white rounded-xl p-6 shadow-sm hover:shadow-lg transition-shadow {border_class}">
-                        <div class="flex items-center gap-2 mb-3">
-                            <span class="bg-buildly-primary text-white px-2 py-1 rounded text-xs">{article['category']}</span>
-                            {new_badge}
-                        </div>
-                        <h4 class="text-lg font-semibold mb-2">{article['title']}</h4>
-                        <p class="text-gray-600 text-sm mb-4">{article['description'][:120]}{'...' if len(article['description']) > 120 else ''}</p>
-                        <a href="{article['filename']}" class="text-buildly-primary font-medium hover:text-buildly-secondary">Read More →</a>
-                    </div>'''
-        
-        # Generate category sections
-        pm_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Product Management'])])
-        ai_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['AI'])])
-        dev_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Software Development'])])
-        startup_articles = '\n'.join([generate_article_card(article, i < 2) for i, article in enumerate(categories['Startup Growth'])])
-        
-        # Read the current articles.html to get the header and footer
-        try:
-            with open('articles.html', 'r', encoding='utf-8') as f:
-                current_content = f.read()
-            
-            # Extract the header (up to "Articles Grid" section)
-            header_match = re.search(r'(.*?)<!-- Articles Grid -->', current_content, re.DOTALL)
-            header = header_match.group(1) if header_match else self.get_default_header()
-            
-            # Extract the footer (from the footer section onwards)
-            footer_match = re.search(r'(<!-- Footer -->.*)', current_content, re.DOTALL)
-            footer = footer_match.group(1) if footer_match else self.get_default_footer()
-            
-        except:
-            header = self.get_default_header()
-            footer = self.get_default_footer()
-        
-        # Update featured article in header if provided
-        if featured_article and featured_article.get('title'):
-            header = re.sub(
-                r'(<h2 class="text-3xl md:text-4xl font-bold mb-4">)(.*?)(</h2>)',
-                f'\\1{featured_article["title"]}\\3',
-                header
-            )
-            header = re.sub(
-                r'(<p class="text-lg opacity-90 mb-6">)(.*?)(</p>)',
-                f'\\1{featured_article["description"]}\\3',
-                header
-            )
-            header = re.sub(
-                r'(href=")(articles/[^"]*?)(")',
-                f'\\1{featured_article["link"]}\\3',
-                header
-            )
-        
-        # Combine everything
-        return f'''{header}
-    <!-- Articles Grid -->
-    <section class="py-16 bg-buildly-light">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="text-center mb-12">
-                <h2 class="text-3xl md:text-4xl font-bold text-buildly-dark mb-4">All Blog Posts</h2>
-                <p class="text-lg text-gray-600">Explore our comprehensive collection of insights and best practices</p>
-            </div>
-
-            <!-- Product Management Articles -->
-            <div class="mb-16">
-                <h3 class="text-2xl font-bold text-buildly-primary mb-8 flex items-center">
-                    <span class="w-8 h-8 bg-buildly-primary rounded-full flex items-center justify-center text-white text-sm mr-3">PM</span>
-                    Product Management
-                </h3>
-                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
-                    {pm_articles}
-                </div>
-            </div>
-
-            <!-- AI Articles -->
-            <div class="mb-16">
-                <h3 class="text-2xl font-bold text-buildly-accent mb-8 flex items-center">
-                    <span class="w-8 h-8 bg-buildly-accent rounded-full flex items-center justify-center text-white text-sm mr-3">AI</span>
-                    Artificial Intelligence
-                </h3>
-                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
-                    {ai_articles}
-                </div>
-            </div>
-
-            <!-- Software Development Articles -->
-            <div class="mb-16">
-                <h3 class="text-2xl font-bold text-buildly-secondary mb-8 flex items-center">
-                    <span class="w-8 h-8 bg-buildly-secondary rounded-full flex items-center justify-center text-white text-sm mr-3">DEV</span>
-                    Software Development
-                </h3>
-                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
-                    {dev_articles}
-                </div>
-            </div>
-
-            <!-- Startup Growth Articles -->
-            <div class="mb-16">
-                <h3 class="text-2xl font-bold text-gray-600 mb-8 flex items-center">
-                    <span class="w-8 h-8 bg-gray-600 rounded-full flex items-center justify-center text-white text-sm mr-3">📈</span>
-                    Startup Growth
-                </h3>
-                <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-6">
-                    {startup_articles}
-                </div>
-            </div>
-        </div>
-    </section>
-
-    {footer}'''
-    
-    def get_default_header(self):
-        """Return default header HTML"""
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <script src="/js/buildly-head.js"></script>
-    <title>AI Development Blog - Vibe Coding, Product Management & Software Innovation | Buildly</title>
-    <meta name="description" content="Expert insights on AI development, vibe coding methodologies, product management best practices, and software innovation. Latest trends in AI-powered development platforms.">
-    <meta name="keywords" content="AI development blog, vibe coding articles, product management insights, software development trends, AI innovation, development best practices, startup growth">
-    <link rel="canonical" href="https://www.buildly.io/articles.html">
-</head>
-<body class="font-sans">
-    <!-- Navigation -->
-    <nav class="bg-white shadow-lg fixed w-full z-50">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between items-center h-16">
-                <div class="flex items-center">
-                    <a href="index.html">
-                        <img src="media/buildly-logo.svg" alt="Buildly" class="h-12 w-auto" style="filter: brightness(0) saturate(100%) invert(21%) sepia(47%) saturate(1765%) hue-rotate(198deg) brightness(97%) contrast(93%);">
-                    </a>
-                </div>
-                <div class="block">
-                    <div class="ml-10 flex items-baseline space-x-4">
-                        <a href="index.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Home</a>
-                        <a href="https://labs.buildly.io" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Labs</a>
-                        <a href="use-cases.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Use Cases</a>
-                        <a href="pricing.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Pricing</a>
-                        <a href="https://docs.buildly.io/" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Docs</a>
-                        <a href="articles.html" class="text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Articles</a>
-                        <a href="team.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Team</a>
-                        <a href="https://labs.buildly.io" class="bg-buildly-primary text-white px-4 py-2 rounded-md text-sm font-medium hover:bg-buildly-secondary transition-colors">Try for Free</a>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Hero Section -->
-    <section class="pt-20 bg-gradient-to-br from-buildly-light to-white">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-16">
-            <div class="text-center">
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-4">
-                    Buildly Articles
-                </h1>
-                <p class="text-lg text-gray-600 mb-8 max-w-3xl mx-auto">
-                    From MVP to Market Leader: Navigate the Product Lifecycle with expert insights on AI, product management, and software development
-                </p>
-                <div class="flex flex-wrap justify-center gap-2 mb-8">
-                    <span class="bg-buildly-primary text-white px-4 py-2 rounded-full text-sm">Product Management</span>
-                    <span class="bg-buildly-accent text-white px-4 py-2 rounded-full text-sm">AI & Machine Learning</span>
-                    <span class="bg-buildly-secondary text-white px-4 py-2 rounded-full text-sm">Software Development</span>
-                    <span class="bg-gray-600 text-white px-4 py-2 rounded-full text-sm">Startup Growth</span>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Featured Article -->
-    <section class="py-16 bg-white">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="bg-gradient-to-r from-buildly-primary to-buildly-secondary rounded-2xl p-8 text-white mb-16">
-                <div class="max-w-4xl">
-                    <div class="flex items-center gap-4 mb-4">
-                        <span class="bg-buildly-accent px-3 py-1 rounded-full text-sm font-medium">Featured</span>
-                        <span class="text-sm opacity-90">Product Management • Featured Article</span>
-                    </div>
-                    <h2 class="text-3xl md:text-4xl font-bold mb-4">From MVP to Market Leader: Navigating the Product Lifecycle</h2>
-                    <p class="text-lg opacity-90 mb-6">This article examines every phase of the product lifecycle offering best practices to achieve market leadership and sustainable growth.</p>
-                    <a href="articles/product-lifecycle.html" class="inline-flex items-center bg-white text-buildly-primary px-6 py-3 rounded-lg font-semibold hover:bg-gray-100 transition-colors">
-                        Read More
-                        <svg class="w-4 h-4 ml-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5l7 7-7 7"></path>
-                        </svg>
-                    </a>
-                </div>
-            </div>
-        </div>
-    </section>
-'''
-    
-    def get_default_footer(self):
-        """Return default footer HTML"""
-        return '''    <!-- Footer -->
-    <footer class="bg-buildly-dark text-white py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="text-center">
-                <img src="media/buildly-logo.svg" alt="Buildly" class="h-12 w-auto mx-auto mb-8" style="filter: brightness(0) saturate(100%) invert(100%) sepia(0%) saturate(2%) hue-rotate(169deg) brightness(105%) contrast(101%);">
-                <p class="text-lg text-gray-300 mb-8">Building the future of software development with AI-powered tools</p>
-                <div class="flex flex-wrap justify-center gap-8 mb-8">
-                    <a href="https://labs.buildly.io" class="text-gray-300 hover:text-white transition-colors">Labs</a>
-                    <a href="use-cases.html" class="text-gray-300 hover:text-white transition-colors">Use Cases</a>
-                    <a href="pricing.html" class="text-gray-300 hover:text-white transition-colors">Pricing</a>
-                    <a href="https://docs.buildly.io/" class="text-gray-300 hover:text-white transition-colors">Documentation</a>
-                    <a href="team.html" class="text-gray-300 hover:text-white transition-colors">Team</a>
-                </div>
-                <div class="pt-8 border-t border-gray-700">
-                    <p class="text-gray-400">&copy; 2024 Buildly. All rights reserved.</p>
-                </div>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>'''
+        LOG.info('articles_page_regenerated', f"🚀 Articles page regenerated with {len(articles)} articles", count=len(articles))
+        return {'articles': len(articles)}
     
+    @ROUTES.get('/api/social-accounts')
     def handle_get_social_accounts(self):
         """Get saved social media accounts configuration"""
         try:
@@ -1043,15 +1658,14 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 self.send_json_response(default_accounts)
                 
         except Exception as e:
-            print(f"❌ Error loading social accounts: {e}")
+            LOG.error('social_accounts_load_failed', f"❌ Error loading social accounts: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
+    @ROUTES.post('/api/social-accounts')
     def handle_save_social_accounts(self):
         """Save social media accounts configuration"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            accounts = json.loads(post_data.decode('utf-8'))
+            accounts = self.json_body or {}
             
             # Validate the accounts structure
             required_platforms = ['linkedin', 'bluesky', 'mastodon']
@@ -1064,152 +1678,247 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 json.dump(accounts, f, indent=2)
             
             self.send_json_response({'success': True, 'message': 'Social media accounts saved'})
-            print(f"💾 Social media accounts configuration saved")
+            LOG.info('social_accounts_saved', "💾 Social media accounts configuration saved")
             
         except Exception as e:
-            print(f"❌ Error saving social accounts: {e}")
+            LOG.error('social_accounts_save_failed', f"❌ Error saving social accounts: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
 
-    def handle_get_navigation(self):
-        """Get current navigation configuration"""
+    @ROUTES.get('/api/social/queue')
+    def handle_social_queue(self):
+        """List queued share posts, optionally only those with ?status="""
+        try:
+            self.send_json_response(SOCIAL_QUEUE.status(self.query.get('status') or None))
+        except Exception as e:
+            LOG.error('social_queue_failed', f"❌ Error reading social queue: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/social/queue')
+    def handle_social_enqueue(self):
+        """Render and queue share posts for the given articles, or for articles not shared yet"""
+        try:
+            data = self.json_body or {}
+            platforms = data.get('platforms') or None
+            unknown = sorted(set(platforms or ()) - set(social_publisher.PLATFORMS))
+            if unknown:
+                self.send_json_response({'error': f"Unknown platforms: {', '.join(unknown)}"}, 400)
+                return
+            if data.get('articles'):
+                ARTICLE_INDEX.refresh()
+                wanted = set(data['articles'])
+                articles = [article for article in ARTICLE_INDEX.all() if article['filename'] in wanted]
+                missing = sorted(wanted - {article['filename'] for article in articles})
+                if missing:
+                    self.send_json_response({'error': f"Unknown articles: {', '.join(missing)}"}, 404)
+                    return
+                result = SOCIAL_QUEUE.enqueue(articles, platforms)
+            else:
+                result = SOCIAL_QUEUE.enqueue_new(ARTICLE_INDEX)
+            self.send_json_response({'success': True, **result})
+            LOG.info(
+                'social_posts_queued',
+                f"📥 Queued {len(result['queued'])} share posts ({len(result['duplicates'])} duplicates skipped)",
+                queued=len(result['queued']),
+                duplicates=len(result['duplicates'])
+            )
+        except Exception as e:
+            LOG.error('social_enqueue_failed', f"❌ Error queueing share posts: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/social/queue/retry')
+    def handle_social_retry(self):
+        """Queue a failed or cancelled post again"""
+        self.update_social_post(SOCIAL_QUEUE.retry)
+
+    @ROUTES.post('/api/social/queue/cancel')
+    def handle_social_cancel(self):
+        """Drop a pending post from the queue"""
+        self.update_social_post(SOCIAL_QUEUE.cancel)
+
+    def update_social_post(self, action):
         try:
-            navigation_file = '.navigation-config.json'
+            post_id = (self.json_body or {}).get('id')
+            if not post_id:
+                self.send_json_response({'error': 'Post id required'}, 400)
+                return
+            self.send_json_response({'success': True, 'post': action(post_id)})
+        except KeyError:
+            self.send_json_response({'error': f'Unknown post {post_id}'}, 404)
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 409)
+        except Exception as e:
+            LOG.error('social_post_update_failed', f"❌ Error updating share post: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/unsubscribe', body='form')
+    def handle_unsubscribe(self):
+        """Answer unsubscribe.html the way google-apps-script/Code.gs does (check_email / unsubscribe).
+
+        Like Code.gs, this takes a JSON body or, from the page's fallback, form fields.
+        """
+        try:
+            data = self.json_body or {}
+            action = data.get('action')
+            try:
+                email = unsubscribe_store.normalize_email(data.get('email'))
+            except ValueError:
+                self.send_unsubscribe_response(False, 'Invalid email address')
+                return
             
-            if os.path.exists(navigation_file):
-                with open(navigation_file, 'r', encoding='utf-8') as f:
-                    navigation = json.load(f)
-                self.send_json_response(navigation)
-                print(f"📋 Navigation configuration loaded")
+            if action == 'check_email':
+                status = UNSUBSCRIBES.check(email)
+                self.send_unsubscribe_response(True, 'Email check completed', status)
+            elif action == 'unsubscribe':
+                source = f"{data.get('source') or 'unknown'} | {data.get('userAgent') or 'unknown'}"
+                result = UNSUBSCRIBES.unsubscribe(email, source)
+                if result == unsubscribe_store.NOT_FOUND:
+                    self.send_unsubscribe_response(False, 'Email address not found in our newsletter list. You may already be unsubscribed or never subscribed with this email address.')
+                elif result == unsubscribe_store.ALREADY_UNSUBSCRIBED:
+                    self.send_unsubscribe_response(True, 'Email address is already unsubscribed', {'email': email, 'alreadyUnsubscribed': True})
+                else:
+                    LOG.info('newsletter_unsubscribed', "✉️  Newsletter unsubscribe recorded")
+                    self.send_unsubscribe_response(True, 'Successfully unsubscribed', {'email': email})
+            else:
+                self.send_unsubscribe_response(False, 'Invalid action')
+            
+        except Exception as e:
+            LOG.error('unsubscribe_failed', f"❌ Error processing unsubscribe: {e}", error=str(e))
+            self.send_unsubscribe_response(False, f'Internal server error: {e}')
+
+    def send_unsubscribe_response(self, success, message, data=None):
+        """The response shape of createCorsResponse in Code.gs"""
+        response = {'success': success, 'message': message, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+        if data:
+            response['data'] = data
+        self.send_json_response(response)
+
+    @ROUTES.get('/api/unsubscribe/list')
+    def handle_export_unsubscribes(self):
+        """Export the subscriber list as CSV in the sheet's column layout"""
+        try:
+            body = UNSUBSCRIBES.export_csv().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv; charset=utf-8')
+            self.send_header('Content-Disposition', 'attachment; filename="subscribers.csv"')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except Exception as e:
+            LOG.error('unsubscribe_export_failed', f"❌ Error exporting subscribers: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/unsubscribe/list', body='raw')
+    def handle_import_unsubscribes(self):
+        """Import a CSV sheet export; ?replace=1 replaces the list instead of merging"""
+        try:
+            if not self.raw_body:
+                self.send_error(400, "No content")
+                return
+            imported, skipped = UNSUBSCRIBES.import_csv(self.raw_body.decode('utf-8-sig'), replace=bool(self.query.get('replace')))
+            counts = UNSUBSCRIBES.counts()
+            self.send_json_response({'success': True, 'imported': imported, 'skipped': skipped, **counts})
+            LOG.info('subscribers_imported', f"📥 Imported {imported} subscribers ({skipped} skipped)", imported=imported, skipped=skipped)
+        except UnicodeDecodeError:
+            self.send_json_response({'error': 'CSV must be UTF-8'}, 400)
+        except Exception as e:
+            LOG.error('unsubscribe_import_failed', f"❌ Error importing subscribers: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.get('/admin/get-navigation')
+    def handle_get_navigation(self):
+        """Get current navigation configuration; ?fragments=1 adds the rendered links"""
+        try:
+            compiled = NAVIGATION.get()
+            
+            if compiled is not None:
+                etag = f'"{compiled.hash}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                body = compiled.describe() if self.query.get('fragments') else compiled.items
+                self.send_json_response(body, headers={'ETag': etag})
+                LOG.debug('navigation_loaded', "📋 Navigation configuration loaded", hash=compiled.hash)
             else:
                 # Return empty array if no config exists
                 self.send_json_response([])
-                print(f"📋 No navigation configuration found, returning empty")
+                LOG.debug('navigation_missing', "📋 No navigation configuration found, returning empty")
             
         except Exception as e:
-            print(f"❌ Error loading navigation: {e}")
+            LOG.error('navigation_load_failed', f"❌ Error loading navigation: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
 
+    @ROUTES.post('/admin/save-navigation')
     def handle_save_navigation(self):
         """Save navigation configuration"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            if content_length == 0:
+            data = self.json_body
+            if data is None:
                 self.send_error(400, "No content")
                 return
             
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
             if 'navigation' not in data:
                 self.send_error(400, "Navigation data required")
                 return
             
-            navigation_items = data['navigation']
-            
-            # Save to configuration file
-            with open('.navigation-config.json', 'w', encoding='utf-8') as f:
-                json.dump(navigation_items, f, indent=2)
-            
-            # Update the actual HTML files with new navigation
-            self.update_navigation_in_files(navigation_items)
+            # Validate and save to the configuration file, keeping the compiled fragments
+            try:
+                compiled = NAVIGATION.save(data['navigation'])
+            except navigation.NavigationError as e:
+                self.send_json_response({'error': str(e)}, 400)
+                return
             
-            self.send_json_response({'success': True, 'message': 'Navigation saved and HTML files updated'})
-            print(f"🧭 Navigation configuration saved and HTML files updated")
+            # Rewriting the HTML files touches many pages, so it runs as a job
+            job, deduplicated = JOBS.submit(
+                'save-navigation',
+                {'navigation': compiled.hash},
+                lambda job: self.update_navigation_in_files(job, compiled)
+            )
+            self.send_job_response(job, deduplicated, 'Navigation saved, HTML file update queued')
+            LOG.info('navigation_saved', "🧭 Navigation configuration saved", job_id=job.id)
             
         except Exception as e:
-            print(f"❌ Error saving navigation: {e}")
+            LOG.error('navigation_save_failed', f"❌ Error saving navigation: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
 
-    def update_navigation_in_files(self, navigation_items):
-        """Update navigation in HTML files"""
-        try:
-            # Generate desktop navigation HTML
-            desktop_nav_items = [item for item in navigation_items if item.get('showInDesktop', True)]
-            desktop_nav_items.sort(key=lambda x: x.get('order', 0))
-            
-            desktop_nav_html = []
-            for item in desktop_nav_items:
-                label = item.get('label', '')
-                href = item.get('href', '')
-                item_type = item.get('type', 'internal')
-                
-                if item_type == 'cta':
-                    desktop_nav_html.append(
-                        f'<a href="{href}" class="bg-buildly-primary text-white px-4 py-2 rounded-md text-sm font-medium hover:bg-buildly-secondary transition-colors">{label}</a>'
-                    )
-                else:
-                    desktop_nav_html.append(
-                        f'<a href="{href}" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">{label}</a>'
-                    )
-            
-            # Generate mobile navigation HTML
-            mobile_nav_items = [item for item in navigation_items if item.get('showInMobile', True)]
-            mobile_nav_items.sort(key=lambda x: x.get('order', 0))
-            
-            mobile_nav_html = []
-            for item in mobile_nav_items:
-                label = item.get('label', '')
-                href = item.get('href', '')
-                mobile_nav_html.append(
-                    f'<a href="{href}" class="text-gray-700 hover:text-buildly-primary block px-3 py-2 rounded-md text-base font-medium">{label}</a>'
-                )
-            
-            # Update HTML files that contain navigation
-            html_files = ['index.html', 'labs.html', 'use-cases.html', 'pricing.html', 'articles.html', 'team.html', 'rad-core.html']
-            
-            for file_path in html_files:
-                if os.path.exists(file_path):
-                    self.update_navigation_in_file(file_path, desktop_nav_html, mobile_nav_html)
-            
-        except Exception as e:
-            print(f"❌ Error updating navigation in files: {e}")
+    def update_navigation_in_files(self, job, compiled):
+        """Job body: update navigation in HTML files"""
+        update_navigation_pages(compiled, job.progress)
+        LOG.info('navigation_files_updated', "🧭 HTML files updated with new navigation")
 
-    def update_navigation_in_file(self, file_path, desktop_nav_html, mobile_nav_html):
-        """Update navigation in a specific HTML file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Update desktop navigation
-            desktop_pattern = r'(<div class="ml-10 flex items-baseline space-x-4">)(.*?)(</div>)'
-            desktop_replacement = f'\\1\n                        {chr(10).join(desktop_nav_html)}\n                    \\3'
-            content = re.sub(desktop_pattern, desktop_replacement, content, flags=re.DOTALL)
-            
-            # Update mobile navigation
-            mobile_pattern = r'(<div class="px-2 pt-2 pb-3 space-y-1 sm:px-3">)(.*?)(</div>)'
-            mobile_replacement = f'\\1\n                    {chr(10).join(mobile_nav_html)}\n                \\3'
-            content = re.sub(mobile_pattern, mobile_replacement, content, flags=re.DOTALL)
-            
-            # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Updated navigation in {file_path}")
-            
-        except Exception as e:
-            print(f"❌ Error updating navigation in {file_path}: {e}")
+    def send_job_response(self, job, deduplicated, message):
+        """Answer 202 Accepted with the id of a queued job"""
+        self.send_json_response({
+            'success': True,
+            'message': message,
+            'jobId': job.id,
+            'status': job.status,
+            'deduplicated': deduplicated,
+            'statusUrl': f'/api/jobs/{job.id}',
+            'eventsUrl': f'/api/jobs/{job.id}/events'
+        }, status_code=202)
 
-    def send_json_response(self, data, status_code=200):
+    def send_json_response(self, data, status_code=200, headers=None):
         """Send a JSON response"""
         self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
         self.wfile.write(json.dumps(data).encode('utf-8'))
     
+    @ROUTES.post('/save-file')
     def handle_save_file(self):
         try:
-            # Read the request body
-            content_length = int(self.headers.get('Content-Length', 0))
-            if content_length == 0:
+            data = self.json_body
+            if data is None:
                 self.send_error(400, "No content")
                 return
             
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
             file_path = data.get('path', '').strip()
             file_content = data.get('content', '')
             
@@ -1230,12 +1939,7 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 self.send_error(403, "Access denied")
                 return
             
-            # Create directory if it doesn't exist
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write the file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
+            version = self.write_with_history(full_path.relative_to(server_root).as_posix(), file_content.encode('utf-8'), 'save')
             
             # Send success response
             self.send_response(200)
@@ -1249,18 +1953,109 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
                 'success': True,
                 'message': f'File saved successfully',
                 'path': clean_path,
-                'size': len(file_content)
+                'size': len(file_content),
+                'version': version['id']
             }
             
             self.wfile.write(json.dumps(response).encode('utf-8'))
-            print(f"✅ Saved: {clean_path} ({len(file_content)} bytes)")
+            LOG.info('file_saved', f"✅ Saved: {clean_path} ({len(file_content)} bytes)", path=clean_path, bytes=len(file_content))
             
-        except json.JSONDecodeError:
-            self.send_error(400, "Invalid JSON")
         except PermissionError:
             self.send_error(403, "Permission denied")
         except Exception as e:
-            print(f"❌ Error saving file: {e}")
+            LOG.error('file_save_failed', f"❌ Error saving file: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+    
+    def write_with_history(self, relative_path, content, action):
+        """Record content in HISTORY, then write it to relative_path and schedule rebuilds
+
+        The version is recorded first so a save that dies halfway can still be
+        recovered; if the write itself fails the version is dropped again.
+        """
+        version = HISTORY.record(relative_path, content, action, client=self.client_address[0])
+        try:
+            full_path = Path(relative_path)
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(full_path, 'wb') as f:
+                f.write(content)
+        except Exception:
+            HISTORY.discard(version['id'])
+            raise
+        
+        # Rebuild whatever reads this file (articles.html, feeds, sitemap, ...)
+        REBUILDS.schedule([relative_path])
+        return version
+
+    def history_version_id(self, name):
+        value = self.query.get(name)
+        if value in (None, '', 'current'):
+            return None
+        return int(value)
+
+    @ROUTES.get('/api/history')
+    def handle_history(self):
+        """List the saved versions of ?path= (newest first; ?before= a time to page back), or every path with history"""
+        try:
+            path = (self.query.get('path') or '').replace('../', '').lstrip('/')
+            if not path:
+                self.send_json_response({'paths': HISTORY.paths(), 'stats': HISTORY.stats()})
+                return
+            limit = min(int(self.query.get('limit') or 50), 500)
+            before = float(self.query['before']) if self.query.get('before') else None
+            self.send_json_response({'path': path, 'versions': HISTORY.versions(path, limit, before)})
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 400)
+        except Exception as e:
+            LOG.error('history_list_failed', f"❌ Error listing history: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.get('/api/history/version')
+    def handle_history_version(self):
+        """Content of version ?id="""
+        try:
+            version, content = HISTORY.read(self.history_version_id('id'))
+            self.send_json_response({**version, 'content': content.decode('utf-8', 'replace')})
+        except (KeyError, TypeError):
+            self.send_json_response({'error': 'Unknown version'}, 404)
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 400)
+        except Exception as e:
+            LOG.error('history_read_failed', f"❌ Error reading version: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.get('/api/history/diff')
+    def handle_history_diff(self):
+        """Unified diff from version ?id= to version ?against= (default: the file as it is now)"""
+        try:
+            version_id = self.history_version_id('id')
+            if version_id is None:
+                self.send_json_response({'error': 'No version id provided'}, 400)
+                return
+            against = self.history_version_id('against')
+            self.send_json_response({'id': version_id, 'against': against or 'current', 'diff': HISTORY.diff(version_id, against)})
+        except KeyError:
+            self.send_json_response({'error': 'Unknown version'}, 404)
+        except ValueError as e:
+            self.send_json_response({'error': str(e)}, 400)
+        except Exception as e:
+            LOG.error('history_diff_failed', f"❌ Error diffing versions: {e}", error=str(e))
+            self.send_error(500, f"Server error: {str(e)}")
+
+    @ROUTES.post('/api/history/restore')
+    def handle_history_restore(self):
+        """Write version {id} back to its path; the restore is itself recorded as a new version"""
+        try:
+            data = self.json_body or {}
+            try:
+                previous, content = HISTORY.read(int(data.get('id')))
+            except (KeyError, TypeError, ValueError):
+                self.send_json_response({'error': 'Unknown version'}, 404)
+                return
+            version = self.write_with_history(previous['path'], content, 'restore')
+            self.send_json_response({'success': True, 'path': previous['path'], 'restored': previous['id'], 'version': version['id'], 'size': len(content)})
+            LOG.info('file_restored', f"⏪ Restored {previous['path']} to version {previous['id']}", path=previous['path'], version=previous['id'])
+        except Exception as e:
+            LOG.error('history_restore_failed', f"❌ Error restoring version: {e}", error=str(e))
             self.send_error(500, f"Server error: {str(e)}")
     
     def do_OPTIONS(self):
@@ -1274,7 +2069,24 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
     def end_headers(self):
         # Add CORS headers to all responses
         self.send_header('Access-Control-Allow-Origin', '*')
+        if self.is_fingerprinted_asset() and self.response_status in (200, 304):
+            # Hashed names change whenever the content does, so never revalidate
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
         super().end_headers()
+
+    def is_fingerprinted_asset(self):
+        path = urllib.parse.urlsplit(self.path).path
+        return self.command in ('GET', 'HEAD') and build_assets.FINGERPRINT_PATTERN.search(path) is not None
+
+    def translate_path(self, path):
+        """Serve fingerprinted assets from the build output when they aren't in the source tree"""
+        translated = super().translate_path(path)
+        if self.is_fingerprinted_asset() and not os.path.exists(translated):
+            relative = os.path.relpath(translated, self.directory)
+            built = os.path.join(self.directory, build_assets.DEFAULT_OUTPUT, relative)
+            if os.path.isfile(built):
+                return built
+        return translated
     
     def guess_type(self, path):
         """Override to ensure proper charset for HTML files"""
@@ -1293,23 +2105,27 @@ class AdminHTTPRequestHandler(SimpleHTTPRequestHandler):
 def run_server(port=8000):
     """Run the enhanced HTTP server"""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, AdminHTTPRequestHandler)
+    httpd = ThreadingHTTPServer(server_address, AdminHTTPRequestHandler)
     
     print(f"🚀 Buildly Development Server")
     print(f"📁 Serving: {os.getcwd()}")
     print(f"🌐 URL: http://localhost:{port}")
     print(f"⚙️  Admin: http://localhost:{port}/admin/")
     print(f"💾 File saving: ENABLED")
+    print(f"📊 Metrics: http://localhost:{port}/metrics")
+    print(f"📝 Event log: {LOG.path}")
     print(f"")
     print(f"Press Ctrl+C to stop the server")
     
+    SOCIAL_QUEUE.start()
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print(f"\n🛑 Server stopped")
         httpd.server_close()
+        JOBS.close()
+        LOG.close()
 
 if __name__ == '__main__':
-    import sys
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
     run_server(port)
\ No newline at end of file
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Version history for files saved through the dev server's editor.
+
+Every save is recorded before the file is overwritten: the content goes into
+an append-only pack, .history/blobs.pack, addressed by its SHA-256, and a row
+in the SQLite index .history/index.db records the path, time, blob and who
+saved it. Identical content is stored once however often it is saved, and a
+changed file is stored as a compressed line delta against its previous
+version (a full copy every MAX_DELTA_CHAIN versions bounds how many deltas a
+read replays), so history grows with the size of the edits rather than the
+number of saves. The index is keyed by (path, time), so listing a file's
+versions never reads the pack.
+
+The first save of a file that already exists also records what was on disk,
+so the pre-edit state can always be restored.
+"""
+
+import argparse
+import difflib
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+HISTORY_DIR = '.history'
+PACK_FILE = 'blobs.pack'
+INDEX_FILE = 'index.db'
+
+# Bump when the index layout changes, and add the step from the previous version to MIGRATIONS
+SCHEMA_VERSION = 1
+
+# version -> SQL that upgrades an index at that version to the next one in place
+MIGRATIONS = {}
+
+# Deltas a read may have to replay before reaching a full copy
+MAX_DELTA_CHAIN = 16
+
+# Reconstructed blobs kept in memory, since delta chains share their bases
+MAX_CACHED_BLOBS = 64
+
+SCHEMA = '''
+CREATE TABLE blobs (
+    hash TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    base TEXT,
+    depth INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE versions (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    time REAL NOT NULL,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    client TEXT
+);
+CREATE INDEX versions_by_path ON versions (path, time);
+'''
+
+COPY, INSERT = b'C', b'I'
+
+
+class SchemaError(Exception):
+    """The index was written by a schema version this code cannot upgrade"""
+
+
+def encode_delta(base, content):
+    """Line delta turning base into content: copy runs of base lines, insert the rest"""
+    base_lines = base.splitlines(keepends=True)
+    lines = content.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+    parts = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            parts.append(COPY + struct.pack('>II', i1, i2))
+        elif j2 > j1:
+            inserted = b''.join(lines[j1:j2])
+            parts.append(INSERT + struct.pack('>I', len(inserted)) + inserted)
+    return b''.join(parts)
+
+
+def apply_delta(base, delta):
+    base_lines = base.splitlines(keepends=True)
+    parts, position = [], 0
+    while position < len(delta):
+        kind = delta[position:position + 1]
+        if kind == COPY:
+            i1, i2 = struct.unpack_from('>II', delta, position + 1)
+            parts.extend(base_lines[i1:i2])
+            position += 9
+        elif kind == INSERT:
+            (length,) = struct.unpack_from('>I', delta, position + 1)
+            parts.append(delta[position + 5:position + 5 + length])
+            position += 5 + length
+        else:
+            raise ValueError(f'Corrupt delta at byte {position}')
+    return b''.join(parts)
+
+
+class FileHistory:
+    """The pack and index under root/.history"""
+
+    def __init__(self, root='.'):
+        self.root = root
+        self.directory = os.path.join(root, HISTORY_DIR)
+        os.makedirs(self.directory, exist_ok=True)
+        self.pack_path = os.path.join(self.directory, PACK_FILE)
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+        self.db = sqlite3.connect(os.path.join(self.directory, INDEX_FILE), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        try:
+            self.ensure_schema()
+        except Exception:
+            self.db.close()
+            raise
+
+    def ensure_schema(self):
+        with self.lock:
+            version = self.db.execute('PRAGMA user_version').fetchone()[0]
+            if version == SCHEMA_VERSION:
+                return
+            tables = {row[0] for row in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if not tables & {'blobs', 'versions'}:
+                # New blobs are appended after anything already in the pack, so it is left as it is
+                self.db.executescript(SCHEMA + f'PRAGMA user_version = {SCHEMA_VERSION};')
+                return
+            # The index and pack are the only copy of past versions; upgrade them or refuse to open them
+            steps = range(version, SCHEMA_VERSION)
+            if version > SCHEMA_VERSION or any(step not in MIGRATIONS for step in steps):
+                raise SchemaError(
+                    f'{self.directory} has schema version {version} and this code expects {SCHEMA_VERSION}; '
+                    'open it with a matching version or add a migration'
+                )
+            for step in steps:
+                self.db.executescript(f'BEGIN; {MIGRATIONS[step]} PRAGMA user_version = {step + 1}; COMMIT;')
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def store_blob(self, content, base_hash):
+        """Append content to the pack unless it is already there; return its hash"""
+        digest = hashlib.sha256(content).hexdigest()
+        if self.db.execute('SELECT 1 FROM blobs WHERE hash = ?', (digest,)).fetchone():
+            return digest
+
+        payload, base, depth = zlib.compress(content, 9), None, 0
+        base_row = self.db.execute('SELECT depth FROM blobs WHERE hash = ?', (base_hash,)).fetchone() if base_hash else None
+        if base_row is not None and base_row['depth'] < MAX_DELTA_CHAIN:
+            delta = zlib.compress(encode_delta(self.load_blob(base_hash), content), 9)
+            if len(delta) < len(payload):
+                payload, base, depth = delta, base_hash, base_row['depth'] + 1
+
+        with open(self.pack_path, 'ab') as f:
+            offset = f.tell()
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self.db.execute(
+            'INSERT INTO blobs (hash, offset, length, size, base, depth) VALUES (?, ?, ?, ?, ?, ?)',
+            (digest, offset, len(payload), len(content), base, depth)
+        )
+        return digest
+
+    def load_blob(self, digest):
+        """Return a blob's content, replaying its delta chain"""
+        if digest in self.cache:
+            self.cache.move_to_end(digest)
+            return self.cache[digest]
+        row = self.db.execute('SELECT offset, length, base FROM blobs WHERE hash = ?', (digest,)).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        with open(self.pack_path, 'rb') as f:
+            f.seek(row['offset'])
+            payload = zlib.decompress(f.read(row['length']))
+        content = apply_delta(self.load_blob(row['base']), payload) if row['base'] else payload
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f'History blob {digest} is corrupt')
+        self.cache[digest] = content
+        if len(self.cache) > MAX_CACHED_BLOBS:
+            self.cache.popitem(last=False)
+        return content
+
+    def latest(self, path):
+        return self.db.execute(
+            'SELECT * FROM versions WHERE path = ? ORDER BY time DESC, id DESC LIMIT 1', (path,)
+        ).fetchone()
+
+    def add_version(self, path, content, action, client, base_hash):
+        digest = self.store_blob(content, base_hash)
+        cursor = self.db.execute(
+            'INSERT INTO versions (path, time, hash, size, action, client) VALUES (?, ?, ?, ?, ?, ?)',
+            (path, time.time(), digest, len(content), action, client)
+        )
+        return cursor.lastrowid, digest
+
+    def record(self, path, content, action='save', client=None):
+        """Record content as the next version of path, before the file is written.
+
+        path is site-relative. Returns the version as a dict. A file seen for
+        the first time gets its current contents recorded as a 'baseline'.
+        """
+        with self.lock, self.db:
+            previous = self.latest(path)
+            base_hash = previous['hash'] if previous else None
+            if previous is None:
+                try:
+                    with open(os.path.join(self.root, path), 'rb') as f:
+                        existing = f.read()
+                except (FileNotFoundError, IsADirectoryError):
+                    existing = None
+                if existing is not None:
+                    _, base_hash = self.add_version(path, existing, 'baseline', None, None)
+            version_id, _ = self.add_version(path, content, action, client, base_hash)
+            return self.describe(self.db.execute('SELECT * FROM versions WHERE id = ?', (version_id,)).fetchone())
+
+    def discard(self, version_id):
+        """Forget a version whose write failed; its blob stays for deduplication"""
+        with self.lock, self.db:
+            self.db.execute('DELETE FROM versions WHERE id = ?', (version_id,))
+
+    def describe(self, row):
+        return {key: row[key] for key in ('id', 'path', 'time', 'hash', 'size', 'action', 'client')}
+
+    def versions(self, path, limit=50, before=None):
+        """A path's versions, newest first; before is a time for paging back"""
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT * FROM versions WHERE path = ? AND time < ? ORDER BY time DESC, id DESC LIMIT ?',
+                (path, before if before is not None else float('inf'), limit)
+            ).fetchall()
+        return [self.describe(row) for row in rows]
+
+    def paths(self):
+        """Every path with history, with its version count and last save time"""
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT path, COUNT(*) AS versions, MAX(time) AS time FROM versions GROUP BY path ORDER BY time DESC'
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def version(self, version_id):
+        with self.lock:
+            row = self.db.execute('SELECT * FROM versions WHERE id = ?', (version_id,)).fetchone()
+        if row is None:
+            raise KeyError(version_id)
+        return self.describe(row)
+
+    def read(self, version_id):
+        """Return (version dict, content bytes)"""
+        version = self.version(version_id)
+        with self.lock:
+            return version, self.load_blob(version['hash'])
+
+    def diff(self, version_id, against=None, context=3):
+        """Unified diff from a version to another version, or to the file on disk when against is None"""
+        version, content = self.read(version_id)
+        if against is None:
+            label = f"{version['path']} (current)"
+            try:
+                with open(os.path.join(self.root, version['path']), 'rb') as f:
+                    other = f.read()
+            except FileNotFoundError:
+                other = b''
+        else:
+            other_version, other = self.read(against)
+            label = f"{other_version['path']} @ {other_version['id']}"
+        return ''.join(difflib.unified_diff(
+            content.decode('utf-8', 'replace').splitlines(keepends=True),
+            other.decode('utf-8', 'replace').splitlines(keepends=True),
+            fromfile=f"{version['path']} @ {version['id']}",
+            tofile=label,
+            n=context
+        ))
+
+    def stats(self):
+        with self.lock:
+            versions, raw = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM versions').fetchone()
+            blobs, stored, deltas = self.db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(base IS NOT NULL), 0) FROM blobs'
+            ).fetchone()
+        return {'versions': versions, 'blobs': blobs, 'deltas': deltas, 'saved_bytes': raw, 'stored_bytes': stored}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inspect the version history of files saved by the dev server')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('path', nargs='?', help='List the versions of this site-relative path')
+    parser.add_argument('--diff', type=int, metavar='VERSION', help='Show a version against the file on disk')
+    parser.add_argument('--show', type=int, metavar='VERSION', help='Print the content of a version')
+    args = parser.parse_args()
+
+    history = FileHistory(args.root)
+    if args.show is not None:
+        print(history.read(args.show)[1].decode('utf-8', 'replace'), end='')
+    elif args.diff is not None:
+        print(history.diff(args.diff) or '(no differences)')
+    elif args.path:
+        for version in history.versions(args.path):
+            saved = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(version['time']))
+            print(f"{version['id']:>6}  {saved}  {version['action']:<8} {version['size']:>8} bytes  {version['hash'][:12]}")
+    else:
+        for entry in history.paths():
+            print(f"{entry['versions']:>4}  {entry['path']}")
+        stats = history.stats()
+        print(
+            f"🕰️  {stats['versions']} versions of {stats['saved_bytes']} bytes kept in "
+            f"{stats['stored_bytes']} bytes ({stats['blobs']} blobs, {stats['deltas']} deltas)"
+        )
+    history.close()
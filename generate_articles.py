@@ -1,226 +1,26 @@
 #!/usr/bin/env python3
 """
 Generate blog articles for Buildly website
-"""
-
-ARTICLES = {
-    # Backend Articles
-    "docker-containerization-guide.html": {
-        "title": "Docker and Containerization: A Comprehensive Guide for Developers",
-        "description": "Learn Docker containerization best practices, from development to production deployment, with real-world examples and optimization strategies.",
-        "category": "Backend",
-        "keywords": "docker, containerization, kubernetes, devops, cloud native, container orchestration"
-    },
-    
-    # Frontend Articles
-    "frontend-development-best-practices.html": {
-        "title": "Modern Frontend Development: Best Practices and Framework Integration",
-        "description": "Complete guide to frontend development with React, Vue.js, and Angular - architecture patterns, state management, and performance optimization.",
-        "category": "Frontend",
-        "keywords": "frontend development, react, vue.js, angular, javascript, web development"
-    },
-    "frontend-testing-strategies.html": {
-        "title": "Frontend Testing Best Practices: Unit, Integration, and E2E Testing",
-        "description": "Master frontend testing with comprehensive strategies for unit tests, integration tests, and end-to-end testing using modern tools and frameworks.",
-        "category": "Frontend",
-        "keywords": "frontend testing, jest, cypress, testing library, e2e testing, unit tests"
-    },
-    "react-integration-patterns.html": {
-        "title": "React Integration Patterns: Building Scalable Applications with Modern React",
-        "description": "Learn React integration patterns, hooks, state management, and best practices for building maintainable, performant React applications.",
-        "category": "Frontend",
-        "keywords": "react, react hooks, state management, redux, react patterns, component design"
-    },
-    "responsive-design-principles.html": {
-        "title": "Responsive Design Guidelines: Mobile-First Development for Modern Web",
-        "description": "Master responsive web design with mobile-first principles, CSS Grid, Flexbox, and modern layout techniques for all devices.",
-        "category": "Frontend",
-        "keywords": "responsive design, mobile-first, css grid, flexbox, web design, accessibility"
-    },
-    "ui-component-library-design.html": {
-        "title": "Building UI Component Libraries: Design Systems and Reusable Components",
-        "description": "Create maintainable UI component libraries with design systems, theming, and best practices for component-driven development.",
-        "category": "Frontend",
-        "keywords": "ui components, design system, component library, storybook, web components"
-    },
-    
-    # Marketing Articles  
-    "community-building-developer-engagement.html": {
-        "title": "Community Building and Developer Engagement: Strategies for Technical Products",
-        "description": "Build thriving developer communities with strategies for engagement, content creation, and fostering collaboration across Discord, GitHub, and Slack.",
-        "category": "Marketing",
-        "keywords": "community building, developer relations, devrel, community management, developer engagement"
-    },
-    "content-marketing-open-source.html": {
-        "title": "Content Marketing for Open Source Projects: Building Developer Communities",
-        "description": "Create engaging content that builds developer communities around open-source projects through blogs, documentation, and technical storytelling.",
-        "category": "Marketing",
-        "keywords": "content marketing, open source marketing, developer content, technical writing, community content"
-    },
-    "developer-relations-best-practices.html": {
-        "title": "Developer Relations and Community Management: Building Authentic Technical Relationships",
-        "description": "Master developer relations with best practices for community management, advocacy, and building authentic relationships with technical audiences.",
-        "category": "Marketing",
-        "keywords": "developer relations, devrel, community management, developer advocacy, technical community"
-    },
-    "digital-marketing-tech-products.html": {
-        "title": "Digital Marketing Strategy for Tech Products: Reaching Technical Audiences",
-        "description": "Comprehensive guide to marketing technology products and developer tools in the modern digital landscape with data-driven strategies.",
-        "category": "Marketing",
-        "keywords": "digital marketing, tech marketing, developer marketing, b2b marketing, saas marketing"
-    },
-    "seo-developer-products.html": {
-        "title": "SEO for Developer Products and Documentation: Technical SEO Strategies",
-        "description": "Master technical SEO for improving visibility of developer tools, API documentation, and technical content with proven strategies.",
-        "category": "Marketing",
-        "keywords": "technical seo, developer seo, documentation seo, api documentation, search optimization"
-    },
-    
-    # Product Articles
-    "agile-development-practices.html": {
-        "title": "Agile Development Best Practices: Modern Product Development Methodologies",
-        "description": "Implement agile methodologies effectively in technical product development and open-source project management with proven frameworks.",
-        "category": "Product",
-        "keywords": "agile development, scrum, kanban, product management, agile methodologies"
-    },
-    "product-management-developer-tools.html": {
-        "title": "Product Management for Developer Tools: Strategies for Technical Products",
-        "description": "Product management strategies specific to developer tools, APIs, and technical products with focus on developer experience.",
-        "category": "Product",
-        "keywords": "product management, developer tools, api product management, technical products, product strategy"
-    },
-    "roadmap-planning-prioritization.html": {
-        "title": "Roadmap Planning and Feature Prioritization: Data-Driven Product Strategy",
-        "description": "Create and manage product roadmaps for technical products with stakeholder input, feature prioritization frameworks, and execution strategies.",
-        "category": "Product",
-        "keywords": "product roadmap, feature prioritization, product planning, product strategy, stakeholder management"
-    },
-    "user-research-technical-products.html": {
-        "title": "User Research for Technical Products: Developer-Focused Research Methods",
-        "description": "Conduct effective user research with developers and technical stakeholders through surveys, interviews, and data-driven insights.",
-        "category": "Product",
-        "keywords": "user research, ux research, developer research, user interviews, product discovery"
-    }
-}
 
-TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <script src="/js/buildly-head.js"></script>
-    
-    <title>{title} | Buildly</title>
-    <meta name="description" content="{description}">
-    <meta name="keywords" content="{keywords}">
-    <link rel="canonical" href="https://www.buildly.io/articles/{filename}">
-    
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="https://www.buildly.io/articles/{filename}">
-    <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{description}">
-    <meta property="og:image" content="https://www.buildly.io/media/buildly-logo.svg">
-    
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:title" content="{title}">
-    <meta property="twitter:description" content="{description}">
-</head>
-<body class="font-sans">
-    <nav class="bg-white shadow-lg fixed w-full z-50">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between items-center h-16">
-                <div class="flex items-center">
-                    <a href="../index.html">
-                        <img src="../media/buildly-logo.svg" alt="Buildly" class="h-12 w-auto" style="filter: brightness(0) saturate(100%) invert(21%) sepia(47%) saturate(1765%) hue-rotate(198deg) brightness(97%) contrast(93%);">
-                    </a>
-                </div>
-                <div class="block">
-                    <div class="ml-10 flex items-baseline space-x-4">
-                        <a href="../index.html" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Home</a>
-                        <a href="https://labs.buildly.io" class="text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors">Labs</a>
-                        <a href="../articles.html" class="text-buildly-primary px-3 py-2 rounded-md text-sm font-medium">Articles</a>
-                        <a href="https://labs.buildly.io" class="bg-buildly-primary text-white px-4 py-2 rounded-md text-sm font-medium hover:bg-buildly-secondary transition-colors">Try for Free</a>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <section class="pt-20 bg-gradient-to-br from-buildly-light to-white">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-16">
-            <div class="text-center mb-8">
-                <div class="flex justify-center items-center gap-4 mb-4">
-                    <span class="bg-buildly-{category_color} text-white px-3 py-1 rounded-full text-sm font-medium">{category}</span>
-                    <span class="text-gray-600">•</span>
-                    <span class="text-gray-600">December 16, 2025</span>
-                </div>
-                <h1 class="text-4xl md:text-5xl font-bold text-buildly-dark mb-6">
-                    {title}
-                </h1>
-                <p class="text-xl text-gray-600">
-                    {description}
-                </p>
-            </div>
-        </div>
-    </section>
+Articles are written as Markdown with front matter in content/articles (see
+article_store.py) and rendered into articles/<slug>.html.
+"""
 
-    <article class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <div class="prose prose-lg max-w-none">
-            {content}
+import argparse
+import os
+import time
+from datetime import date
 
-            <div class="bg-gradient-to-br from-buildly-primary to-buildly-secondary rounded-lg p-8 mt-12 text-white">
-                <h3 class="text-2xl font-bold mb-4">Build Better with Buildly</h3>
-                <p class="mb-6">
-                    Buildly provides comprehensive tools and frameworks for modern software development with built-in best practices and cloud-native patterns.
-                </p>
-                <div class="flex flex-col sm:flex-row gap-4">
-                    <a href="https://labs.buildly.io" class="bg-white text-buildly-primary px-6 py-3 rounded-lg font-semibold hover:bg-gray-100 transition-colors text-center">
-                        Try Buildly Labs
-                    </a>
-                    <a href="https://docs.buildly.io" class="border-2 border-white text-white px-6 py-3 rounded-lg font-semibold hover:bg-white hover:text-buildly-primary transition-colors text-center">
-                        View Documentation
-                    </a>
-                </div>
-            </div>
+from article_store import ArticleStore, normalize_front_matter
+from markdown_compiler import MarkdownCompiler
+from page_templates import TemplateLoader
 
-        </div>
-    </article>
+# Templates ship with this script, so they are loaded from its directory
+TEMPLATES = TemplateLoader(os.path.dirname(os.path.abspath(__file__)))
+ARTICLE_TEMPLATE = 'templates/articles/article.html'
+BODY_TEMPLATE = 'templates/articles/body.html'
 
-    <footer class="bg-buildly-dark text-white py-12 mt-20">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="grid md:grid-cols-4 gap-8">
-                <div>
-                    <img src="../media/buildly-logo.svg" alt="Buildly" class="h-8 mb-4 brightness-0 invert">
-                    <p class="text-gray-400 text-sm">AI-powered product development platform</p>
-                </div>
-                <div>
-                    <h3 class="font-semibold mb-4">Products</h3>
-                    <ul class="space-y-2 text-gray-400">
-                        <li><a href="../labs.html" class="hover:text-white transition-colors">Buildly Labs</a></li>
-                        <li><a href="../rad-core.html" class="hover:text-white transition-colors">RAD Core</a></li>
-                    </ul>
-                </div>
-                <div>
-                    <h3 class="font-semibold mb-4">Resources</h3>
-                    <ul class="space-y-2 text-gray-400">
-                        <li><a href="https://docs.buildly.io" class="hover:text-white transition-colors">Documentation</a></li>
-                        <li><a href="../articles.html" class="hover:text-white transition-colors">Articles</a></li>
-                    </ul>
-                </div>
-                <div>
-                    <h3 class="font-semibold mb-4">Company</h3>
-                    <ul class="space-y-2 text-gray-400">
-                        <li><a href="../team.html" class="hover:text-white transition-colors">Team</a></li>
-                        <li><a href="../privacy.html" class="hover:text-white transition-colors">Privacy</a></li>
-                    </ul>
-                </div>
-            </div>
-            <div class="border-t border-gray-700 mt-8 pt-8 text-center text-gray-400 text-sm">
-                <p>&copy; 2025 Buildly. All rights reserved.</p>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>'''
+BENCHMARK_ARTICLES = 10000
 
 def get_category_color(category):
     colors = {
@@ -231,199 +31,156 @@ def get_category_color(category):
     }
     return colors.get(category, "primary")
 
-def generate_content(filename, data):
-    # Generate comprehensive content based on category
-    content = f'''
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Introduction</h2>
-            <p class="text-gray-700 mb-6">
-                This comprehensive guide covers essential concepts, best practices, and implementation strategies for {data['title'].lower()}.
-            </p>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Core Concepts</h2>
-            <p class="text-gray-700 mb-6">
-                Understanding the fundamental principles is critical for success. This section explores the theoretical foundation
-                and practical applications that form the basis of modern approaches in this domain.
-            </p>
-            
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Key Principles</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2">Follow industry-standard best practices and patterns</li>
-                <li class="mb-2">Maintain code quality and architectural consistency</li>
-                <li class="mb-2">Prioritize performance, security, and maintainability</li>
-                <li class="mb-2">Implement comprehensive testing and documentation</li>
-                <li class="mb-2">Foster collaboration and knowledge sharing across teams</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Best Practices</h2>
-            <p class="text-gray-700 mb-6">
-                Implementing best practices ensures consistency, maintainability, and scalability across your projects.
-                These proven approaches have been refined through years of industry experience and real-world application.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Implementation Guidelines</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2"><strong>Start with fundamentals:</strong> Build on solid foundations before adding complexity</li>
-                <li class="mb-2"><strong>Iterative development:</strong> Continuously improve through feedback and refinement</li>
-                <li class="mb-2"><strong>Documentation first:</strong> Clear documentation enables better collaboration</li>
-                <li class="mb-2"><strong>Automated testing:</strong> Comprehensive test coverage catches issues early</li>
-                <li class="mb-2"><strong>Performance monitoring:</strong> Track metrics to identify optimization opportunities</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Tools and Technologies</h2>
-            <p class="text-gray-700 mb-6">
-                The right tools significantly impact productivity and code quality. This section covers essential tools,
-                frameworks, and platforms that streamline development workflows and enhance team collaboration.
-            </p>
-            
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Recommended Tools</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2">Version control systems (Git, GitHub, GitLab)</li>
-                <li class="mb-2">Continuous integration and deployment pipelines</li>
-                <li class="mb-2">Code quality and linting tools</li>
-                <li class="mb-2">Testing frameworks and automation tools</li>
-                <li class="mb-2">Monitoring and observability platforms</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Common Challenges and Solutions</h2>
-            <p class="text-gray-700 mb-6">
-                Every project faces challenges. Understanding common pitfalls and their solutions helps teams navigate
-                complexity and deliver successful outcomes.
-            </p>
-
-            <div class="bg-buildly-light p-6 rounded-lg mb-6">
-                <h3 class="text-xl font-semibold text-buildly-dark mb-3">Challenge: Managing Complexity</h3>
-                <p class="text-gray-700 mb-2">
-                    As projects grow, complexity increases exponentially, making systems harder to maintain and extend.
-                </p>
-                <p class="text-gray-700">
-                    <strong>Solution:</strong> Implement modular architecture, clear separation of concerns, and comprehensive
-                    documentation to manage complexity effectively.
-                </p>
-            </div>
-
-            <div class="bg-buildly-light p-6 rounded-lg mb-6">
-                <h3 class="text-xl font-semibold text-buildly-dark mb-3">Challenge: Team Collaboration</h3>
-                <p class="text-gray-700 mb-2">
-                    Distributed teams and varying skill levels can lead to inconsistent practices and communication gaps.
-                </p>
-                <p class="text-gray-700">
-                    <strong>Solution:</strong> Establish clear coding standards, implement code review processes, and invest
-                    in team training and documentation.
-                </p>
-            </div>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Performance Optimization</h2>
-            <p class="text-gray-700 mb-6">
-                Performance is critical for user experience and system scalability. This section covers optimization
-                strategies that deliver measurable improvements without sacrificing code quality or maintainability.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Optimization Strategies</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2">Profile before optimizing - measure actual bottlenecks</li>
-                <li class="mb-2">Implement caching at appropriate layers</li>
-                <li class="mb-2">Optimize database queries and indexes</li>
-                <li class="mb-2">Use async/await patterns for I/O operations</li>
-                <li class="mb-2">Minimize network requests and payload sizes</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Security Considerations</h2>
-            <p class="text-gray-700 mb-6">
-                Security must be built into every layer of your application. Understanding security principles and
-                implementing defense-in-depth strategies protects both your systems and your users.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Security Best Practices</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2"><strong>Authentication and authorization:</strong> Implement robust identity management</li>
-                <li class="mb-2"><strong>Data encryption:</strong> Encrypt sensitive data at rest and in transit</li>
-                <li class="mb-2"><strong>Input validation:</strong> Sanitize all user inputs to prevent injection attacks</li>
-                <li class="mb-2"><strong>Dependency management:</strong> Keep dependencies updated and scan for vulnerabilities</li>
-                <li class="mb-2"><strong>Security audits:</strong> Regular security reviews and penetration testing</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Testing and Quality Assurance</h2>
-            <p class="text-gray-700 mb-6">
-                Comprehensive testing ensures reliability and catches issues before they reach production. A well-designed
-                testing strategy provides confidence in code changes and enables rapid iteration.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Testing Strategy</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2"><strong>Unit tests:</strong> Test individual components in isolation</li>
-                <li class="mb-2"><strong>Integration tests:</strong> Verify components work together correctly</li>
-                <li class="mb-2"><strong>End-to-end tests:</strong> Test complete user workflows</li>
-                <li class="mb-2"><strong>Performance tests:</strong> Validate system behavior under load</li>
-                <li class="mb-2"><strong>Security tests:</strong> Identify vulnerabilities and weaknesses</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Documentation and Knowledge Sharing</h2>
-            <p class="text-gray-700 mb-6">
-                Documentation is an investment in team productivity and code maintainability. Good documentation reduces
-                onboarding time, facilitates collaboration, and serves as a reference for future development.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Documentation Types</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2"><strong>API documentation:</strong> Clear specifications for all endpoints</li>
-                <li class="mb-2"><strong>Architecture docs:</strong> System design and component relationships</li>
-                <li class="mb-2"><strong>Code comments:</strong> Inline explanations for complex logic</li>
-                <li class="mb-2"><strong>Runbooks:</strong> Operational procedures and troubleshooting guides</li>
-                <li class="mb-2"><strong>Tutorials:</strong> Step-by-step guides for common tasks</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Continuous Improvement</h2>
-            <p class="text-gray-700 mb-6">
-                Excellence is a journey, not a destination. Establishing processes for continuous improvement ensures
-                your systems and practices evolve with changing requirements and technologies.
-            </p>
-
-            <h3 class="text-2xl font-semibold text-buildly-dark mt-8 mb-4">Improvement Practices</h3>
-            <ul class="list-disc pl-6 mb-6 text-gray-700">
-                <li class="mb-2">Regular retrospectives to identify improvement opportunities</li>
-                <li class="mb-2">Code review processes to share knowledge and maintain quality</li>
-                <li class="mb-2">Technical debt tracking and remediation</li>
-                <li class="mb-2">Performance monitoring and optimization cycles</li>
-                <li class="mb-2">Team training and skill development programs</li>
-            </ul>
-
-            <h2 class="text-3xl font-bold text-buildly-dark mt-12 mb-6">Conclusion</h2>
-            <p class="text-gray-700 mb-6">
-                Success in modern software development requires a combination of technical expertise, collaborative
-                practices, and commitment to continuous improvement. By following these best practices and principles,
-                teams can build robust, scalable systems that deliver value to users.
-            </p>
-            <p class="text-gray-700 mb-6">
-                Remember that every project is unique, and these guidelines should be adapted to your specific context
-                and requirements. The key is to start with sound fundamentals, measure results, and continuously refine
-                your approach based on real-world feedback and data.
-            </p>
-    '''
-    
-    return content
-
-if __name__ == "__main__":
-    import os
-    articles_dir = "/Users/greglind/Projects/me/marketing/websites/buildly-website/articles"
-    
-    for filename, data in ARTICLES.items():
-        content = generate_content(filename, data)
-        category_color = get_category_color(data['category'])
-        
-        html = TEMPLATE.format(
+def article_topic(data):
+    """The badge shown on the page: the front matter topic, else the article's category"""
+    return data['topic'] or data['category']
+
+def display_date(value):
+    """Format an ISO date from front matter the way article pages show it"""
+    day = date.fromisoformat(value)
+    return f"{day:%B} {day.day}, {day.year}"
+
+class ArticleRenderer:
+    """Renders articles with the article and body templates compiled once"""
+
+    def __init__(self, loader=TEMPLATES, markdown=None):
+        self.article = loader.get(ARTICLE_TEMPLATE)
+        self.body = loader.get(BODY_TEMPLATE)
+        self.markdown = markdown or MarkdownCompiler(root=None)
+
+    def generate_content(self, filename, data):
+        # Articles without a Markdown body of their own get the standard outline
+        if data.get('body', '').strip():
+            return self.markdown.render(data['body'])
+        return self.body.render({'title_lower': data['title'].lower()})
+
+    def render(self, filename, data):
+        """Render one page from normalized front matter (see load_articles) plus 'body'"""
+        return self.article.render({
+            'title': data['title'],
+            'description': data['description'],
+            'keywords': data['keywords'],
+            'filename': filename,
+            'category': article_topic(data),
+            'category_color': get_category_color(article_topic(data)),
+            'date': display_date(data['date']),
+            'content': self.generate_content(filename, data)
+        })
+
+def load_articles(root='.'):
+    """Return {filename: front matter plus 'body'} for every article in content/articles.
+
+    Missing optional keys get the same defaults the store records for them,
+    including the publication date it derived for undated articles.
+    """
+    store = ArticleStore(root)
+    try:
+        store.refresh()
+        return {
+            f'{slug}.html': {**normalize_front_matter(meta, body, store.get(slug)['published']), 'body': body}
+            for slug, (meta, body) in store.sources().items()
+        }
+    finally:
+        store.close()
+
+def write_articles(root='.', articles=None):
+    """Write every article into root/articles, skipping files whose content is unchanged.
+
+    Markdown bodies are compiled through the render cache in root, so only
+    changed bodies are compiled again. Returns the filenames that were written.
+    """
+    articles = load_articles(root) if articles is None else articles
+    articles_dir = os.path.join(root, 'articles')
+    markdown = MarkdownCompiler(root)
+    renderer = ArticleRenderer(markdown=markdown)
+    written = []
+    for filename, data in articles.items():
+        html = renderer.render(filename, data)
+        filepath = os.path.join(articles_dir, filename)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                if f.read() == html:
+                    continue
+        except FileNotFoundError:
+            pass
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(html)
+        written.append(filename)
+    markdown.save_cache()
+    return written
+
+def synthetic_corpus(count, root='.'):
+    """Return count distinct articles built by cycling the real ones"""
+    entries = list(load_articles(root).items())
+    corpus = {}
+    for i in range(count):
+        filename, data = entries[i % len(entries)]
+        corpus[f"{filename[:-len('.html')]}-{i}.html"] = {**data, 'title': f"{data['title']} (Part {i})"}
+    return corpus
+
+def format_string(template):
+    """The str.format equivalent of a compiled template, for benchmarking"""
+    def literal(text):
+        return text.replace('{', '{{').replace('}', '}}')
+    parts = [literal(template.segments[0])]
+    for (name, raw, partial), segment in zip(template.slots, template.segments[1:]):
+        if partial is not None:
+            raise ValueError(f'{template.name}: partial slots have no str.format equivalent')
+        parts.append('{' + name + '}')
+        parts.append(literal(segment))
+    return ''.join(parts)
+
+def benchmark(count=BENCHMARK_ARTICLES, root='.'):
+    """Time str.format against the compiled templates on a synthetic corpus; return seconds per path"""
+    corpus = synthetic_corpus(count, root)
+    renderer = ArticleRenderer()
+    article_format, body_format = format_string(renderer.article), format_string(renderer.body)
+
+    def render_with_format(filename, data):
+        return article_format.format(
             title=data['title'],
             description=data['description'],
             keywords=data['keywords'],
             filename=filename,
-            category=data['category'],
-            category_color=category_color,
-            content=content
+            category=article_topic(data),
+            category_color=get_category_color(article_topic(data)),
+            date=display_date(data['date']),
+            content=body_format.format(title_lower=data['title'].lower())
         )
-        
-        filepath = os.path.join(articles_dir, filename)
-        with open(filepath, 'w') as f:
-            f.write(html)
-        
+
+    for filename, data in corpus.items():
+        if render_with_format(filename, data) != renderer.render(filename, data):
+            raise AssertionError(f'str.format and template output differ for {filename}')
+
+    def timed(make_render):
+        # Each page is dropped as soon as it is rendered, so only render cost is measured
+        started = time.perf_counter()
+        render = make_render()
+        for filename, data in corpus.items():
+            render(filename, data)
+        return time.perf_counter() - started
+
+    return {
+        'format': timed(lambda: render_with_format),
+        'templates (compile + render)': timed(lambda: ArticleRenderer(TemplateLoader(TEMPLATES.root)).render),
+        'templates (render)': timed(lambda: renderer.render),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate articles from content/articles into articles/')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--benchmark', type=int, nargs='?', const=BENCHMARK_ARTICLES, metavar='N',
+                        help=f'Time rendering N synthetic articles (default {BENCHMARK_ARTICLES}) instead of writing')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        for path, seconds in benchmark(args.benchmark, args.root).items():
+            print(f"⏱️  {path}: {seconds * 1000:.1f} ms ({seconds / args.benchmark * 1e6:.1f} µs/article)")
+        raise SystemExit(0)
+
+    articles = load_articles(args.root)
+    written = write_articles(args.root, articles)
+    for filename in written:
         print(f"Generated: {filename}")
     
-    print(f"\nGenerated {len(ARTICLES)} articles successfully!")
+    print(f"\nGenerated {len(written)} of {len(articles)} articles successfully!")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Generate the RSS 2.0 (feed.xml) and Atom (atom.xml) feeds from articles/.
+
+Rendered items are cached in .feed-cache.json keyed by each article's mtime
+and size, so a rebuild only re-renders articles whose source changed. Feed
+files are rewritten only when their bytes change and lastBuildDate/updated
+come from the newest article rather than the clock, which keeps
+Last-Modified stable for conditional GETs from polling feed readers.
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape, quoteattr
+
+from article_store import ArticleStore, extract_article_body
+
+SITE_URL = 'https://www.buildly.io'
+FEED_TITLE = 'Buildly AI Development Blog'
+FEED_DESCRIPTION = (
+    "Expert insights on AI development, vibe coding methodologies, product management best practices, "
+    "and software innovation from Buildly's team of experienced developers and product managers."
+)
+FEED_AUTHOR = 'Buildly Team'
+FEED_EMAIL = 'contact@buildly.io'
+FEED_LOGO = f'{SITE_URL}/media/buildly-logo.svg'
+FEED_CATEGORIES = ['Technology', 'AI Development', 'Product Management', 'Software Engineering']
+
+RSS_FILE = 'feed.xml'
+ATOM_FILE = 'atom.xml'
+CACHE_FILE = '.feed-cache.json'
+DEFAULT_LIMIT = 50
+
+# Bump when item markup changes so cached items are re-rendered
+CACHE_VERSION = 1
+
+
+def parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+
+
+def rfc822(value):
+    return format_datetime(parse_date(value), usegmt=True)
+
+
+def rfc3339(value):
+    return parse_date(value).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def cdata(text):
+    return '<![CDATA[' + text.replace(']]>', ']]]]><![CDATA[>') + ']]>'
+
+
+def item_categories(article, limit=3):
+    categories = [article['category']]
+    for keyword in article['keywords'].split(','):
+        keyword = keyword.strip()
+        if keyword and keyword.lower() not in (c.lower() for c in categories):
+            categories.append(keyword)
+        if len(categories) > limit:
+            break
+    return categories
+
+
+def render_rss_item(article, body=None):
+    """Render one <item> for the RSS 2.0 feed"""
+    url = f"{SITE_URL}/{article['filename']}"
+    lines = [
+        f"    <!-- {escape(article['title']).replace('--', '-')} -->",
+        '    <item>',
+        f"        <title>{escape(article['title'])}</title>",
+        f'        <link>{escape(url)}</link>',
+        f"        <description>{escape(article['description'])}</description>",
+        f"        <pubDate>{rfc822(article['published'])}</pubDate>",
+        f'        <guid>{escape(url)}</guid>',
+    ]
+    lines += [f'        <category>{escape(category)}</category>' for category in item_categories(article)]
+    lines.append(f"        <dc:creator>{escape(article['author'])}</dc:creator>")
+    if body:
+        lines.append(f'        <content:encoded>{cdata(body)}</content:encoded>')
+    lines.append('    </item>')
+    return '\n'.join(lines) + '\n'
+
+
+def render_atom_entry(article, body=None):
+    """Render one <entry> for the Atom feed"""
+    url = f"{SITE_URL}/{article['filename']}"
+    lines = [
+        '  <entry>',
+        f"    <title>{escape(article['title'])}</title>",
+        f'    <link href={quoteattr(url)}/>',
+        f'    <id>{escape(url)}</id>',
+        f"    <published>{rfc3339(article['published'])}</published>",
+        f"    <updated>{rfc3339(article['modified'] or article['published'])}</updated>",
+        f"    <author><name>{escape(article['author'])}</name></author>",
+        f"    <summary>{escape(article['description'])}</summary>",
+    ]
+    lines += [f'    <category term={quoteattr(category)}/>' for category in item_categories(article)]
+    if body:
+        lines.append(f'    <content type="html">{escape(body)}</content>')
+    lines.append('  </entry>')
+    return '\n'.join(lines) + '\n'
+
+
+def write_if_changed(file_path, content):
+    """Write a file atomically, but only if its bytes would change"""
+    data = content.encode('utf-8')
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = f'{file_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+    return True
+
+
+class FeedBuilder:
+    """Incremental RSS/Atom feed builder backed by a per-item render cache"""
+
+    def __init__(self, root='.', full_content=False, limit=DEFAULT_LIMIT):
+        self.root = root
+        self.full_content = full_content
+        self.limit = limit
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('items', {})
+
+    def save_cache(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'items': self.cache}, f)
+
+    def render_items(self, articles):
+        """Return (rss_items, atom_entries, rendered_count), reusing cached renders"""
+        rss_items, atom_entries, rendered = [], [], 0
+        live = set()
+        for article in articles:
+            filename = article['filename']
+            live.add(filename)
+            signature = [article['mtime'], article['size'], self.full_content]
+            cached = self.cache.get(filename)
+            if cached is None or cached['signature'] != signature:
+                body = None
+                if self.full_content:
+                    with open(os.path.join(self.root, filename), 'r', encoding='utf-8') as f:
+                        body = extract_article_body(f.read())
+                cached = self.cache[filename] = {
+                    'signature': signature,
+                    'rss': render_rss_item(article, body),
+                    'atom': render_atom_entry(article, body),
+                }
+                rendered += 1
+            rss_items.append(cached['rss'])
+            atom_entries.append(cached['atom'])
+        for filename in list(self.cache):
+            if filename not in live:
+                del self.cache[filename]
+        return rss_items, atom_entries, rendered
+
+    def build(self, index=None):
+        """Regenerate feed.xml and atom.xml, returning a summary of the work done"""
+        if index is None:
+            index = ArticleStore(self.root)
+        index.refresh()
+        articles = sorted(
+            index.all(),
+            key=lambda article: (article['published'], article['filename']),
+            reverse=True
+        )[:self.limit]
+        rss_items, atom_entries, rendered = self.render_items(articles)
+        updated = max((a['modified'] or a['published'] for a in articles), default='1970-01-01')
+
+        written = []
+        if write_if_changed(os.path.join(self.root, RSS_FILE), self.render_rss(rss_items, updated)):
+            written.append(RSS_FILE)
+        if write_if_changed(os.path.join(self.root, ATOM_FILE), self.render_atom(atom_entries, updated)):
+            written.append(ATOM_FILE)
+        self.save_cache()
+        return {'items': len(articles), 'rendered': rendered, 'written': written}
+
+    def render_rss(self, items, updated):
+        header = f'''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+    <title>{escape(FEED_TITLE)}</title>
+    <link>{SITE_URL}/articles.html</link>
+    <description>{escape(FEED_DESCRIPTION)}</description>
+    <language>en-us</language>
+    <managingEditor>{FEED_EMAIL} ({FEED_AUTHOR})</managingEditor>
+    <webMaster>{FEED_EMAIL} ({FEED_AUTHOR})</webMaster>
+    <copyright>Copyright {updated[:4]} Buildly, Inc. All rights reserved.</copyright>
+    <lastBuildDate>{rfc822(updated)}</lastBuildDate>
+'''
+        header += ''.join(f'    <category>{escape(category)}</category>\n' for category in FEED_CATEGORIES)
+        header += f'''    <generator>Buildly RSS Generator</generator>
+    <atom:link href="{SITE_URL}/{RSS_FILE}" rel="self" type="application/rss+xml"/>
+    <image>
+        <url>{FEED_LOGO}</url>
+        <title>{escape(FEED_TITLE)}</title>
+        <link>{SITE_URL}/articles.html</link>
+        <description>Buildly - AI-Powered Product Development Platform</description>
+        <width>144</width>
+        <height>144</height>
+    </image>
+
+'''
+        return header + '\n'.join(items) + '\n</channel>\n</rss>\n'
+
+    def render_atom(self, entries, updated):
+        header = f'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{escape(FEED_TITLE)}</title>
+  <subtitle>{escape(FEED_DESCRIPTION)}</subtitle>
+  <link href="{SITE_URL}/{ATOM_FILE}" rel="self" type="application/atom+xml"/>
+  <link href="{SITE_URL}/articles.html" rel="alternate" type="text/html"/>
+  <id>{SITE_URL}/{ATOM_FILE}</id>
+  <updated>{rfc3339(updated)}</updated>
+  <author><name>{FEED_AUTHOR}</name><email>{FEED_EMAIL}</email></author>
+  <logo>{FEED_LOGO}</logo>
+  <generator>Buildly RSS Generator</generator>
+'''
+        return header + ''.join(entries) + '</feed>\n'
+
+
+def generate_feeds(root='.', full_content=False, limit=DEFAULT_LIMIT, index=None):
+    """Build both feeds once; see FeedBuilder.build for the return value"""
+    return FeedBuilder(root, full_content, limit).build(index)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate RSS and Atom feeds from articles/')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--full-content', action='store_true', help='Include article bodies (content:encoded)')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='Maximum number of items per feed')
+    args = parser.parse_args()
+
+    result = generate_feeds(args.root, args.full_content, args.limit)
+    written = ', '.join(result['written']) or 'no changes'
+    print(f"📰 Feeds built with {result['items']} items ({result['rendered']} re-rendered): {written}")
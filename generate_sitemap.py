@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Generate sitemap.xml for the Buildly website from the page and article files.
+
+lastmod comes from each file's modification time. URLs are streamed to disk
+one entry at a time, and past 50,000 URLs the output switches to a sitemap
+index (sitemap.xml) pointing at numbered chunks (sitemap-1.xml, ...).
+"""
+
+import argparse
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+SITE_URL = 'https://www.buildly.io'
+
+# Sitemap protocol limit on URLs per file
+MAX_URLS_PER_SITEMAP = 50000
+
+# Hand-tuned (changefreq, priority) for top-level pages; anything else gets
+# DEFAULT_PAGE_SETTINGS, and articles get ARTICLE_SETTINGS
+PAGE_SETTINGS = {
+    'index.html': ('weekly', '1.0'),
+    'labs.html': ('weekly', '0.9'),
+    'platform/index.html': ('monthly', '0.9'),
+    'index.amp.html': ('weekly', '0.9'),
+    'use-cases.html': ('monthly', '0.8'),
+    'pricing.html': ('monthly', '0.8'),
+    'training.html': ('monthly', '0.8'),
+    'articles.html': ('weekly', '0.8'),
+    'vlog.html': ('weekly', '0.8'),
+    'product-manager.html': ('monthly', '0.8'),
+    'developer.html': ('monthly', '0.8'),
+    'labs.amp.html': ('weekly', '0.8'),
+    'feed.xml': ('weekly', '0.7'),
+    'team.html': ('monthly', '0.6'),
+    'rad-core.html': ('monthly', '0.6'),
+}
+DEFAULT_PAGE_SETTINGS = ('monthly', '0.5')
+ARTICLE_SETTINGS = ('monthly', '0.6')
+
+# Pages that exist in the tree but should not be indexed
+EXCLUDED_PAGES = {'admin.html', 'unsubscribe.html', 'brand-guidelines.html'}
+
+# Non-HTML resources that are listed in the sitemap
+EXTRA_FILES = ['feed.xml']
+
+NOINDEX_PATTERN = re.compile(rb'<meta[^>]+name=["\']robots["\'][^>]+noindex', re.IGNORECASE)
+
+
+def page_url(path):
+    """Map a site-relative file path to its public URL"""
+    if path == 'index.html':
+        return f'{SITE_URL}/'
+    if path.endswith('/index.html'):
+        return f'{SITE_URL}/{path[:-len("/index.html")]}'
+    return f'{SITE_URL}/{path}'
+
+
+def is_sitemap_page(path):
+    """Return True if a site-relative path belongs in the sitemap"""
+    name = path.rsplit('/', 1)[-1]
+    if name.startswith('.') or path in EXCLUDED_PAGES:
+        return False
+    if path in EXTRA_FILES:
+        return True
+    if not path.endswith('.html'):
+        return False
+    parts = path.split('/')
+    if len(parts) == 1:
+        return True
+    if parts[0] == 'articles' and len(parts) == 2:
+        return True
+    # Section landing pages such as platform/index.html
+    return len(parts) == 2 and parts[1] == 'index.html' and parts[0] not in ('admin', 'templates', 'includes')
+
+
+def discover_pages(root='.'):
+    """Yield site-relative paths of every page that belongs in the sitemap"""
+    root = Path(root)
+    for html_file in sorted(root.glob('*.html')):
+        yield html_file.name
+    for index_file in sorted(root.glob('*/index.html')):
+        yield index_file.relative_to(root).as_posix()
+    for article in sorted(root.glob('articles/*.html')):
+        yield article.relative_to(root).as_posix()
+    for extra in EXTRA_FILES:
+        if (root / extra).exists():
+            yield extra
+
+
+def has_noindex(file_path):
+    """Return True if the page's <head> asks robots not to index it"""
+    if file_path.suffix != '.html':
+        return False
+    with open(file_path, 'rb') as f:
+        head = f.read(8192)
+    return NOINDEX_PATTERN.search(head) is not None
+
+
+def build_entry(root, path):
+    """Build the sitemap entry for one page, or None if it should be skipped"""
+    if not is_sitemap_page(path):
+        return None
+    try:
+        stat = (Path(root) / path).stat()
+    except FileNotFoundError:
+        return None
+    # Zero-byte placeholders are broken pages, not content
+    if stat.st_size == 0 or has_noindex(Path(root) / path):
+        return None
+    if path in PAGE_SETTINGS:
+        changefreq, priority = PAGE_SETTINGS[path]
+    elif path.startswith('articles/'):
+        changefreq, priority = ARTICLE_SETTINGS
+    else:
+        changefreq, priority = DEFAULT_PAGE_SETTINGS
+    lastmod = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).strftime('%Y-%m-%d')
+    return {
+        'loc': page_url(path),
+        'lastmod': lastmod,
+        'changefreq': changefreq,
+        'priority': priority,
+    }
+
+
+def sort_key(entry):
+    return (-float(entry['priority']), entry['loc'])
+
+
+def write_urlset(file_path, entries):
+    """Stream a <urlset> document to disk, replacing the file atomically"""
+    tmp_path = f'{file_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for entry in entries:
+            f.write(
+                '  <url>\n'
+                f'    <loc>{escape(entry["loc"])}</loc>\n'
+                f'    <lastmod>{entry["lastmod"]}</lastmod>\n'
+                f'    <changefreq>{entry["changefreq"]}</changefreq>\n'
+                f'    <priority>{entry["priority"]}</priority>\n'
+                '  </url>\n'
+            )
+        f.write('</urlset>\n')
+    os.replace(tmp_path, file_path)
+
+
+def write_sitemap_index(file_path, chunks):
+    """Stream a <sitemapindex> document listing (url, lastmod) chunks"""
+    tmp_path = f'{file_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for url, lastmod in chunks:
+            f.write(
+                '  <sitemap>\n'
+                f'    <loc>{escape(url)}</loc>\n'
+                f'    <lastmod>{lastmod}</lastmod>\n'
+                '  </sitemap>\n'
+            )
+        f.write('</sitemapindex>\n')
+    os.replace(tmp_path, file_path)
+
+
+class SitemapIndex:
+    """In-memory index of sitemap entries that can be updated one page at a time"""
+
+    def __init__(self, root='.', output='sitemap.xml', max_urls=MAX_URLS_PER_SITEMAP):
+        self.root = Path(root)
+        self.output = Path(output) if Path(output).is_absolute() else self.root / output
+        self.max_urls = max_urls
+        self.entries = {}
+        for path in discover_pages(self.root):
+            entry = build_entry(self.root, path)
+            if entry:
+                self.entries[path] = entry
+
+    def update(self, paths):
+        """Refresh the entries for the given site-relative paths.
+
+        Returns True if any entry was added, removed or changed lastmod.
+        """
+        changed = False
+        for path in paths:
+            path = Path(path).as_posix()
+            entry = build_entry(self.root, path)
+            if entry is None:
+                changed = self.entries.pop(path, None) is not None or changed
+            elif self.entries.get(path) != entry:
+                self.entries[path] = entry
+                changed = True
+        return changed
+
+    def write(self):
+        """Write sitemap.xml, or a sitemap index plus chunks for large sites"""
+        entries = sorted(self.entries.values(), key=sort_key)
+        if len(entries) <= self.max_urls:
+            write_urlset(self.output, entries)
+            self.remove_stale_chunks(0)
+            return [self.output]
+
+        stem, suffix = self.output.stem, self.output.suffix
+        chunks, written = [], []
+        for number, start in enumerate(range(0, len(entries), self.max_urls), 1):
+            chunk_entries = entries[start:start + self.max_urls]
+            chunk_path = self.output.with_name(f'{stem}-{number}{suffix}')
+            write_urlset(chunk_path, chunk_entries)
+            lastmod = max(entry['lastmod'] for entry in chunk_entries)
+            chunks.append((f'{SITE_URL}/{chunk_path.name}', lastmod))
+            written.append(chunk_path)
+        write_sitemap_index(self.output, chunks)
+        self.remove_stale_chunks(len(chunks))
+        return [self.output] + written
+
+    def remove_stale_chunks(self, keep):
+        """Delete numbered chunk files left over from a previous, larger build"""
+        stem, suffix = self.output.stem, self.output.suffix
+        number = keep + 1
+        while True:
+            chunk_path = self.output.with_name(f'{stem}-{number}{suffix}')
+            if not chunk_path.exists():
+                break
+            chunk_path.unlink()
+            number += 1
+
+
+def generate_sitemap(root='.', output='sitemap.xml'):
+    """Build and write the sitemap from scratch, returning the files written"""
+    return SitemapIndex(root, output).write()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate sitemap.xml from page files and mtimes')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--output', default='sitemap.xml', help='Sitemap file, relative to root')
+    args = parser.parse_args()
+
+    index = SitemapIndex(args.root, args.output)
+    written = index.write()
+    print(f"🗺️  Sitemap generated with {len(index.entries)} URLs: {', '.join(str(p) for p in written)}")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Build-time syntax highlighting for code blocks on the Buildly website.
+
+Every <pre><code> block is tokenized once and rewritten with
+<span class="hl-..."> tokens, styled by the static "Syntax highlighting"
+rules in css/style.css, so pages need no client-side highlighter. The
+language comes from a language-x (or lang-x) class on the <code> or <pre>
+element and is otherwise guessed from the code. Blocks that already contain
+markup are left alone, which also makes re-running the stage a no-op.
+
+Highlighted blocks are cached in .highlight-cache.json by language and the
+SHA-256 of the code, so only new or edited blocks are tokenized again.
+Markdown articles are highlighted as they are compiled (see
+markdown_compiler.py); this module's stage covers hand-written pages.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+from build_assets import discover_files
+
+CACHE_FILE = '.highlight-cache.json'
+
+# Bump when tokenization or class names change so cached blocks are re-highlighted
+CACHE_VERSION = 1
+
+# Highlighted blocks kept in the cache; the least recently used are dropped first
+MAX_CACHE_ENTRIES = 4096
+
+# Token classes, styled in css/style.css
+KEYWORD, STRING, COMMENT, NUMBER, FUNCTION, LITERAL, ATTRIBUTE, TAG, VARIABLE, META = (
+    'hl-kw', 'hl-str', 'hl-com', 'hl-num', 'hl-fn', 'hl-lit', 'hl-attr', 'hl-tag', 'hl-var', 'hl-meta'
+)
+
+DOUBLE_QUOTED = r'"(?:[^"\\\n]|\\.)*"'
+SINGLE_QUOTED = r"'(?:[^'\\\n]|\\.)*'"
+NUMBER_PATTERN = r'\b(?:0[xX][\da-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\b'
+CALL_PATTERN = r'\b[A-Za-z_$][\w$]*(?=\s*\()'
+
+
+def words(names):
+    return r'\b(?:' + '|'.join(sorted(names.split(), key=len, reverse=True)) + r')\b'
+
+
+# Language -> ordered (token class, pattern) rules; earlier rules win
+LANGUAGES = {
+    'python': [
+        (COMMENT, r'#[^\n]*'),
+        (STRING, r'[rbfuRBFU]{0,2}(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|' + DOUBLE_QUOTED + '|' + SINGLE_QUOTED + ')'),
+        (META, r'^\s*@[\w.]+'),
+        (KEYWORD, words(
+            'and as assert async await break class continue def del elif else except finally for from global '
+            'if import in is lambda nonlocal not or pass raise return try while with yield match case'
+        )),
+        (LITERAL, words('True False None self cls')),
+        (NUMBER, NUMBER_PATTERN),
+        (FUNCTION, CALL_PATTERN),
+    ],
+    'javascript': [
+        (COMMENT, r'//[^\n]*|/\*[\s\S]*?\*/'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED + r'|`(?:[^`\\]|\\.)*`'),
+        (KEYWORD, words(
+            'async await break case catch class const continue debugger default delete do else export extends '
+            'finally for from function if import in instanceof let new of return static super switch throw try '
+            'typeof var void while with yield interface type enum implements public private protected readonly'
+        )),
+        (LITERAL, words('true false null undefined this NaN Infinity')),
+        (NUMBER, NUMBER_PATTERN),
+        (FUNCTION, CALL_PATTERN),
+    ],
+    'bash': [
+        (COMMENT, r'(?<![\w$])#[^\n]*'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        (VARIABLE, r'\$(?:\{[^}\n]*\}|\w+|[@#?$!*-])'),
+        (KEYWORD, words('if then else elif fi for while until do done case esac function in return export local source')),
+        (META, r'^\s*\$(?=\s)'),
+        (ATTRIBUTE, r'(?<=\s)--?[\w-]+'),
+        (NUMBER, NUMBER_PATTERN),
+    ],
+    'json': [
+        (ATTRIBUTE, DOUBLE_QUOTED + r'(?=\s*:)'),
+        (STRING, DOUBLE_QUOTED),
+        (LITERAL, words('true false null')),
+        (NUMBER, r'-?' + NUMBER_PATTERN),
+    ],
+    'yaml': [
+        (COMMENT, r'(?<!\S)#[^\n]*'),
+        (ATTRIBUTE, r'(?:^|(?<=[ \t-]))[\w./-]+(?=\s*:(?:\s|$))'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        (LITERAL, words('true false null yes no on off')),
+        (NUMBER, NUMBER_PATTERN),
+        (META, r'^---$|[&*][\w-]+'),
+    ],
+    'dockerfile': [
+        (COMMENT, r'^\s*#[^\n]*'),
+        (KEYWORD, r'(?im)^\s*(?:FROM|RUN|CMD|LABEL|EXPOSE|ENV|ADD|COPY|ENTRYPOINT|VOLUME|USER|WORKDIR|ARG|'
+                  r'ONBUILD|STOPSIGNAL|HEALTHCHECK|SHELL)\b|\bAS\b'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        (VARIABLE, r'\$(?:\{[^}\n]*\}|\w+)'),
+        (NUMBER, NUMBER_PATTERN),
+    ],
+    'css': [
+        (COMMENT, r'/\*[\s\S]*?\*/'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        (META, r'@[\w-]+'),
+        (ATTRIBUTE, r'(?<![\w-])--?[a-zA-Z][\w-]*(?=\s*:)'),
+        (NUMBER, r'#[\da-fA-F]{3,8}\b|-?\b\d+(?:\.\d+)?(?:px|em|rem|%|vh|vw|s|ms|deg|fr)?'),
+        (KEYWORD, r'!important'),
+        (FUNCTION, r'\b[\w-]+(?=\()'),
+    ],
+    'sql': [
+        (COMMENT, r'--[^\n]*|/\*[\s\S]*?\*/'),
+        (STRING, SINGLE_QUOTED),
+        (KEYWORD, r'(?i)' + words(
+            'select from where and or not insert into values update set delete create table index view drop alter '
+            'add join left right inner outer on group by order having limit offset as distinct union all primary '
+            'key foreign references default null is in like between case when then else end returning exists'
+        )),
+        (NUMBER, NUMBER_PATTERN),
+        (FUNCTION, CALL_PATTERN),
+    ],
+    'html': [
+        (COMMENT, r'<!--[\s\S]*?-->'),
+        (META, r'<!DOCTYPE[^>]*>'),
+        (TAG, r'</?[\w:-]+|/?>'),
+        (ATTRIBUTE, r'(?<=\s)[\w:@.-]+(?==)'),
+        (STRING, DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+    ],
+}
+ALIASES = {
+    'py': 'python', 'js': 'javascript', 'jsx': 'javascript', 'ts': 'javascript', 'tsx': 'javascript',
+    'typescript': 'javascript', 'node': 'javascript', 'sh': 'bash', 'shell': 'bash', 'zsh': 'bash',
+    'console': 'bash', 'yml': 'yaml', 'docker': 'dockerfile', 'xml': 'html', 'svg': 'html', 'vue': 'html',
+    'scss': 'css', 'postgresql': 'sql', 'sqlite': 'sql',
+}
+
+BLOCK_PATTERN = re.compile(
+    r'(<pre\b([^>]*)>\s*<code\b([^>]*)>)(.*?)(</code>\s*</pre>)',
+    re.IGNORECASE | re.DOTALL
+)
+LANGUAGE_CLASS_PATTERN = re.compile(r'class\s*=\s*["\'][^"\']*\b(?:language|lang)-([\w+#-]+)', re.IGNORECASE)
+
+# First match wins when a block has no language class
+GUESSES = [
+    ('html', re.compile(r'^\s*<(?:!DOCTYPE|[a-zA-Z][\w-]*[\s>])')),
+    ('json', re.compile(r'^\s*[\[{]\s*"')),
+    ('dockerfile', re.compile(r'^FROM\s+\S+', re.MULTILINE)),
+    ('python', re.compile(
+        r'^\s*(?:def \w+\(.*\).*:|class \w+.*:|from [\w.]+ import |import [\w.]+(?: as \w+)?\s*$)', re.MULTILINE
+    )),
+    ('javascript', re.compile(r'\b(?:const|let|var|function)\s+\w+|=>|console\.log|require\(')),
+    ('bash', re.compile(r'^\s*(?:\$\s|#!/bin/|(?:sudo|npm|pip|docker|git|curl|cd|export)\s)', re.MULTILINE)),
+    ('sql', re.compile(r'^\s*(?:SELECT|INSERT|UPDATE|CREATE TABLE)\b', re.IGNORECASE | re.MULTILINE)),
+    # A lone "Note: ..." line is prose; yaml needs a document marker, or a key followed by another
+    # key or an indented list item
+    ('yaml', re.compile(r'^---\s*$|^[\w-]+:(?:[ \t].*)?\n(?:.*\n)*?\s*(?:[\w-]+:(?:\s|$)|- )', re.MULTILINE)),
+]
+
+
+def compile_language(rules):
+    """Join a language's rules into one alternation, so tokenizing is a single pass"""
+    flags, parts = re.MULTILINE, []
+    for index, (_, pattern) in enumerate(rules):
+        # Inline flags must lead the pattern; scope them to this rule instead
+        match = re.match(r'\(\?([a-zA-Z]+)\)', pattern)
+        if match:
+            pattern = f'(?{match.group(1).replace("m", "")}:{pattern[match.end():]})'
+        parts.append(f'(?P<t{index}>{pattern})')
+    return re.compile('|'.join(parts), flags), [token for token, _ in rules]
+
+
+COMPILED = {name: compile_language(rules) for name, rules in LANGUAGES.items()}
+
+
+def normalize_language(language):
+    language = (language or '').lower()
+    language = ALIASES.get(language, language)
+    return language if language in COMPILED else None
+
+
+def guess_language(code):
+    for language, pattern in GUESSES:
+        if pattern.search(code):
+            return language
+    return None
+
+
+def highlight(code, language=None):
+    """Return the HTML for code with its tokens wrapped in hl-* spans.
+
+    code is plain text; unknown languages are only escaped.
+    """
+    language = normalize_language(language) or guess_language(code)
+    if language is None:
+        return html.escape(code, quote=False)
+    pattern, tokens = COMPILED[language]
+    parts, position = [], 0
+    for match in pattern.finditer(code):
+        if match.start() == match.end():
+            continue
+        parts.append(html.escape(code[position:match.start()], quote=False))
+        token = tokens[int(match.lastgroup[1:])]
+        parts.append(f'<span class="{token}">{html.escape(match.group(), quote=False)}</span>')
+        position = match.end()
+    parts.append(html.escape(code[position:], quote=False))
+    return ''.join(parts)
+
+
+def block_language(pre_attributes, code_attributes):
+    match = LANGUAGE_CLASS_PATTERN.search(code_attributes) or LANGUAGE_CLASS_PATTERN.search(pre_attributes)
+    return match.group(1) if match else None
+
+
+class CodeHighlighter:
+    """Highlights <pre><code> blocks in pages, caching blocks by (language, code hash)"""
+
+    def __init__(self, root='.'):
+        self.root = root
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.cache = self.load_cache()
+        self.hits = 0
+        self.misses = 0
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('blocks', {})
+
+    def save_cache(self):
+        if not self.misses:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'blocks': self.cache}, f)
+
+    def highlight(self, code, language=None):
+        key = f"{language or ''}:{hashlib.sha256(code.encode('utf-8')).hexdigest()}"
+        highlighted = self.cache.pop(key, None)
+        if highlighted is None:
+            highlighted = highlight(code, language)
+            self.misses += 1
+            while len(self.cache) >= MAX_CACHE_ENTRIES:
+                del self.cache[next(iter(self.cache))]
+        else:
+            self.hits += 1
+        # Re-inserted so the dict stays in least-recently-used order
+        self.cache[key] = highlighted
+        return highlighted
+
+    def highlight_html(self, content):
+        """Return (content, number of blocks highlighted)"""
+        count = 0
+
+        def replace(match):
+            nonlocal count
+            opening, pre_attributes, code_attributes, code, closing = match.groups()
+            # Blocks with markup inside are already highlighted, or hand-formatted
+            if '<' in code:
+                return match.group(0)
+            language = block_language(pre_attributes, code_attributes)
+            highlighted = self.highlight(html.unescape(code), language)
+            # Code in an unknown language has no tokens, and stays as it was
+            if '<span' in highlighted:
+                count += 1
+            return opening + highlighted + closing
+
+        return BLOCK_PATTERN.sub(replace, content), count
+
+    def highlight_pages(self, paths=None):
+        """Highlight every deployed page (or paths); return {'pages': rewritten paths, 'blocks': count}"""
+        if paths is None:
+            paths = [path for path in discover_files(self.root) if path.endswith('.html')]
+        written, blocks = [], 0
+        for path in paths:
+            file_path = os.path.join(self.root, path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            if '<pre' not in content and '<PRE' not in content:
+                continue
+            highlighted, count = self.highlight_html(content)
+            blocks += count
+            if highlighted != content:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(highlighted)
+                written.append(path)
+        self.save_cache()
+        return {'pages': written, 'blocks': blocks}
+
+
+def highlight_site(root='.'):
+    """Highlight every page under root once; see CodeHighlighter.highlight_pages"""
+    return CodeHighlighter(root).highlight_pages()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Highlight <pre><code> blocks at build time')
+    parser.add_argument('--root', default='.', help='Website root directory (pages are rewritten in place)')
+    parser.add_argument('--language', help='Highlight stdin as this language and print the HTML instead')
+    args = parser.parse_args()
+
+    if args.language:
+        print(highlight(sys.stdin.read(), args.language))
+    else:
+        highlighter = CodeHighlighter(args.root)
+        result = highlighter.highlight_pages()
+        print(
+            f"🎨 Highlighted {result['blocks']} code blocks on {len(result['pages'])} pages "
+            f"({highlighter.misses} tokenized, {highlighter.hits} cached)"
+        )
@@ -8,6 +8,10 @@ const CONFIG = {
     // Google Apps Script Web App URL - updated deployment with CORS support
     GOOGLE_SCRIPT_URL: 'https://script.google.com/macros/s/AKfycbzqPRvpiCQM99uuIit1djETda_B1I0s-oAddIriRetY0_WHV7QhsVcOWv7S397wslKd/exec',
     
+    // Local stand-in served by dev-server.py (see unsubscribe_store.py)
+    LOCAL_URL: '/api/unsubscribe',
+    LOCAL_HOSTS: ['localhost', '127.0.0.1'],
+    
     // Spreadsheet configuration
     SPREADSHEET_ID: '1FaV09BMGFrcV7XkQijVIPkLYykafur_7p5IhC5kI510',
     
@@ -18,6 +22,11 @@ const CONFIG = {
     }
 };
 
+// The dev server answers locally, so unsubscribes can be tried without Google
+function serviceUrl() {
+    return CONFIG.LOCAL_HOSTS.includes(window.location.hostname) ? CONFIG.LOCAL_URL : CONFIG.GOOGLE_SCRIPT_URL;
+}
+
 // DOM Elements
 let form, loadingState, successMessage, errorMessage, unsubscribeForm;
 
@@ -95,7 +104,7 @@ async function handleUnsubscribe(event) {
 }
 
 async function checkEmailExists(email) {
-    const response = await fetch(CONFIG.GOOGLE_SCRIPT_URL, {
+    const response = await fetch(serviceUrl(), {
         method: 'POST',
         mode: 'cors',
         headers: {
@@ -118,7 +127,7 @@ async function checkEmailExists(email) {
 async function processUnsubscribe(email) {
     try {
         // Use a simple POST request without explicit CORS mode
-        const response = await fetch(CONFIG.GOOGLE_SCRIPT_URL, {
+        const response = await fetch(serviceUrl(), {
             method: 'POST',
             headers: {
                 'Content-Type': 'text/plain', // Use text/plain to avoid preflight
@@ -150,14 +159,15 @@ async function processUnsubscribe(email) {
         console.log('Primary request failed, trying fallback approach:', error);
         
         try {
-            // Fallback: Use form data approach
-            const formData = new FormData();
+            // Fallback: URL-encoded form fields, which Code.gs and the dev server both read
+            // (a URLSearchParams body is still a simple request, so there is no preflight)
+            const formData = new URLSearchParams();
             formData.append('email', email);
             formData.append('action', 'unsubscribe');
             formData.append('timestamp', new Date().toISOString());
             formData.append('source', 'website-unsubscribe-page-fallback');
             
-            const fallbackResponse = await fetch(CONFIG.GOOGLE_SCRIPT_URL, {
+            const fallbackResponse = await fetch(serviceUrl(), {
                 method: 'POST',
                 body: formData
             });
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Markdown compiler for Buildly articles.
+
+Compiles the Markdown body of an article (see article_store.py) into the
+HTML fragment that templates/articles/article.html wraps, using the same
+Tailwind classes as the hand-written articles. Besides headings, paragraphs,
+lists, links, images and emphasis it supports:
+
+- fenced code blocks: ```lang ... ``` becomes <pre><code class="language-lang">,
+  syntax-highlighted at compile time (see highlight_code.py)
+- pipe tables with an optional :---: alignment row
+- callouts: a blockquote that starts with [!NOTE], [!TIP], [!IMPORTANT],
+  [!WARNING] or [!CAUTION], rendered as a coloured panel
+- raw HTML: lines that start with a tag are passed through until a blank line
+
+Rendered fragments are cached in .markdown-cache.json by the SHA-256 of the
+Markdown source, so a build only compiles the documents that changed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from article_store import parse_front_matter
+from highlight_code import highlight
+
+CACHE_FILE = '.markdown-cache.json'
+
+# Bump when the generated markup changes so cached fragments are discarded
+CACHE_VERSION = 2
+
+# Fragments kept in the cache; the least recently used are dropped first
+MAX_CACHE_ENTRIES = 2048
+
+CLASSES = {
+    'h1': 'text-4xl font-bold text-buildly-dark mt-12 mb-6',
+    'h2': 'text-3xl font-bold text-buildly-dark mt-12 mb-6',
+    'h3': 'text-2xl font-semibold text-buildly-dark mt-8 mb-4',
+    'h4': 'text-xl font-semibold text-buildly-dark mt-6 mb-3',
+    'p': 'text-gray-700 mb-6',
+    'ul': 'list-disc pl-6 mb-6 text-gray-700',
+    'ol': 'list-decimal pl-6 mb-6 text-gray-700',
+    'li': 'mb-2',
+    'blockquote': 'border-l-4 border-gray-300 pl-6 my-6 italic text-gray-600',
+    'pre': 'bg-gray-100 rounded-lg p-6 mb-8 text-sm text-gray-700 overflow-x-auto',
+    'code': 'bg-gray-100 rounded px-1 text-sm',
+    'table': 'w-full mb-8 text-left text-gray-700 border-collapse',
+    'th': 'border-b-2 border-gray-300 px-4 py-2 font-semibold text-buildly-dark',
+    'td': 'border-b border-gray-200 px-4 py-2',
+    'a': 'text-buildly-primary hover:underline',
+    'img': 'rounded-lg my-6',
+    'hr': 'my-12 border-gray-200',
+}
+
+# Callout type -> (panel classes, text classes), as used in the hand-written articles
+CALLOUTS = {
+    'note': ('bg-blue-50 border-l-4 border-blue-400 p-6 my-6', 'text-blue-800'),
+    'tip': ('bg-green-50 border-l-4 border-green-400 p-6 my-6', 'text-green-800'),
+    'important': ('bg-purple-50 border-l-4 border-purple-400 p-6 my-6', 'text-purple-800'),
+    'warning': ('bg-orange-50 border-l-4 border-orange-400 p-6 my-6', 'text-orange-800'),
+    'caution': ('bg-red-50 border-l-4 border-red-400 p-6 my-6', 'text-red-800'),
+}
+ALIGN_CLASSES = {'left': 'text-left', 'center': 'text-center', 'right': 'text-right'}
+
+FENCE_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})\s*([\w+#.-]*)[^`]*$')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+HR_PATTERN = re.compile(r'^\s{0,3}([-*_])(\s*\1){2,}\s*$')
+LIST_PATTERN = re.compile(r'^(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$')
+QUOTE_PATTERN = re.compile(r'^\s{0,3}>\s?(.*)$')
+CALLOUT_PATTERN = re.compile(r'^\[!(\w+)\]\s*(.*)$')
+# GFM delimiter row: one or more dashes per cell, optionally colon-aligned (|:--|--:|, |-|-|)
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+HTML_BLOCK_PATTERN = re.compile(
+    r'^\s{0,3}(?:<!--|</?(?:div|section|article|aside|header|footer|nav|figure|figcaption|table|ul|ol|dl|'
+    r'p|h[1-6]|pre|blockquote|details|summary|form|iframe|video|audio|picture|hr|br|script|style)\b)',
+    re.IGNORECASE
+)
+
+# Inline spans that are set aside before escaping: code, autolinks and raw tags
+PROTECTED_PATTERN = re.compile(r'(`+)(.+?)\1|<(https?://[^\s>]+)>|(</?[A-Za-z][\w-]*(?:\s[^<>]*)?/?>)')
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+&quot;(.*?)&quot;)?\)')
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)\s]+)(?:\s+&quot;(.*?)&quot;)?\)')
+STRONG_PATTERN = re.compile(r'(\*\*|__)(?=\S)(.+?)(?<=\S)\1')
+EMPHASIS_PATTERN = re.compile(r'(?<![\w*])([*_])(?=\S)(.+?)(?<=\S)\1(?![\w*])')
+STRIKE_PATTERN = re.compile(r'~~(?=\S)(.+?)(?<=\S)~~')
+PLACEHOLDER_PATTERN = re.compile('\x00(\\d+)\x00')
+SLUG_PATTERN = re.compile(r'[^a-z0-9]+')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def escape(value):
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def attribute(name, tag):
+    return f' {name}="{CLASSES[tag]}"' if tag in CLASSES else ''
+
+
+def render_inline(text):
+    """Render the inline Markdown of one paragraph, heading or cell"""
+    protected = []
+
+    def protect(match):
+        ticks, code, url, tag = match.groups()
+        if ticks:
+            html = f'<code class="{CLASSES["code"]}">{escape(code.strip())}</code>'
+        elif url:
+            html = f'<a href="{escape(url)}" class="{CLASSES["a"]}">{escape(url)}</a>'
+        else:
+            html = tag
+        return hold(html)
+
+    def hold(html):
+        protected.append(html)
+        return f'\x00{len(protected) - 1}\x00'
+
+    text = escape(PROTECTED_PATTERN.sub(protect, text))
+    # Images and links are set aside too, so emphasis never applies inside their URLs
+    text = IMAGE_PATTERN.sub(
+        lambda m: hold(
+            f'<img src="{m.group(2)}" alt="{m.group(1)}"' + (f' title="{m.group(3)}"' if m.group(3) else '')
+            + f' class="{CLASSES["img"]}" loading="lazy">'
+        ),
+        text
+    )
+    text = LINK_PATTERN.sub(
+        lambda m: hold(
+            f'<a href="{m.group(2)}"' + (f' title="{m.group(3)}"' if m.group(3) else '')
+            + f' class="{CLASSES["a"]}">{emphasize(m.group(1))}</a>'
+        ),
+        text
+    )
+    text = emphasize(text)
+    # Two trailing spaces, or a backslash, end a line with a hard break
+    text = re.sub(r'(?: {2,}|\\)\n', '<br>\n', text)
+    while PLACEHOLDER_PATTERN.search(text):
+        text = PLACEHOLDER_PATTERN.sub(lambda m: protected[int(m.group(1))], text)
+    return text
+
+
+def emphasize(text):
+    text = STRONG_PATTERN.sub(r'<strong>\2</strong>', text)
+    text = EMPHASIS_PATTERN.sub(r'<em>\2</em>', text)
+    return STRIKE_PATTERN.sub(r'<del>\1</del>', text)
+
+
+def heading_id(text):
+    return SLUG_PATTERN.sub('-', TAG_PATTERN.sub('', text).lower()).strip('-')
+
+
+def split_row(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    cells = re.split(r'(?<!\\)\|', line)
+    return [cell.strip().replace('\\|', '|') for cell in cells]
+
+
+def dedent(lines, width):
+    return [line[width:] if line[:width].strip() == '' else line.lstrip() for line in lines]
+
+
+class BlockCompiler:
+    """Turns Markdown lines into a list of HTML blocks"""
+
+    def __init__(self, paragraph_class=None):
+        self.paragraph_class = paragraph_class or CLASSES['p']
+
+    def compile(self, lines):
+        blocks, i = [], 0
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                i += 1
+                continue
+            for block in (self.fence, self.heading, self.rule, self.table, self.quote, self.listing, self.html):
+                result = block(lines, i)
+                if result is not None:
+                    html, i = result
+                    blocks.append(html)
+                    break
+            else:
+                html, i = self.paragraph(lines, i)
+                blocks.append(html)
+        return blocks
+
+    def starts_block(self, lines, i):
+        line = lines[i]
+        return bool(
+            FENCE_PATTERN.match(line) or HEADING_PATTERN.match(line) or HR_PATTERN.match(line)
+            or QUOTE_PATTERN.match(line) or LIST_PATTERN.match(line) or HTML_BLOCK_PATTERN.match(line)
+            or self.is_table(lines, i)
+        )
+
+    def fence(self, lines, i):
+        match = FENCE_PATTERN.match(lines[i])
+        if not match:
+            return None
+        indent, marker, language = len(match.group(1)), match.group(2), match.group(3)
+        code, j = [], i + 1
+        while j < len(lines) and not lines[j].strip().startswith(marker):
+            code.append(lines[j][indent:] if lines[j][:indent].strip() == '' else lines[j].lstrip())
+            j += 1
+        language_class = f' class="language-{escape(language.lower())}"' if language else ''
+        html = f'<pre{attribute("class", "pre")}><code{language_class}>{highlight(chr(10).join(code), language or None)}</code></pre>'
+        return html, j + 1
+
+    def heading(self, lines, i):
+        match = HEADING_PATTERN.match(lines[i])
+        if not match:
+            return None
+        level = min(len(match.group(1)), 4)
+        text = render_inline(match.group(2))
+        tag = f'h{level}'
+        return f'<{tag} id="{heading_id(text)}"{attribute("class", tag)}>{text}</{tag}>', i + 1
+
+    def rule(self, lines, i):
+        if not HR_PATTERN.match(lines[i]):
+            return None
+        return f'<hr{attribute("class", "hr")}>', i + 1
+
+    def is_table(self, lines, i):
+        return (
+            '|' in lines[i] and i + 1 < len(lines)
+            and bool(TABLE_SEPARATOR_PATTERN.match(lines[i + 1])) and '|' in lines[i + 1] + lines[i]
+            # As in GFM, the delimiter row must have one cell per header cell
+            and len(split_row(lines[i + 1])) == len(split_row(lines[i]))
+        )
+
+    def table(self, lines, i):
+        if not self.is_table(lines, i):
+            return None
+        header = split_row(lines[i])
+        aligns = []
+        for cell in split_row(lines[i + 1]):
+            if cell.startswith(':') and cell.endswith(':'):
+                aligns.append('center')
+            elif cell.endswith(':'):
+                aligns.append('right')
+            else:
+                aligns.append('left' if cell.startswith(':') else None)
+
+        def cells(row, tag):
+            out = []
+            for index in range(len(header)):
+                value = row[index] if index < len(row) else ''
+                align = aligns[index] if index < len(aligns) else None
+                classes = CLASSES[tag] + (f' {ALIGN_CLASSES[align]}' if align else '')
+                out.append(f'<{tag} class="{classes}">{render_inline(value)}</{tag}>')
+            return ''.join(out)
+
+        rows, j = [], i + 2
+        while j < len(lines) and lines[j].strip() and '|' in lines[j]:
+            rows.append(f'<tr>{cells(split_row(lines[j]), "td")}</tr>')
+            j += 1
+        html = (
+            f'<div class="overflow-x-auto"><table{attribute("class", "table")}>\n'
+            f'<thead><tr>{cells(header, "th")}</tr></thead>\n'
+            f'<tbody>\n' + '\n'.join(rows) + ('\n' if rows else '') + '</tbody>\n</table></div>'
+        )
+        return html, j
+
+    def quote(self, lines, i):
+        if not QUOTE_PATTERN.match(lines[i]):
+            return None
+        inner, j = [], i
+        while j < len(lines) and lines[j].strip():
+            match = QUOTE_PATTERN.match(lines[j])
+            # Lines without > continue the quote's last paragraph
+            inner.append(match.group(1) if match else lines[j])
+            j += 1
+
+        callout = CALLOUT_PATTERN.match(inner[0].strip())
+        if callout and callout.group(1).lower() in CALLOUTS:
+            panel, text_class = CALLOUTS[callout.group(1).lower()]
+            title = callout.group(2).strip()
+            blocks = BlockCompiler(f'{text_class} font-medium mb-2').compile(inner[1:])
+            if title:
+                blocks.insert(0, f'<p class="{text_class} font-semibold mb-2">{render_inline(title)}</p>')
+            return f'<div class="{panel}">\n' + '\n'.join(blocks) + '\n</div>', j
+
+        blocks = BlockCompiler('mb-2').compile(inner)
+        return f'<blockquote{attribute("class", "blockquote")}>\n' + '\n'.join(blocks) + '\n</blockquote>', j
+
+    def listing(self, lines, i):
+        match = LIST_PATTERN.match(lines[i])
+        if not match:
+            return None
+        indent = len(match.group(1))
+        ordered = match.group(2)[0].isdigit()
+        items, j = [], i
+        while j < len(lines):
+            match = LIST_PATTERN.match(lines[j])
+            if not match or len(match.group(1)) != indent or match.group(2)[0].isdigit() != ordered:
+                break
+            width = len(match.group(0)) - len(match.group(3))
+            item, j = [match.group(3)], j + 1
+            while j < len(lines):
+                line = lines[j]
+                if not line.strip():
+                    # A blank line ends the list unless the item continues below it
+                    if j + 1 < len(lines) and len(lines[j + 1]) - len(lines[j + 1].lstrip()) > indent:
+                        item.append('')
+                        j += 1
+                        continue
+                    break
+                nested = LIST_PATTERN.match(line)
+                if nested and len(nested.group(1)) <= indent:
+                    break
+                if not nested and len(line) - len(line.lstrip()) <= indent and self.starts_block(lines, j):
+                    break
+                item.append(line)
+                j += 1
+            items.append(self.list_item(dedent(item[:1], 0) + dedent(item[1:], width)))
+            if j < len(lines) and not lines[j].strip():
+                break
+
+        tag = 'ol' if ordered else 'ul'
+        start = ''
+        first = LIST_PATTERN.match(lines[i]).group(2)
+        if ordered and int(first[:-1]) != 1:
+            start = f' start="{int(first[:-1])}"'
+        return f'<{tag}{start}{attribute("class", tag)}>\n' + '\n'.join(items) + f'\n</{tag}>', j
+
+    def list_item(self, lines):
+        text, k = [], 0
+        while k < len(lines) and lines[k].strip() and (k == 0 or not self.starts_block(lines, k)):
+            text.append(lines[k])
+            k += 1
+        html = render_inline('\n'.join(text).strip())
+        rest = BlockCompiler(CLASSES['p']).compile(lines[k:])
+        if rest:
+            html += '\n' + '\n'.join(rest)
+        return f'<li{attribute("class", "li")}>{html}</li>'
+
+    def html(self, lines, i):
+        if not HTML_BLOCK_PATTERN.match(lines[i]):
+            return None
+        j = i
+        while j < len(lines) and lines[j].strip():
+            j += 1
+        return '\n'.join(lines[i:j]), j
+
+    def paragraph(self, lines, i):
+        text, j = [lines[i]], i + 1
+        while j < len(lines) and lines[j].strip() and not self.starts_block(lines, j):
+            text.append(lines[j])
+            j += 1
+        content = render_inline('\n'.join(line.strip() for line in text))
+        return f'<p class="{self.paragraph_class}">{content}</p>', j
+
+
+def compile_markdown(text):
+    """Compile a Markdown document into an HTML fragment"""
+    lines = text.replace('\r\n', '\n').replace('\t', '    ').split('\n')
+    return '\n\n'.join(BlockCompiler().compile(lines))
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class MarkdownCompiler:
+    """compile_markdown with rendered fragments cached by content hash.
+
+    With root=None the cache is kept in memory only.
+    """
+
+    def __init__(self, root='.'):
+        self.cache_path = os.path.join(root, CACHE_FILE) if root is not None else None
+        self.cache = self.load_cache()
+        self.hits = 0
+        self.misses = 0
+
+    def load_cache(self):
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('fragments', {})
+
+    def save_cache(self):
+        if self.cache_path is None or not self.misses:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'fragments': self.cache}, f)
+
+    def render(self, text):
+        key = content_hash(text)
+        html = self.cache.pop(key, None)
+        if html is None:
+            html = compile_markdown(text)
+            self.misses += 1
+            while len(self.cache) >= MAX_CACHE_ENTRIES:
+                del self.cache[next(iter(self.cache))]
+        else:
+            self.hits += 1
+        # Re-inserted so the dict stays in least-recently-used order
+        self.cache[key] = html
+        return html
+
+    def stats(self):
+        return {'fragments': len(self.cache), 'hits': self.hits, 'misses': self.misses}
+
+
+def render_markdown(text, root='.'):
+    """Render one document through the on-disk cache"""
+    compiler = MarkdownCompiler(root)
+    html = compiler.render(text)
+    compiler.save_cache()
+    return html
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile a Markdown article body into HTML')
+    parser.add_argument('source', nargs='?', help='Markdown file (default: stdin); front matter is skipped')
+    args = parser.parse_args()
+
+    if args.source:
+        with open(args.source, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = sys.stdin.read()
+    if text.startswith('---'):
+        text = parse_front_matter(text)[1]
+    print(compile_markdown(text))
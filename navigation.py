@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Site navigation rendering for the Buildly website.
+
+Builds the desktop and mobile nav links from .navigation-config.json and
+splices them into the pages that carry the full navigation bar. Used by the
+dev server's /admin/save-navigation endpoint and by the build pipeline.
+
+The configuration is validated against ITEM_SCHEMA and compiled once into
+its desktop and mobile fragments plus a content hash; NavigationCache only
+recompiles it when the file's mtime or size changes.
+
+Links are spliced between <!-- navigation-desktop:start --> and
+<!-- navigation-desktop:end --> (and the mobile equivalents) by offset, so
+nested markup in the nav bar is safe; pages without markers are reported
+rather than guessed at; a page without a region's container at all (most
+pages have no mobile menu) simply has nothing to update there.
+`--add-markers` wraps an existing nav container in its markers once.
+
+An item with `children` renders as a dropdown in the desktop bar (the
+Products menu) and as its child links in the mobile menu.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import threading
+
+NAVIGATION_CONFIG_FILE = '.navigation-config.json'
+
+# Pages whose navigation bar is rewritten when the configuration changes
+NAVIGATION_FILES = ['index.html', 'labs.html', 'use-cases.html', 'pricing.html', 'articles.html', 'team.html', 'rad-core.html']
+
+# The links of each region sit between a pair of comment markers inside the
+# region's container; add_markers wraps a container's existing content once
+NAV_REGIONS = {
+    'desktop': '<div class="ml-10 flex items-baseline space-x-4">',
+    'mobile': '<div class="px-2 pt-2 pb-3 space-y-1 sm:px-3">',
+}
+DIV_TAG_PATTERN = re.compile(r'<(/?)div\b', re.IGNORECASE)
+
+ITEM_TYPES = ('internal', 'external', 'cta')
+
+# field -> (accepted types, required, default); other fields are kept but not used
+ITEM_SCHEMA = {
+    'id': ((int, str), False, None),
+    'label': ((str,), True, None),
+    # Required unless the item has children
+    'href': ((str,), False, None),
+    'type': ((str,), False, 'internal'),
+    'order': ((int, float), False, 0),
+    'showInDesktop': ((bool,), False, True),
+    'showInMobile': ((bool,), False, True),
+    'children': ((list,), False, None),
+}
+CHILD_FIELDS = ('label', 'href')
+
+DESKTOP_LINK_CLASSES = {
+    'cta': 'bg-buildly-primary text-white px-4 py-2 rounded-md text-sm font-medium hover:bg-buildly-secondary transition-colors',
+    'link': 'text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors',
+}
+MOBILE_LINK_CLASSES = 'text-gray-700 hover:text-buildly-primary block px-3 py-2 rounded-md text-base font-medium'
+DROPDOWN_BUTTON_CLASSES = 'text-gray-700 hover:text-buildly-primary px-3 py-2 rounded-md text-sm font-medium transition-colors flex items-center'
+DROPDOWN_MENU_CLASSES = (
+    'absolute left-0 mt-2 w-56 rounded-md shadow-lg bg-white ring-1 ring-black ring-opacity-5 opacity-0 '
+    'invisible group-hover:opacity-100 group-hover:visible transition-all duration-200 z-10'
+)
+DROPDOWN_LINK_CLASSES = 'block px-4 py-2 text-sm text-gray-700 hover:bg-buildly-light'
+DROPDOWN_ICON = (
+    '<svg class="ml-1 h-3 w-3" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n'
+    '    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 9l-7 7-7-7" />\n'
+    '</svg>'
+)
+
+
+class NavigationError(ValueError):
+    """The navigation configuration does not match ITEM_SCHEMA"""
+
+
+def validate_navigation(navigation_items):
+    """Return the items with defaults filled in, or raise NavigationError listing every problem"""
+    if not isinstance(navigation_items, list):
+        raise NavigationError('navigation must be a list of items')
+    problems, items = [], []
+    for index, item in enumerate(navigation_items, start=1):
+        if not isinstance(item, dict):
+            problems.append(f'item {index}: must be an object')
+            continue
+        normalized = dict(item)
+        for field, (types, required, default) in ITEM_SCHEMA.items():
+            value = item.get(field)
+            if value is None:
+                if required:
+                    problems.append(f'item {index}: {field} is required')
+                elif default is not None:
+                    normalized[field] = default
+                continue
+            # bool is an int subclass, so it has to be ruled out explicitly for numbers
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                expected = ' or '.join(t.__name__ for t in types)
+                problems.append(f'item {index}: {field} must be {expected}, not {type(value).__name__}')
+        if isinstance(item.get('label'), str) and not item['label'].strip():
+            problems.append(f'item {index}: label must not be empty')
+        children = item.get('children')
+        if item.get('href') is None and not children:
+            problems.append(f'item {index}: href is required')
+        for position, child in enumerate(children if isinstance(children, list) else [], start=1):
+            if not isinstance(child, dict):
+                problems.append(f'item {index} child {position}: must be an object')
+                continue
+            for field in CHILD_FIELDS:
+                if not isinstance(child.get(field), str) or not child[field].strip():
+                    problems.append(f'item {index} child {position}: {field} must be a non-empty string')
+        if normalized.get('type') not in ITEM_TYPES and isinstance(normalized.get('type'), str):
+            problems.append(f"item {index}: type must be one of {', '.join(ITEM_TYPES)}")
+        items.append(normalized)
+    if problems:
+        raise NavigationError('; '.join(problems))
+    return items
+
+
+def load_navigation(root='.'):
+    """Return the saved, validated navigation items, or None if there is no configuration"""
+    try:
+        with open(os.path.join(root, NAVIGATION_CONFIG_FILE), 'r', encoding='utf-8') as f:
+            return validate_navigation(json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def indent_lines(text, indent='    '):
+    return '\n'.join(indent + line for line in text.split('\n'))
+
+
+def render_dropdown(item):
+    """Return a desktop dropdown (button plus hover menu of child links) as one multi-line fragment"""
+    links = '\n'.join(
+        f'<a href="{html.escape(child["href"])}" class="{DROPDOWN_LINK_CLASSES}">{html.escape(child["label"])}</a>'
+        for child in item['children']
+    )
+    return '\n'.join([
+        '<div class="relative group">',
+        indent_lines(f'<button class="{DROPDOWN_BUTTON_CLASSES}">'),
+        indent_lines(html.escape(item['label']), ' ' * 8),
+        indent_lines(DROPDOWN_ICON, ' ' * 8),
+        indent_lines('</button>'),
+        indent_lines(f'<div class="{DROPDOWN_MENU_CLASSES}">'),
+        indent_lines('<div class="py-1">', ' ' * 8),
+        indent_lines(links, ' ' * 12),
+        indent_lines('</div>', ' ' * 8),
+        indent_lines('</div>'),
+        '</div>',
+    ])
+
+
+def render_desktop_nav(navigation_items):
+    """Return the desktop navigation as a list of <a> tags and dropdown fragments"""
+    desktop_nav_items = [item for item in navigation_items if item.get('showInDesktop', True)]
+    desktop_nav_items.sort(key=lambda x: x.get('order', 0))
+
+    desktop_nav_html = []
+    for item in desktop_nav_items:
+        if item.get('children'):
+            desktop_nav_html.append(render_dropdown(item))
+            continue
+        label = html.escape(item.get('label', ''))
+        href = html.escape(item.get('href', ''))
+        classes = DESKTOP_LINK_CLASSES['cta' if item.get('type', 'internal') == 'cta' else 'link']
+        desktop_nav_html.append(f'<a href="{href}" class="{classes}">{label}</a>')
+    return desktop_nav_html
+
+
+def render_mobile_nav(navigation_items):
+    """Return the mobile navigation links as a list of <a> tags; dropdowns contribute their children"""
+    mobile_nav_items = [item for item in navigation_items if item.get('showInMobile', True)]
+    mobile_nav_items.sort(key=lambda x: x.get('order', 0))
+
+    mobile_nav_html = []
+    for item in mobile_nav_items:
+        for link in item.get('children') or [item]:
+            label = html.escape(link.get('label', ''))
+            href = html.escape(link.get('href', ''))
+            mobile_nav_html.append(f'<a href="{href}" class="{MOBILE_LINK_CLASSES}">{label}</a>')
+    return mobile_nav_html
+
+
+class CompiledNavigation:
+    """Validated navigation items with their desktop and mobile fragments rendered once"""
+
+    def __init__(self, navigation_items):
+        self.items = validate_navigation(navigation_items)
+        self.desktop = render_desktop_nav(self.items)
+        self.mobile = render_mobile_nav(self.items)
+        digest = hashlib.sha256()
+        for fragment in (json.dumps(self.items, sort_keys=True), *self.desktop, '\0', *self.mobile):
+            digest.update(fragment.encode('utf-8'))
+            digest.update(b'\n')
+        self.hash = digest.hexdigest()[:16]
+
+    def describe(self):
+        return {'items': self.items, 'desktop': self.desktop, 'mobile': self.mobile, 'hash': self.hash}
+
+
+class NavigationCache:
+    """The compiled navigation for root, recompiled only when the config file changes"""
+
+    def __init__(self, root='.'):
+        self.path = os.path.join(root, NAVIGATION_CONFIG_FILE)
+        self.lock = threading.Lock()
+        self.signature = None
+        self.compiled = None
+
+    def get(self):
+        """Return the CompiledNavigation, or None if there is no configuration.
+
+        Raises NavigationError (or json.JSONDecodeError) for an invalid file.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            with self.lock:
+                self.signature = self.compiled = None
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            if signature != self.signature:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.compiled = CompiledNavigation(json.load(f))
+                self.signature = signature
+            return self.compiled
+
+    def save(self, navigation_items):
+        """Validate, write and compile a new configuration; return the CompiledNavigation"""
+        compiled = CompiledNavigation(navigation_items)
+        with self.lock:
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(navigation_items, f, indent=2)
+            os.replace(tmp_path, self.path)
+            stat = os.stat(self.path)
+            self.signature = (stat.st_mtime_ns, stat.st_size)
+            self.compiled = compiled
+        return compiled
+
+
+def region_markers(name):
+    return f'<!-- navigation-{name}:start -->', f'<!-- navigation-{name}:end -->'
+
+
+def line_indent(content, offset):
+    """The whitespace that starts the line containing offset"""
+    line_start = content.rfind('\n', 0, offset) + 1
+    line = content[line_start:offset]
+    return line[:len(line) - len(line.lstrip())]
+
+
+def find_region(content, name):
+    """Return the (start, end) offsets between a region's markers, or None if either is missing"""
+    start_marker, end_marker = region_markers(name)
+    start = content.find(start_marker)
+    if start < 0:
+        return None
+    start += len(start_marker)
+    end = content.find(end_marker, start)
+    if end < 0:
+        return None
+    return start, content.rfind('\n', start, end) + 1 or end
+
+
+def splice_navigation(content, regions):
+    """Replace the links of each {region name: [<a> tags]}; return (content, names missing markers)
+
+    Every region is located with two str.find calls and the page is rebuilt from
+    slices once, so the cost is linear in the page size whatever the nav holds.
+    Only regions whose container is on the page count as missing markers.
+    """
+    spans, missing = [], []
+    for name, links in regions.items():
+        span = find_region(content, name)
+        if span is None:
+            if NAV_REGIONS[name] in content:
+                missing.append(name)
+            continue
+        indent = line_indent(content, span[0])
+        spans.append((span, ''.join(f'{indent_lines(link, indent)}\n' for link in links)))
+
+    parts, position = [], 0
+    for (start, end), replacement in sorted(spans):
+        # The links go on their own lines, up to the start of the end marker's line
+        parts += [content[position:start], '\n', replacement]
+        position = end
+    parts.append(content[position:])
+    return ''.join(parts) if spans else content, missing
+
+
+def container_end(content, start):
+    """Offset of the </div> that closes the <div> opening at start, counting nested divs"""
+    depth = 0
+    for match in DIV_TAG_PATTERN.finditer(content, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.start()
+    return -1
+
+
+def add_markers(content):
+    """Wrap the contents of each region's container in its markers; return (content, names added)"""
+    added = []
+    for name, opening in NAV_REGIONS.items():
+        if find_region(content, name) is not None:
+            continue
+        start = content.find(opening)
+        if start < 0:
+            continue
+        end = container_end(content, start)
+        if end < 0:
+            continue
+        inner_start = start + len(opening)
+        indent = line_indent(content, start) + '    '
+        inner = content[inner_start:end].rstrip()
+        start_marker, end_marker = region_markers(name)
+        content = (
+            f'{content[:inner_start]}\n{indent}{start_marker}{inner}\n{indent}{end_marker}'
+            f'\n{line_indent(content, end)}{content[end:]}'
+        )
+        added.append(name)
+    return content, added
+
+
+def update_navigation_in_file(file_path, desktop_nav_html, mobile_nav_html):
+    """Splice the navigation links into one page; return (changed, region names missing markers)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    content, missing = splice_navigation(original, {'desktop': desktop_nav_html, 'mobile': mobile_nav_html})
+    if content == original:
+        return False, missing
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True, missing
+
+
+def update_navigation_in_files(navigation_items, root='.', files=NAVIGATION_FILES):
+    """Rewrite the navigation in every page under root.
+
+    navigation_items may be a CompiledNavigation, whose fragments are reused.
+    Returns {'updated': [pages], 'missing': {page: [regions without markers]}}.
+    """
+    compiled = navigation_items if isinstance(navigation_items, CompiledNavigation) else CompiledNavigation(navigation_items)
+    updated, missing = [], {}
+    for file_path in files:
+        full_path = os.path.join(root, file_path)
+        if not os.path.exists(full_path):
+            continue
+        changed, regions = update_navigation_in_file(full_path, compiled.desktop, compiled.mobile)
+        if changed:
+            updated.append(file_path)
+        if regions:
+            missing[file_path] = regions
+    return {'updated': updated, 'missing': missing}
+
+
+def add_markers_to_files(root='.', files=NAVIGATION_FILES):
+    """Add missing region markers to pages under root; return {page: [regions added]}"""
+    added = {}
+    for file_path in files:
+        full_path = os.path.join(root, file_path)
+        if not os.path.exists(full_path):
+            continue
+        with open(full_path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        content, names = add_markers(original)
+        if names:
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            added[file_path] = names
+    return added
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rewrite page navigation from .navigation-config.json')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--add-markers', action='store_true', help='Wrap existing nav containers in region markers first')
+    args = parser.parse_args()
+
+    if args.add_markers:
+        for file_path, names in add_markers_to_files(args.root).items():
+            print(f"🔖 Added {', '.join(names)} markers to {file_path}")
+
+    try:
+        compiled = NavigationCache(args.root).get()
+    except NavigationError as e:
+        parser.exit(1, f"❌ Invalid {NAVIGATION_CONFIG_FILE}: {e}\n")
+    if compiled is None:
+        print(f"⚠️  No {NAVIGATION_CONFIG_FILE} found, nothing to do")
+    else:
+        result = update_navigation_in_files(compiled, args.root)
+        for file_path, regions in result['missing'].items():
+            print(f"⚠️  {file_path}: no {', '.join(regions)} navigation markers")
+        print(f"🧭 Navigation updated in {len(result['updated'])} files (navigation {compiled.hash})")
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Open Graph social card images for Buildly articles.
+
+Each article gets a 1200x630 PNG with its category (in the colour from
+generate_articles.get_category_color), its title and the Buildly logo, drawn
+with the standard library only: the text comes from a pre-rasterized glyph
+atlas in media/fonts/og-card-font.png and the PNGs are decoded and encoded
+with zlib. Cards are rendered in a process pool.
+
+A card's file name carries the hash of everything drawn on it
+(media/og/<slug>-<hash>.png), so an existing file is the cache: only new or
+retitled articles are rendered again, and a changed card gets a new URL
+that social networks have not cached. The article's og:image and
+twitter:image tags are pointed at the card.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from article_store import ArticleStore
+from generate_articles import get_category_color
+from generate_feeds import SITE_URL
+from social_publisher import share_title
+
+CARD_WIDTH = 1200
+CARD_HEIGHT = 630
+OUTPUT_DIR = 'media/og'
+
+# Bump when the card layout changes so every card is rendered again
+CARD_VERSION = 1
+
+FONT_IMAGE = 'media/fonts/og-card-font.png'
+FONT_METRICS = 'media/fonts/og-card-font.json'
+LOGO_IMAGE = 'media/buildly-rabbit-square-transparent copy 2.png'
+
+# Tailwind buildly-* colours, as configured in buildly-head.js
+COLORS = {
+    'primary': (0x1b, 0x5f, 0xa3),
+    'secondary': (0x14, 0x4a, 0x84),
+    'accent': (0xf9, 0x94, 0x3b),
+    'dark': (0x1f, 0x29, 0x37),
+    'white': (0xff, 0xff, 0xff),
+    'muted': (0x9c, 0xa3, 0xaf),
+}
+
+MARGIN = 80
+STRIPE_HEIGHT = 16
+TITLE_TOP = 176
+TITLE_LINES = 4
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+
+OG_IMAGE_PATTERN = re.compile(r'(<meta\s+property="og:image"\s+content=")[^"]*(")')
+OG_IMAGE_SIZE_PATTERN = re.compile(r'<meta\s+property="og:image:width"')
+TWITTER_IMAGE_PATTERN = re.compile(r'(<meta\s+(?:name|property)="twitter:image"\s+content=")[^"]*(")')
+
+
+def read_png(path):
+    """Decode an 8-bit, non-interlaced PNG; return (width, height, channels, pixel bytes)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f'{path} is not a PNG')
+    position, chunks, header = len(PNG_SIGNATURE), [], None
+    while position < len(data):
+        length, kind = struct.unpack('>I4s', data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        position += 12 + length
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif kind == b'IDAT':
+            chunks.append(body)
+        elif kind == b'IEND':
+            break
+    width, height, depth, color_type, _, _, interlace = header
+    if depth != 8 or interlace or color_type not in PNG_CHANNELS:
+        raise ValueError(f'{path}: only 8-bit non-interlaced grey, RGB and RGBA PNGs are supported')
+
+    channels = PNG_CHANNELS[color_type]
+    stride = width * channels
+    raw = zlib.decompress(b''.join(chunks))
+    pixels = bytearray(stride * height)
+    previous = bytearray(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        kind, row = raw[start], bytearray(raw[start + 1:start + 1 + stride])
+        if kind == 1:
+            for i in range(channels, stride):
+                row[i] = (row[i] + row[i - channels]) & 0xff
+        elif kind == 2:
+            for i in range(stride):
+                row[i] = (row[i] + previous[i]) & 0xff
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i - channels] if i >= channels else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xff
+        elif kind == 4:
+            for i in range(stride):
+                a = row[i - channels] if i >= channels else 0
+                b = previous[i]
+                c = previous[i - channels] if i >= channels else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                row[i] = (row[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xff
+        pixels[y * stride:(y + 1) * stride] = row
+        previous = row
+    return width, height, channels, pixels
+
+
+def png_chunk(kind, body):
+    return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+
+def encode_png(width, height, pixels):
+    """Encode RGB pixels as a PNG"""
+    stride = width * 3
+    raw = b''.join(b'\x00' + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    return b''.join([
+        PNG_SIGNATURE,
+        png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)),
+        png_chunk(b'IDAT', zlib.compress(raw, 9)),
+        png_chunk(b'IEND', b''),
+    ])
+
+
+class Canvas:
+    """An RGB image with just enough drawing for a social card"""
+
+    def __init__(self, width, height, background):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes(background) * (width * height))
+
+    def fill_rect(self, x, y, width, height, color, radius=0):
+        """Fill a rectangle, with corners rounded to radius"""
+        for row in range(max(y, 0), min(y + height, self.height)):
+            inset = 0
+            if radius:
+                dy = max(radius - (row - y) - 0.5, (row - y) + 0.5 - (height - radius), 0)
+                inset = round(radius - math.sqrt(max(radius * radius - dy * dy, 0)))
+            left, right = max(x + inset, 0), min(x + width - inset, self.width)
+            if right > left:
+                start = (row * self.width + left) * 3
+                self.pixels[start:start + (right - left) * 3] = bytes(color) * (right - left)
+
+    def blend(self, x, y, width, height, alpha_at, color_at):
+        """Blend width x height pixels at (x, y); alpha_at/color_at take (column, row) in the source"""
+        pixels = self.pixels
+        for row in range(height):
+            target_y = y + row
+            if not 0 <= target_y < self.height:
+                continue
+            for column in range(width):
+                target_x = x + column
+                alpha = alpha_at(column, row)
+                if not alpha or not 0 <= target_x < self.width:
+                    continue
+                offset = (target_y * self.width + target_x) * 3
+                color = color_at(column, row)
+                if alpha == 255:
+                    pixels[offset:offset + 3] = bytes(color)
+                else:
+                    for channel in range(3):
+                        pixels[offset + channel] += (color[channel] - pixels[offset + channel]) * alpha // 255
+
+    def png(self):
+        return encode_png(self.width, self.height, self.pixels)
+
+
+class BitmapFont:
+    """One size from the glyph atlas"""
+
+    def __init__(self, atlas, metrics):
+        self.atlas_width, _, _, self.atlas = atlas
+        self.glyphs = metrics['glyphs']
+        self.ascent = metrics['ascent']
+        self.line_height = metrics['line_height']
+
+    def glyph(self, char):
+        return self.glyphs.get(char) or self.glyphs['?']
+
+    def measure(self, text):
+        return sum(self.glyph(char)[6] for char in text)
+
+    def draw(self, canvas, text, x, y, color):
+        """Draw text with its top (not baseline) at y; return the x after the last glyph"""
+        atlas, atlas_width = self.atlas, self.atlas_width
+        for char in text:
+            gx, gy, width, height, left, top, advance = self.glyph(char)
+            if width and height:
+                canvas.blend(
+                    x + left, y + top, width, height,
+                    lambda column, row: atlas[(gy + row) * atlas_width + gx + column],
+                    lambda column, row: color
+                )
+            x += advance
+        return x
+
+    def wrap(self, text, max_width, max_lines):
+        """Break text into at most max_lines lines, ending the last with … if it was cut"""
+        lines, line = [], ''
+        words = text.split()
+        for index, word in enumerate(words):
+            candidate = f'{line} {word}' if line else word
+            if self.measure(candidate) <= max_width or not line:
+                line = candidate
+                continue
+            lines.append(line)
+            line = word
+            if len(lines) == max_lines:
+                line = ' '.join([lines.pop()] + words[index:])
+                break
+        lines.append(line)
+        last = lines[-1]
+        if self.measure(last) > max_width:
+            while last and self.measure(last + '…') > max_width:
+                last = last[:-1].rstrip()
+            lines[-1] = last + '…'
+        return lines
+
+
+@lru_cache(maxsize=None)
+def load_assets(root):
+    """The fonts and logo, loaded once per worker process"""
+    atlas = read_png(os.path.join(root, FONT_IMAGE))
+    with open(os.path.join(root, FONT_METRICS), 'r', encoding='utf-8') as f:
+        metrics = json.load(f)
+    fonts = {name: BitmapFont(atlas, size) for name, size in metrics['sizes'].items()}
+    return fonts, read_png(os.path.join(root, LOGO_IMAGE))
+
+
+def assets_hash(root):
+    digest = hashlib.sha256()
+    for path in (FONT_IMAGE, FONT_METRICS, LOGO_IMAGE):
+        with open(os.path.join(root, path), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def render_card(spec):
+    """Render one card from {'root', 'title', 'category', 'color'}; return PNG bytes"""
+    fonts, logo = load_assets(spec['root'])
+    title_font, label_font = fonts['title'], fonts['label']
+    accent = COLORS[spec['color']]
+    canvas = Canvas(CARD_WIDTH, CARD_HEIGHT, COLORS['dark'])
+    canvas.fill_rect(0, 0, CARD_WIDTH, STRIPE_HEIGHT, accent)
+
+    if spec['category']:
+        label = spec['category'].upper()
+        padding, height = 20, label_font.line_height + 16
+        width = label_font.measure(label) + padding * 2
+        canvas.fill_rect(MARGIN, 96, width, height, accent, radius=height // 2)
+        label_font.draw(canvas, label, MARGIN + padding, 96 + (height - label_font.line_height) // 2 + 4, COLORS['white'])
+
+    y = TITLE_TOP
+    for line in title_font.wrap(spec['title'], CARD_WIDTH - MARGIN * 2, TITLE_LINES):
+        title_font.draw(canvas, line, MARGIN, y, COLORS['white'])
+        y += title_font.line_height
+
+    logo_width, logo_height, channels, logo_pixels = logo
+    logo_y = CARD_HEIGHT - MARGIN // 2 - logo_height
+    canvas.blend(
+        MARGIN, logo_y, logo_width, logo_height,
+        lambda column, row: logo_pixels[(row * logo_width + column) * channels + channels - 1] if channels in (2, 4) else 255,
+        lambda column, row: tuple(logo_pixels[(row * logo_width + column) * channels + c] for c in (0, 1, 2)) if channels >= 3
+        else (logo_pixels[(row * logo_width + column) * channels],) * 3
+    )
+    domain = SITE_URL.split('://', 1)[-1]
+    label_font.draw(
+        canvas, domain,
+        CARD_WIDTH - MARGIN - label_font.measure(domain), logo_y + logo_height - label_font.line_height,
+        COLORS['muted']
+    )
+    return canvas.png()
+
+
+def set_og_image(content, url):
+    """Point og:image (and twitter:image, if present) at url, adding og:image when missing"""
+    size_tags = (
+        f'<meta property="og:image:width" content="{CARD_WIDTH}">\n'
+        f'    <meta property="og:image:height" content="{CARD_HEIGHT}">'
+    )
+    if OG_IMAGE_PATTERN.search(content):
+        content = OG_IMAGE_PATTERN.sub(lambda match: f'{match.group(1)}{url}{match.group(2)}', content, count=1)
+        if not OG_IMAGE_SIZE_PATTERN.search(content):
+            end = content.index('>', OG_IMAGE_PATTERN.search(content).end()) + 1
+            content = f'{content[:end]}\n    {size_tags}{content[end:]}'
+    elif '</head>' in content:
+        content = content.replace('</head>', f'    <meta property="og:image" content="{url}">\n    {size_tags}\n</head>', 1)
+    return TWITTER_IMAGE_PATTERN.sub(lambda match: f'{match.group(1)}{url}{match.group(2)}', content)
+
+
+class CardBuilder:
+    """Renders missing cards for an article store and points the article pages at them"""
+
+    def __init__(self, root='.', workers=None):
+        self.root = root
+        self.workers = workers
+
+    def card_spec(self, article, assets):
+        topic = article.get('topic') or article.get('category')
+        spec = {
+            'root': os.path.abspath(self.root),
+            'title': share_title(article),
+            'category': article.get('category') or '',
+            'color': get_category_color(topic),
+        }
+        key = json.dumps([CARD_VERSION, assets, spec['title'], spec['category'], spec['color']])
+        return spec, hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]
+
+    def update(self, store=None):
+        """Render new cards, drop replaced ones and update og:image tags
+
+        Returns {'cards': count, 'rendered': [paths], 'removed': [paths], 'pages': [changed pages]}.
+        """
+        if store is None:
+            store = ArticleStore(self.root)
+        store.refresh()
+        assets = assets_hash(self.root)
+        output_dir = os.path.join(self.root, OUTPUT_DIR)
+        os.makedirs(output_dir, exist_ok=True)
+
+        cards, missing = {}, []
+        for article in store.all():
+            spec, digest = self.card_spec(article, assets)
+            path = f"{OUTPUT_DIR}/{article['slug']}-{digest}.png"
+            cards[article['filename']] = path
+            if not os.path.exists(os.path.join(self.root, path)):
+                missing.append((path, spec))
+
+        if missing:
+            specs = [spec for _, spec in missing]
+            if len(missing) == 1 or self.workers == 1:
+                images = [render_card(spec) for spec in specs]
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                    images = list(executor.map(render_card, specs, chunksize=max(1, len(specs) // 16)))
+            for (path, _), image in zip(missing, images):
+                with open(os.path.join(self.root, path), 'wb') as f:
+                    f.write(image)
+
+        current = {os.path.basename(path) for path in cards.values()}
+        removed = []
+        for name in sorted(os.listdir(output_dir)):
+            if name.endswith('.png') and name not in current:
+                os.remove(os.path.join(output_dir, name))
+                removed.append(f'{OUTPUT_DIR}/{name}')
+
+        pages = []
+        for filename, path in cards.items():
+            page = os.path.join(self.root, filename)
+            try:
+                with open(page, 'r', encoding='utf-8') as f:
+                    original = f.read()
+            except FileNotFoundError:
+                continue
+            content = set_og_image(original, f'{SITE_URL}/{path}')
+            if content != original:
+                with open(page, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                pages.append(filename)
+        return {'cards': len(cards), 'rendered': [path for path, _ in missing], 'removed': removed, 'pages': pages}
+
+
+def build_og_cards(root='.', workers=None):
+    """Render and link every article's card once; see CardBuilder.update"""
+    return CardBuilder(root, workers).update()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render Open Graph cards for articles and link them from og:image')
+    parser.add_argument('--root', default='.', help='Website root directory (pages are rewritten in place)')
+    parser.add_argument('--workers', type=int, default=None, help='Render processes (default: one per CPU)')
+    parser.add_argument('--preview', nargs=2, metavar=('TITLE', 'OUTPUT'), help='Render one card to OUTPUT and exit')
+    parser.add_argument('--category', default='Software Development', help='Category for --preview')
+    args = parser.parse_args()
+
+    if args.preview:
+        title, output = args.preview
+        spec = {'root': os.path.abspath(args.root), 'title': title, 'category': args.category, 'color': 'primary'}
+        with open(output, 'wb') as f:
+            f.write(render_card(spec))
+        print(f"🖼️  Wrote {output}")
+    else:
+        result = build_og_cards(args.root, args.workers)
+        print(
+            f"🖼️  {result['cards']} cards: {len(result['rendered'])} rendered, {len(result['removed'])} removed, "
+            f"{len(result['pages'])} pages updated"
+        )
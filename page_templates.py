@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Page templates for pages created from the admin.
+
+Templates are plain HTML files under templates/ with {{ name }} placeholders
+(HTML-escaped), {{ name|raw }} placeholders (inserted as-is) and
+{{> path/to/partial.html }} includes. Each file is compiled once into its
+static segments and placeholder slots, so rendering is a single join; the
+compiled template is reused until the file, or a partial it includes, changes
+mtime or size.
+
+Page types are registered in templates/pages/page-types.json: each names its
+content template plus description and keyword templates, and every page is
+wrapped in the shared layout. Adding a page type means adding a template file
+and an entry there, with no server code to change.
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+
+PAGE_TEMPLATES_DIR = 'templates/pages'
+PAGE_TYPES_FILE = 'templates/pages/page-types.json'
+SITE_URL = 'https://www.buildly.io'
+
+# {{ name }}, {{ name|raw }} and {{> path/to/partial.html }}
+TAG_PATTERN = re.compile(r'\{\{\s*(?:>\s*([\w./-]+)|([A-Za-z_]\w*)\s*(\|\s*raw\s*)?)\s*\}\}')
+
+# Rendered outputs kept per partial that has placeholders of its own
+PARTIAL_CACHE_SIZE = 256
+
+
+def escape(value):
+    """Escape a value for HTML text and double-quoted attributes"""
+    return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+class Template:
+    """A template pre-split into static segments and placeholder slots.
+
+    Partials without placeholders are spliced into the static segments when
+    the template is compiled. Partials with placeholders become slots of
+    their own, rendered once per distinct set of input values.
+    """
+
+    def __init__(self, text, name='<string>', autoescape=True, partials=None):
+        self.name = name
+        self.autoescape = autoescape
+        self.segments = []
+        # (field name, raw, partial template); name is None for partial slots
+        self.slots = []
+        self.fields = set()
+        self.dependencies = set()
+        self.cache = {}
+        pending, position = [], 0
+        for match in TAG_PATTERN.finditer(text):
+            pending.append(text[position:match.start()])
+            position = match.end()
+            partial_name, field, raw = match.groups()
+            if partial_name:
+                if partials is None:
+                    raise ValueError(f'{name}: partial {partial_name} used without a loader')
+                partial = partials(partial_name)
+                self.dependencies.add(partial_name)
+                self.dependencies.update(partial.dependencies)
+                if not partial.slots:
+                    pending.append(partial.segments[0])
+                    continue
+                self.fields.update(partial.fields)
+                self.slots.append((None, True, partial))
+            else:
+                self.fields.add(field)
+                self.slots.append((field, bool(raw) or not autoescape, None))
+            self.segments.append(''.join(pending))
+            pending = []
+        pending.append(text[position:])
+        self.segments.append(''.join(pending))
+        self.cache_key = tuple(sorted(self.fields))
+
+    def render(self, context):
+        parts = [self.segments[0]]
+        for (name, raw, partial), segment in zip(self.slots, self.segments[1:]):
+            if partial is not None:
+                parts.append(partial.render_cached(context))
+            else:
+                try:
+                    value = context[name]
+                except KeyError:
+                    raise KeyError(f'{self.name}: no value for {{{{ {name} }}}}') from None
+                parts.append(str(value) if raw else escape(value))
+            parts.append(segment)
+        return ''.join(parts)
+
+    def render_cached(self, context):
+        """Render as a partial, reusing the output for inputs seen before"""
+        key = tuple(context.get(field) for field in self.cache_key)
+        html = self.cache.get(key)
+        if html is None:
+            if len(self.cache) >= PARTIAL_CACHE_SIZE:
+                self.cache.clear()
+            html = self.cache[key] = self.render(context)
+        return html
+
+
+def compile_template(text, name='<string>', autoescape=True, partials=None):
+    """Compile template text; one trailing newline is dropped, as files end with one.
+
+    partials(path) returns the compiled template for a {{> path }} tag.
+    """
+    if text.endswith('\n'):
+        text = text[:-1]
+    return Template(text, name, autoescape, partials)
+
+
+class TemplateLoader:
+    """Compiles template files on first use and recompiles them when they change"""
+
+    def __init__(self, root='.'):
+        self.root = root
+        self.lock = threading.Lock()
+        self.compiled = {}
+        self.hits = 0
+        self.misses = 0
+
+    def signature(self, path):
+        stat = os.stat(os.path.join(self.root, path))
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self, path, compiler=None):
+        """Return the compiled form of path; compiler(text, path) builds it on a miss.
+
+        A compiled template is stale when its file or any partial it includes changed.
+        """
+        compiler = compiler or self.compile
+        with self.lock:
+            cached = self.compiled.get(path)
+        if cached is not None and all(self.signature(name) == signature for name, signature in cached[0].items()):
+            with self.lock:
+                self.hits += 1
+            return cached[1]
+        signatures = {path: self.signature(path)}
+        with open(os.path.join(self.root, path), 'r', encoding='utf-8') as f:
+            compiled = compiler(f.read(), path)
+        for name in getattr(compiled, 'dependencies', ()):
+            signatures[name] = self.signature(name)
+        with self.lock:
+            self.compiled[path] = (signatures, compiled)
+            self.misses += 1
+        return compiled
+
+    def compile(self, text, path):
+        return compile_template(text, path, partials=self.get)
+
+    def get(self, path):
+        return self.load(path)
+
+    def stats(self):
+        with self.lock:
+            return {'templates': len(self.compiled), 'hits': self.hits, 'misses': self.misses}
+
+
+def compile_page_types(text, name):
+    """Parse page-types.json and compile its description and keyword templates.
+
+    These render plain text, which the layout escapes where it is inserted.
+    """
+    config = json.loads(text)
+    types = {}
+    for page_type, entry in config['types'].items():
+        description = entry.get('description', '{{ title }}')
+        keywords = entry.get('keywords', '{{ title_lower }}')
+        types[page_type] = {
+            'label': entry.get('label', page_type),
+            'template': entry['template'],
+            'description': compile_template(description, f'{name}:{page_type}.description', autoescape=False),
+            'keywords': compile_template(keywords, f'{name}:{page_type}.keywords', autoescape=False),
+        }
+    default = config.get('default', 'basic')
+    if default not in types:
+        raise ValueError(f'{name}: default page type {default!r} is not registered')
+    return {'layout': config.get('layout', 'layout.html'), 'default': default, 'types': types}
+
+
+class PageTemplates:
+    """Renders new pages from the page types registered in PAGE_TYPES_FILE"""
+
+    def __init__(self, root='.', loader=None):
+        self.root = root
+        self.loader = loader or TemplateLoader(root)
+
+    def registry(self):
+        return self.loader.load(PAGE_TYPES_FILE, compile_page_types)
+
+    def page_types(self):
+        """Return [{'type', 'label'}] in registration order"""
+        registry = self.registry()
+        return [
+            {'type': page_type, 'label': entry['label'], 'default': page_type == registry['default']}
+            for page_type, entry in registry['types'].items()
+        ]
+
+    def render(self, title, filename, page_type):
+        """Render a complete page; unknown page types fall back to the default type"""
+        registry = self.registry()
+        entry = registry['types'].get(page_type) or registry['types'][registry['default']]
+        context = {
+            'title': title,
+            'title_lower': title.lower(),
+            'filename': filename,
+            'url': f'{SITE_URL}/{filename}',
+        }
+        context['description'] = entry['description'].render(context)
+        context['keywords'] = entry['keywords'].render(context)
+        context['content'] = self.loader.get(f"{PAGE_TEMPLATES_DIR}/{entry['template']}").render(context)
+        return self.loader.get(f"{PAGE_TEMPLATES_DIR}/{registry['layout']}").render(context)
+
+
+def render_page(title, filename, page_type, root='.'):
+    """Render one page with a throwaway loader; see PageTemplates.render"""
+    return PageTemplates(root).render(title, filename, page_type)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render a new page from the registered page templates')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--list', action='store_true', help='List the registered page types')
+    parser.add_argument('--type', default=None, help='Page type (default: the registry default)')
+    parser.add_argument('--title', help='Page title')
+    parser.add_argument('--output', help='Write the page here, relative to root')
+    args = parser.parse_args()
+
+    templates = PageTemplates(args.root)
+    if args.list or not (args.title and args.output):
+        for entry in templates.page_types():
+            print(f"{entry['type']:<16} {entry['label']}{' (default)' if entry['default'] else ''}")
+    else:
+        filename = args.output if args.output.endswith('.html') else f'{args.output}.html'
+        file_path = os.path.join(args.root, filename)
+        if os.path.exists(file_path):
+            parser.error(f'{filename} already exists')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(templates.render(args.title, filename, args.type or ''))
+        print(f"📄 Created {filename}")
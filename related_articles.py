@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Related-article links for the Buildly blog.
+
+Every article is turned into a TF-IDF vector over its title, keywords,
+description and body text. Similar articles are found through an inverted
+index (term -> articles that use it), so each article is only scored against
+the articles it shares terms with instead of against the whole corpus. Term
+counts are cached in .related-cache.json by mtime and size, so only changed
+articles are re-tokenized on the next run.
+
+The top-k related articles are written into each article page between
+<!-- related-articles:start --> and <!-- related-articles:end --> markers.
+Pages without markers get a new section before the footer, unless they
+already have a hand-curated "Related Articles" section, which is left alone.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+
+from article_store import ArticleStore
+
+CACHE_FILE = '.related-cache.json'
+DEFAULT_K = 3
+
+# Bump when tokenization changes so cached term counts are rebuilt
+CACHE_VERSION = 1
+
+# How much a term counts depending on where it appears
+FIELD_WEIGHTS = {'title': 3, 'keywords': 3, 'description': 2, 'body': 1}
+
+# Only an article's strongest terms are used to find candidates and score them
+MAX_TERMS = 40
+
+MARKER_START = '<!-- related-articles:start -->'
+MARKER_END = '<!-- related-articles:end -->'
+
+STOP_WORDS = frozenset('''
+    about above after again against all also and any are because been before being below between both but can
+    could did does doing down during each few for from further had has have having her here hers herself him
+    himself his how into its itself just more most much must not now off once only other our ours ourselves out
+    over own same she should some such than that the their theirs them themselves then there these they this
+    those through too under until very was were what when where which while who whom why will with would you
+    your yours yourself yourselves buildly read more www http https html com use using used new one two get
+    like make may many way well want need help also every across within without even still
+'''.split())
+
+TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9+#]*(?:-[a-z0-9]+)*')
+MARKED_BLOCK_PATTERN = re.compile(re.escape(MARKER_START) + r'.*?' + re.escape(MARKER_END), re.DOTALL)
+CURATED_SECTION_PATTERN = re.compile(r'<!--\s*Related Articles\s*-->.*?</section>', re.IGNORECASE | re.DOTALL)
+NON_CONTENT_PATTERN = re.compile(
+    r'<(script|style|nav|footer|head)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL
+)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+ENTITY_PATTERN = re.compile(r'&[a-z#0-9]+;', re.IGNORECASE)
+INSERT_BEFORE = ('<!-- Footer -->', '<footer', '</body>')
+
+
+def tokenize(text):
+    """Lower-case words of three or more letters, minus stop words"""
+    return [
+        token for token in TOKEN_PATTERN.findall(ENTITY_PATTERN.sub(' ', (text or '').lower()))
+        if len(token) > 2 and token not in STOP_WORDS
+    ]
+
+
+def page_text(content):
+    """Visible article text, without navigation, footer or related-article blocks"""
+    content = MARKED_BLOCK_PATTERN.sub(' ', content)
+    content = CURATED_SECTION_PATTERN.sub(' ', content)
+    content = NON_CONTENT_PATTERN.sub(' ', content)
+    return TAG_PATTERN.sub(' ', content)
+
+
+def term_counts(article, content):
+    """Weighted term counts for one article"""
+    counts = Counter()
+    fields = {
+        'title': article['title'],
+        'keywords': article['keywords'].replace(',', ' '),
+        'description': article['description'],
+        'body': page_text(content),
+    }
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            counts[token] += weight
+    return counts
+
+
+class RelatedIndex:
+    """TF-IDF similarity over the article corpus with a per-article term cache"""
+
+    def __init__(self, root='.', k=DEFAULT_K):
+        self.root = root
+        self.k = k
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.documents = self.load_cache()
+        self.articles = {}
+        self.related = {}
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('documents', {})
+
+    def save_cache(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'documents': self.documents}, f)
+
+    def update(self, index=None):
+        """Re-tokenize changed articles and recompute related lists; return the re-tokenized filenames"""
+        if index is None:
+            index = ArticleStore(self.root)
+        index.refresh()
+        self.articles = {article['filename']: article for article in index.all()}
+
+        changed = []
+        for filename, article in self.articles.items():
+            signature = [article['mtime'], article['size']]
+            cached = self.documents.get(filename)
+            if cached is not None and cached['signature'] == signature:
+                continue
+            with open(os.path.join(self.root, filename), 'r', encoding='utf-8') as f:
+                content = f.read()
+            self.documents[filename] = {'signature': signature, 'terms': term_counts(article, content)}
+            changed.append(filename)
+        for filename in list(self.documents):
+            if filename not in self.articles:
+                del self.documents[filename]
+                changed.append(filename)
+
+        self.compute()
+        self.save_cache()
+        return changed
+
+    def vectors(self):
+        """Return {filename: {term: weight}}, L2-normalized and pruned to MAX_TERMS"""
+        document_count = len(self.documents)
+        document_frequency = Counter()
+        for document in self.documents.values():
+            document_frequency.update(document['terms'].keys())
+
+        vectors = {}
+        for filename, document in self.documents.items():
+            weights = {
+                term: (1 + math.log(count)) * math.log((1 + document_count) / (1 + document_frequency[term]))
+                for term, count in document['terms'].items()
+            }
+            top = heapq.nlargest(MAX_TERMS, weights.items(), key=lambda item: (item[1], item[0]))
+            norm = math.sqrt(sum(weight * weight for _, weight in top)) or 1.0
+            vectors[filename] = {term: weight / norm for term, weight in top if weight > 0}
+        return vectors
+
+    def compute(self):
+        """Score every article against those it shares terms with and keep the top k"""
+        vectors = self.vectors()
+        postings = defaultdict(list)
+        for filename, vector in vectors.items():
+            for term, weight in vector.items():
+                postings[term].append((filename, weight))
+
+        self.related = {}
+        for filename, vector in vectors.items():
+            scores = defaultdict(float)
+            for term, weight in vector.items():
+                for other, other_weight in postings[term]:
+                    if other != filename:
+                        scores[other] += weight * other_weight
+            top = heapq.nsmallest(self.k, scores.items(), key=lambda item: (-item[1], item[0]))
+            self.related[filename] = [(other, round(score, 4)) for other, score in top if score > 0]
+
+    def related_articles(self, filename):
+        """Return the article records most similar to filename, best first"""
+        return [self.articles[other] for other, _ in self.related.get(filename, []) if other in self.articles]
+
+
+def render_related_section(articles):
+    """Render the related-articles block, markers included"""
+    cards = []
+    for article in articles:
+        description = article['description']
+        if len(description) > 120:
+            description = description[:120] + '...'
+        cards.append(f'''                <div class="bg-white rounded-xl p-6 shadow-sm hover:shadow-lg transition-shadow">
+                    <div class="flex items-center gap-2 mb-3">
+                        <span class="bg-buildly-primary text-white px-2 py-1 rounded text-xs">{article['category']}</span>
+                    </div>
+                    <h4 class="text-lg font-semibold mb-2">{article['title']}</h4>
+                    <p class="text-gray-600 text-sm mb-4">{description}</p>
+                    <a href="{article['slug']}.html" class="text-buildly-primary font-medium hover:text-buildly-secondary">Read More →</a>
+                </div>''')
+    if not cards:
+        return f'{MARKER_START}\n    {MARKER_END}'
+    return f'''{MARKER_START}
+    <!-- Related Articles -->
+    <section class="py-16 bg-buildly-light">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <h2 class="text-3xl font-bold text-buildly-dark mb-8 text-center">Related Articles</h2>
+            <div class="grid md:grid-cols-3 gap-8">
+{chr(10).join(cards)}
+            </div>
+        </div>
+    </section>
+    {MARKER_END}'''
+
+
+def inject_related(content, articles):
+    """Return content with its related-articles block filled in, or unchanged if curated by hand"""
+    section = render_related_section(articles)
+    if MARKER_START in content and MARKER_END in content:
+        return MARKED_BLOCK_PATTERN.sub(lambda match: section, content, count=1)
+    if CURATED_SECTION_PATTERN.search(content):
+        return content
+    for anchor in INSERT_BEFORE:
+        position = content.find(anchor)
+        if position != -1:
+            return content[:position] + section + '\n\n    ' + content[position:]
+    return content
+
+
+def write_related_links(root='.', k=DEFAULT_K, index=None):
+    """Update the related index and inject links into every article; return the pages rewritten"""
+    related = RelatedIndex(root, k)
+    related.update(index)
+    written = []
+    for filename in sorted(related.articles):
+        file_path = os.path.join(root, filename)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        updated = inject_related(content, related.related_articles(filename))
+        if updated != content:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(updated)
+            written.append(filename)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inject related-article links into articles/')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('-k', type=int, default=DEFAULT_K, help='Number of related articles per page')
+    parser.add_argument('--show', action='store_true', help='Print the related articles instead of writing pages')
+    args = parser.parse_args()
+
+    if args.show:
+        related = RelatedIndex(args.root, args.k)
+        related.update()
+        for filename in sorted(related.related):
+            print(filename)
+            for other, score in related.related[filename]:
+                print(f'    {score:.3f}  {other}')
+    else:
+        written = write_related_links(args.root, args.k)
+        print(f"🔗 Related articles injected into {len(written)} pages")
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Server-side publishing queue for article share posts.
+
+Share posts for LinkedIn, Bluesky and Mastodon are rendered in one batch from
+the templates in .social-accounts.json and queued with an id derived from the
+platform and the article URL, so an article is never posted twice to the same
+platform. A worker sends due posts while honouring each platform's rate limit
+(posts per window plus a minimum interval), retries network errors, 408, 429
+and 5xx answers with exponential backoff (or the server's Retry-After), and
+gives up on other client errors; any other exception from the transport
+fails the post rather than stopping the worker. Queue state lives in .social-queue.json and
+is rewritten after every change, so a restart picks up where it left off.
+
+An account is only posted to when it has a `token` or an `endpoint`;
+`endpoint` replaces the platform's API URL, e.g. with a local stub server,
+and `rate_limit` ({"posts", "window", "interval"}) overrides the defaults.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+from article_store import ArticleStore
+from generate_feeds import SITE_URL
+
+ACCOUNTS_FILE = '.social-accounts.json'
+STATE_FILE = '.social-queue.json'
+
+# Bump when the state layout changes; older state is discarded
+STATE_VERSION = 1
+
+# platform -> post length limit and default rate limit
+PLATFORMS = {
+    'linkedin': {'max_length': 3000, 'rate_limit': {'posts': 20, 'window': 3600, 'interval': 30}},
+    'bluesky': {'max_length': 300, 'rate_limit': {'posts': 30, 'window': 300, 'interval': 5}},
+    'mastodon': {'max_length': 500, 'rate_limit': {'posts': 300, 'window': 10800, 'interval': 5}},
+}
+
+DEFAULT_TEMPLATE = '{title} {url}'
+TITLE_SUFFIXES = (' | Buildly', ' - Buildly')
+
+REQUEST_TIMEOUT = 10
+MAX_ATTEMPTS = 5
+RETRY_BASE = 30
+RETRY_MAX = 3600
+RETRYABLE_STATUS = {408, 429}
+
+PENDING, SENDING, SENT, FAILED, CANCELLED = 'pending', 'sending', 'sent', 'failed', 'cancelled'
+
+# Console prefix per level for print_log
+LOG_ICONS = {'info': '📣', 'warning': '⚠️ ', 'error': '❌'}
+
+
+class PublishError(Exception):
+    """A platform rejected a post; retry_after is None when retrying will not help"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TemplateFields(dict):
+    """Leaves unknown {placeholders} in a template as they are"""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def share_title(article):
+    title = article.get('title') or ''
+    for suffix in TITLE_SUFFIXES:
+        if title.endswith(suffix):
+            return title[:-len(suffix)]
+    return title
+
+
+def article_url(article):
+    return f"{SITE_URL}/{article['filename']}"
+
+
+def render_text(template, article, max_length):
+    """Fill in a share template, shortening the title (never the URL) to fit max_length"""
+    fields = TemplateFields(
+        title=share_title(article),
+        url=article_url(article),
+        description=article.get('description') or '',
+        category=article.get('category') or '',
+    )
+    text = template.format_map(fields)
+    overflow = len(text) - max_length
+    if overflow > 0 and '{title}' in template:
+        title = fields['title']
+        fields['title'] = title[:max(0, len(title) - overflow - 1)].rstrip() + '…'
+        text = template.format_map(fields)
+    return text[:max_length]
+
+
+def post_id(platform, url):
+    return hashlib.sha256(f'{platform}\0{url}'.encode('utf-8')).hexdigest()[:16]
+
+
+def is_configured(account):
+    return bool(account.get('token') or account.get('endpoint'))
+
+
+def render_posts(articles, accounts, platforms=None):
+    """Render the share post for every article on every configured platform, in one pass"""
+    posts = []
+    for platform in platforms or PLATFORMS:
+        account = accounts.get(platform) or {}
+        if platform not in PLATFORMS or not is_configured(account):
+            continue
+        template = account.get('template') or DEFAULT_TEMPLATE
+        max_length = PLATFORMS[platform]['max_length']
+        for article in articles:
+            url = article_url(article)
+            posts.append({
+                'id': post_id(platform, url),
+                'platform': platform,
+                'article': article['filename'],
+                'url': url,
+                'text': render_text(template, article, max_length),
+            })
+    return posts
+
+
+def linkedin_request(account, post):
+    body = {
+        'author': f"urn:li:organization:{account.get('company', '')}",
+        'lifecycleState': 'PUBLISHED',
+        'specificContent': {
+            'com.linkedin.ugc.ShareContent': {
+                'shareCommentary': {'text': post['text']},
+                'shareMediaCategory': 'ARTICLE',
+                'media': [{'status': 'READY', 'originalUrl': post['url']}],
+            }
+        },
+        'visibility': {'com.linkedin.ugc.MemberNetworkVisibility': 'PUBLIC'},
+    }
+    return 'https://api.linkedin.com/v2/ugcPosts', body, {'X-Restli-Protocol-Version': '2.0.0'}
+
+
+def bluesky_request(account, post):
+    body = {
+        'repo': account.get('handle', ''),
+        'collection': 'app.bsky.feed.post',
+        'record': {
+            '$type': 'app.bsky.feed.post',
+            'text': post['text'],
+            'createdAt': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        },
+    }
+    service = account.get('service', 'https://bsky.social').rstrip('/')
+    return f'{service}/xrpc/com.atproto.repo.createRecord', body, {}
+
+
+def mastodon_request(account, post):
+    # Mastodon drops a repeated Idempotency-Key, which covers a crash between send and save
+    return (
+        f"https://{account.get('instance', '')}/api/v1/statuses",
+        {'status': post['text']},
+        {'Idempotency-Key': post['id']},
+    )
+
+
+REQUEST_BUILDERS = {
+    'linkedin': linkedin_request,
+    'bluesky': bluesky_request,
+    'mastodon': mastodon_request,
+}
+
+
+def send_post(account, post):
+    """POST one share post to its platform; return the platform's response, or raise PublishError"""
+    url, body, headers = REQUEST_BUILDERS[post['platform']](account, post)
+    request = urllib.request.Request(
+        account.get('endpoint') or url,
+        data=json.dumps(body).encode('utf-8'),
+        headers={'Content-Type': 'application/json', **headers},
+        method='POST'
+    )
+    if account.get('token'):
+        request.add_header('Authorization', f"Bearer {account['token']}")
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            payload = response.read()
+    except urllib.error.HTTPError as e:
+        message = f'HTTP {e.code}: {e.read(500).decode("utf-8", "replace")}'
+        if e.code in RETRYABLE_STATUS or e.code >= 500:
+            retry_after = e.headers.get('Retry-After', '')
+            raise PublishError(message, float(retry_after) if retry_after.isdigit() else 0)
+        raise PublishError(message)
+    except (urllib.error.URLError, TimeoutError, OSError) as e:
+        raise PublishError(str(getattr(e, 'reason', e)), 0)
+    try:
+        result = json.loads(payload or b'{}')
+    except json.JSONDecodeError:
+        return {}
+    return result if isinstance(result, dict) else {}
+
+
+def print_log(level, event, message, **fields):
+    """Default logger for command-line runs; the dev server passes its event log instead"""
+    print(f'{LOG_ICONS[level]} {message}')
+
+
+def backoff_delay(attempts):
+    """Exponential backoff with up to 25% jitter, so retries on one platform spread out"""
+    delay = min(RETRY_BASE * 2 ** (attempts - 1), RETRY_MAX)
+    return delay * (1 + random.random() / 4)
+
+
+class SocialPublisher:
+    """The persisted queue of share posts and the worker that sends them"""
+
+    def __init__(self, root='.', transport=send_post, clock=time.time, log=print_log):
+        self.root = root
+        self.state_path = os.path.join(root, STATE_FILE)
+        self.accounts_path = os.path.join(root, ACCOUNTS_FILE)
+        self.transport = transport
+        self.clock = clock
+        # Called as log(level, event, message, **fields)
+        self.log = log
+        self.condition = threading.Condition()
+        self.thread = None
+        self.load_state()
+
+    def load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        if state.get('version') != STATE_VERSION:
+            state = {}
+        # None until the first enqueue_new, which records the existing articles as already shared
+        self.seen = set(state['seen']) if state.get('seen') is not None else None
+        self.posts = state.get('posts', {})
+        self.attempts = state.get('attempts', {})
+        stale = [post for post in self.posts.values() if post['status'] == SENDING]
+        for post in stale:
+            # A send that was cut short by a restart is retried
+            post['status'] = PENDING
+        if stale:
+            self.save_state()
+
+    def save_state(self):
+        state = {
+            'version': STATE_VERSION,
+            'seen': sorted(self.seen) if self.seen is not None else None,
+            'posts': self.posts,
+            'attempts': self.attempts,
+        }
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=1)
+        os.replace(tmp_path, self.state_path)
+
+    def accounts(self):
+        try:
+            with open(self.accounts_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def rate_limit(self, platform, account):
+        return {**PLATFORMS[platform]['rate_limit'], **(account.get('rate_limit') or {})}
+
+    def enqueue(self, articles, platforms=None):
+        """Render and queue posts for articles; return the queued and duplicate post ids"""
+        accounts = self.accounts()
+        queued, duplicates = [], []
+        now = self.clock()
+        with self.condition:
+            for post in render_posts(articles, accounts, platforms):
+                if post['id'] in self.posts:
+                    duplicates.append(post['id'])
+                    continue
+                self.posts[post['id']] = {
+                    **post,
+                    'status': PENDING,
+                    'attempts': 0,
+                    'created': now,
+                    'next_attempt': now,
+                    'error': None,
+                    'response': None,
+                }
+                queued.append(post['id'])
+            if self.seen is not None:
+                self.seen.update(article['filename'] for article in articles)
+            self.save_state()
+            self.condition.notify()
+        unconfigured = sorted(
+            platform for platform in platforms or PLATFORMS
+            if platform in PLATFORMS and not is_configured(accounts.get(platform) or {})
+        )
+        return {'queued': queued, 'duplicates': duplicates, 'unconfigured': unconfigured}
+
+    def enqueue_new(self, store):
+        """Queue posts for articles not seen before.
+
+        The first call only records the current articles, so turning the queue
+        on does not re-share the whole back catalogue.
+        """
+        store.refresh()
+        articles = store.all()
+        with self.condition:
+            if self.seen is None:
+                self.seen = {article['filename'] for article in articles}
+                self.save_state()
+                return {'queued': [], 'duplicates': [], 'unconfigured': [], 'baseline': len(self.seen)}
+            new = [article for article in articles if article['filename'] not in self.seen]
+        return self.enqueue(new)
+
+    def allowed_at(self, platform, account, now):
+        """When the platform's rate limit next allows a request"""
+        limit = self.rate_limit(platform, account)
+        recent = [t for t in self.attempts.get(platform, []) if t > now - limit['window']]
+        self.attempts[platform] = recent
+        allowed = recent[-1] + limit['interval'] if recent else now
+        if len(recent) >= limit['posts']:
+            allowed = max(allowed, recent[-limit['posts']] + limit['window'])
+        return max(allowed, now)
+
+    def next_due(self, now):
+        """Return (post, account) to send now, or (None, seconds until something could be sent)"""
+        accounts = self.accounts()
+        wait = None
+        for platform in PLATFORMS:
+            queued = [
+                post for post in self.posts.values()
+                if post['platform'] == platform and post['status'] == PENDING
+            ]
+            if not queued:
+                continue
+            account = accounts.get(platform) or {}
+            post = min(queued, key=lambda post: (post['next_attempt'], post['created']))
+            ready = max(post['next_attempt'], self.allowed_at(platform, account, now))
+            if ready <= now:
+                return post, account
+            wait = ready - now if wait is None else min(wait, ready - now)
+        return None, wait
+
+    def publish_due(self):
+        """Send every post that is due and allowed now; return how many were attempted"""
+        attempted = 0
+        while True:
+            with self.condition:
+                now = self.clock()
+                post, account = self.next_due(now)
+                if post is None:
+                    return attempted
+                post['status'] = SENDING
+                post['attempts'] += 1
+                self.attempts.setdefault(post['platform'], []).append(now)
+                self.save_state()
+            attempted += 1
+            self.send(post, account)
+
+    def send(self, post, account):
+        try:
+            response = self.transport(account, post)
+        except PublishError as e:
+            with self.condition:
+                post['error'] = str(e)
+                if e.retry_after is None or post['attempts'] >= MAX_ATTEMPTS:
+                    post['status'] = FAILED
+                else:
+                    post['status'] = PENDING
+                    post['next_attempt'] = self.clock() + max(e.retry_after, backoff_delay(post['attempts']))
+                self.save_state()
+            self.log(
+                'warning', 'social_post_failed',
+                f"{post['platform']} post for {post['article']} failed (attempt {post['attempts']}): {e}",
+                platform=post['platform'], article=post['article'], attempts=post['attempts'], status=post['status'],
+            )
+            return
+        except Exception as e:
+            # A bug or bad account settings, not a platform answer; retrying blindly will not help
+            with self.condition:
+                post['status'] = FAILED
+                post['error'] = f'{type(e).__name__}: {e}'
+                self.save_state()
+            self.log(
+                'error', 'social_post_error',
+                f"{post['platform']} post for {post['article']} failed unexpectedly: {post['error']}",
+                platform=post['platform'], article=post['article'], error=post['error'],
+            )
+            return
+        if not isinstance(response, dict):
+            response = {}
+        with self.condition:
+            post.update(status=SENT, error=None, sent=self.clock(), response=response.get('id') or response.get('uri'))
+            self.save_state()
+        self.log(
+            'info', 'social_posted', f"Posted {post['article']} to {post['platform']}",
+            platform=post['platform'], article=post['article'],
+        )
+
+    def retry(self, post_id):
+        """Queue a failed or cancelled post again with a fresh attempt count"""
+        with self.condition:
+            post = self.posts.get(post_id)
+            if post is None:
+                raise KeyError(post_id)
+            if post['status'] not in (FAILED, CANCELLED):
+                raise ValueError(f"Post {post_id} is {post['status']}, only failed or cancelled posts can be retried")
+            post.update(status=PENDING, attempts=0, next_attempt=self.clock(), error=None)
+            self.save_state()
+            self.condition.notify()
+            return dict(post)
+
+    def cancel(self, post_id):
+        with self.condition:
+            post = self.posts.get(post_id)
+            if post is None:
+                raise KeyError(post_id)
+            if post['status'] != PENDING:
+                raise ValueError(f"Post {post_id} is {post['status']}, only pending posts can be cancelled")
+            post['status'] = CANCELLED
+            self.save_state()
+            return dict(post)
+
+    def status(self, status=None):
+        with self.condition:
+            posts = [dict(post) for post in self.posts.values() if status is None or post['status'] == status]
+            counts = {}
+            for post in self.posts.values():
+                counts[post['status']] = counts.get(post['status'], 0) + 1
+        posts.sort(key=lambda post: post['created'], reverse=True)
+        return {'counts': counts, 'posts': posts, 'running': self.thread is not None}
+
+    def start(self):
+        """Send posts from a background thread as they come due"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='social-publisher', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                self.publish_due()
+                with self.condition:
+                    _, wait = self.next_due(self.clock())
+            except Exception as e:
+                # Keep the worker alive (e.g. a malformed rate_limit in the accounts file)
+                self.log('error', 'social_publisher_error', f'Social publisher error: {type(e).__name__}: {e}')
+                wait = RETRY_BASE
+            with self.condition:
+                # Re-check now and then too, since accounts can change on disk
+                self.condition.wait(60 if wait is None else min(wait, 60))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Queue and publish article share posts')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--queue-new', action='store_true', help='Queue posts for articles not shared yet')
+    parser.add_argument('--queue', nargs='+', metavar='ARTICLE', help='Queue posts for these article files')
+    parser.add_argument('--publish', action='store_true', help='Send posts that are due, then exit')
+    args = parser.parse_args()
+
+    publisher = SocialPublisher(args.root)
+    if args.queue_new:
+        result = publisher.enqueue_new(ArticleStore(args.root))
+        if 'baseline' in result:
+            print(f"📌 Recorded {result['baseline']} existing articles as already shared")
+        else:
+            print(f"📥 Queued {len(result['queued'])} posts ({len(result['duplicates'])} duplicates skipped)")
+    if args.queue:
+        store = ArticleStore(args.root)
+        store.refresh()
+        wanted = set(args.queue)
+        articles = [article for article in store.all() if article['filename'] in wanted]
+        result = publisher.enqueue(articles)
+        print(f"📥 Queued {len(result['queued'])} posts ({len(result['duplicates'])} duplicates skipped)")
+        if result['unconfigured']:
+            print(f"⚠️  No token or endpoint for {', '.join(result['unconfigured'])}")
+    if args.publish:
+        attempted = publisher.publish_due()
+        print(f"📣 {attempted} posts attempted")
+    counts = publisher.status()['counts']
+    print('🗂️  Queue: ' + (', '.join(f'{count} {status}' for status, count in sorted(counts.items())) or 'empty'))
@@ -0,0 +1,26 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope='session')
+def dev_server(tmp_path_factory):
+    """Import dev-server.py with its state files pointed at a scratch directory"""
+    scratch = tmp_path_factory.mktemp('dev-server')
+    os.environ['BUILDLY_LOG_FILE'] = str(scratch / 'events.jsonl')
+    spec = importlib.util.spec_from_file_location('dev_server', ROOT / 'dev-server.py')
+    module = importlib.util.module_from_spec(spec)
+    cwd = os.getcwd()
+    os.chdir(scratch)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    module.LOG.echo = False
+    return module
@@ -0,0 +1,86 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubModel(BaseHTTPRequestHandler):
+    """Ollama-style /api/generate that streams the prompt back after a release signal"""
+
+    calls = []
+    release = threading.Event()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.calls.append((self.server.server_port, body['prompt']))
+        self.release.wait(5)
+        self.send_response(200)
+        self.end_headers()
+        for word in body['prompt'].split():
+            self.wfile.write(json.dumps({'response': word + ' ', 'done': False}).encode() + b'\n')
+        self.wfile.write(json.dumps({'response': '', 'done': True,
+                                     'prompt_eval_count': 3, 'eval_count': 2}).encode() + b'\n')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_models():
+    StubModel.calls = []
+    StubModel.release = threading.Event()
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), StubModel) for _ in range(2)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield [f'http://127.0.0.1:{server.server_port}' for server in servers]
+    StubModel.release.set()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_request(endpoint, prompt='hello proxy world'):
+    return {'provider': 'ollama', 'model': 'stub', 'prompt': prompt,
+            'temperature': 0.7, 'maxTokens': 50, 'endpoint': endpoint, 'apiKey': None}
+
+
+def test_identical_requests_coalesce_then_hit_cache(dev_server, stub_models):
+    proxy = dev_server.AIProxy()
+    first, generation = proxy.lookup(make_request(stub_models[0]))
+    second, shared = proxy.lookup(make_request(stub_models[0]))
+    assert (first, second) == ('started', 'coalesced')
+    assert shared is generation
+
+    StubModel.release.set()
+    assert generation.content() == shared.content() == 'hello proxy world '
+    assert generation.usage['totalTokens'] == 5
+
+    outcome, cached = proxy.lookup(make_request(stub_models[0]))
+    assert outcome == 'cached'
+    assert cached['content'] == 'hello proxy world '
+    assert len(StubModel.calls) == 1
+
+
+def test_different_endpoints_do_not_share_generations(dev_server, stub_models):
+    proxy = dev_server.AIProxy()
+    _, first = proxy.lookup(make_request(stub_models[0]))
+    outcome, second = proxy.lookup(make_request(stub_models[1]))
+    assert outcome == 'started'
+    assert second is not first
+
+    StubModel.release.set()
+    first.content(), second.content()
+    assert sorted(port for port, _ in StubModel.calls) == sorted(
+        int(url.rsplit(':', 1)[1]) for url in stub_models
+    )
+
+
+def test_resolve_ai_endpoint_allows_only_configured_upstreams(dev_server, monkeypatch):
+    default = dev_server.AI_PROVIDER_ENDPOINTS['ollama']
+    assert dev_server.resolve_ai_endpoint('ollama') == default
+    assert dev_server.resolve_ai_endpoint('ollama', default + '/') == default
+    assert dev_server.resolve_ai_endpoint('ollama', 'http://169.254.169.254') is None
+
+    monkeypatch.setattr(dev_server, 'AI_EXTRA_ENDPOINTS', ['http://models.internal:11434'])
+    assert dev_server.resolve_ai_endpoint('ollama', 'http://models.internal:11434/') == 'http://models.internal:11434'
@@ -0,0 +1,19 @@
+import check_links
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+def test_template_sources_are_not_checked_as_pages(tmp_path):
+    write(tmp_path / 'index.html', '<a href="about.html">About</a><a href="missing.html">Gone</a>')
+    write(tmp_path / 'about.html', '<a href="index.html">Home</a>')
+    # Relative to templates/partials these miss; relative to where the partial is rendered they do not
+    write(tmp_path / 'templates/partials/footer.html', '<a href="../index.html">Home</a><link href="css/site.css">')
+
+    report = check_links.check_links(str(tmp_path), workers=0)
+
+    assert [item['url'] for item in report['broken']] == ['missing.html']
+    assert report['orphans'] == []
+    assert 'templates/partials/footer.html' not in report['graph']
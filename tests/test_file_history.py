@@ -0,0 +1,39 @@
+import os
+import sqlite3
+
+import pytest
+
+import file_history
+from file_history import FileHistory, SchemaError
+
+
+def make_history(tmp_path):
+    history = FileHistory(str(tmp_path))
+    version = history.record('index.html', b'<h1>Hello</h1>\n')
+    history.close()
+    return version
+
+
+def test_a_newer_schema_is_refused_and_left_intact(tmp_path):
+    version = make_history(tmp_path)
+    directory = tmp_path / file_history.HISTORY_DIR
+    pack_size = os.path.getsize(directory / file_history.PACK_FILE)
+    with sqlite3.connect(directory / file_history.INDEX_FILE) as db:
+        db.execute('PRAGMA user_version = 99')
+
+    with pytest.raises(SchemaError, match='schema version 99'):
+        FileHistory(str(tmp_path))
+    assert os.path.getsize(directory / file_history.PACK_FILE) == pack_size
+    with sqlite3.connect(directory / file_history.INDEX_FILE) as db:
+        assert db.execute('SELECT id FROM versions').fetchall() == [(version['id'],)]
+
+
+def test_an_older_schema_is_migrated_in_place(tmp_path, monkeypatch):
+    version = make_history(tmp_path)
+    monkeypatch.setattr(file_history, 'SCHEMA_VERSION', 2)
+    monkeypatch.setattr(file_history, 'MIGRATIONS', {1: 'ALTER TABLE versions ADD COLUMN note TEXT;'})
+
+    history = FileHistory(str(tmp_path))
+    assert history.read(version['id'])[1] == b'<h1>Hello</h1>\n'
+    assert history.db.execute('PRAGMA user_version').fetchone()[0] == 2
+    history.close()
@@ -0,0 +1,23 @@
+import os
+from datetime import datetime, timezone
+
+import generate_articles
+
+
+def test_title_only_front_matter_gets_store_defaults(tmp_path):
+    (tmp_path / 'content/articles').mkdir(parents=True)
+    (tmp_path / 'articles').mkdir()
+    source = tmp_path / 'content/articles/title-only.md'
+    source.write_text('---\ntitle: Scaling a Startup Team\n---\n\nSome body text.\n', encoding='utf-8')
+    saved = datetime(2026, 3, 14, 12, tzinfo=timezone.utc).timestamp()
+    os.utime(source, (saved, saved))
+
+    written = generate_articles.write_articles(str(tmp_path))
+
+    assert written == ['title-only.html']
+    html = (tmp_path / 'articles/title-only.html').read_text(encoding='utf-8')
+    assert 'No description available' in html
+    assert 'Startup Growth' in html
+    # Undated articles are dated by their source file, not the epoch
+    assert 'March 14, 2026' in html
+    assert '1970' not in html
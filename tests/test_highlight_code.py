@@ -0,0 +1,13 @@
+from highlight_code import guess_language
+
+
+def test_prose_and_log_lines_are_not_guessed_as_yaml():
+    assert guess_language('Note: restart the server after editing.') is None
+    assert guess_language('Note: restart the server.\nIt picks up the new config.\n') is None
+    assert guess_language('2026-03-14 12:00:01 ERROR: connection refused') is None
+
+
+def test_yaml_is_guessed_from_several_keys_or_markers():
+    assert guess_language('name: buildly\nversion: 2\n') == 'yaml'
+    assert guess_language('services:\n  - web\n  - worker\n') == 'yaml'
+    assert guess_language('---\ntitle: Hello\n') == 'yaml'
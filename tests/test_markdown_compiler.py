@@ -0,0 +1,19 @@
+from markdown_compiler import MarkdownCompiler
+
+
+def render(text):
+    return MarkdownCompiler(root=None).render(text)
+
+
+def test_short_delimiter_rows_make_tables():
+    html = render('| Name | Size |\n|:--|--:|\n| a | 1 |\n')
+    assert '<table' in html
+    assert html.count('<th ') == 2 and html.count('<td ') == 2
+    assert 'text-right' in html
+
+    assert '<table' in render('a | b\n-|-\nc | d\n')
+
+
+def test_delimiter_row_must_match_the_header_cells():
+    html = render('a | b | c\n-|-\n')
+    assert '<table' not in html
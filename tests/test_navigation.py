@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+import navigation
+from conftest import ROOT
+
+
+def compiled_site_navigation():
+    with open(ROOT / navigation.NAVIGATION_CONFIG_FILE, encoding='utf-8') as f:
+        return navigation.CompiledNavigation(json.load(f))
+
+
+def test_site_config_reproduces_the_desktop_nav_with_its_dropdown():
+    page = (ROOT / 'index.html').read_text(encoding='utf-8')
+    compiled = compiled_site_navigation()
+
+    content, missing = navigation.splice_navigation(page, {'desktop': compiled.desktop})
+
+    assert missing == []
+    assert content == page
+
+
+def test_pages_without_a_mobile_menu_do_not_report_missing_markers():
+    page = (ROOT / 'labs.html').read_text(encoding='utf-8')
+    compiled = compiled_site_navigation()
+
+    content, missing = navigation.splice_navigation(page, {'desktop': compiled.desktop, 'mobile': compiled.mobile})
+
+    assert missing == []
+    assert 'Products' in content and 'rad-process.html' in content
+
+
+def test_mobile_menu_lists_dropdown_children():
+    mobile = compiled_site_navigation().mobile
+    assert [link.split('"')[1] for link in mobile[:4]] == ['labs.html', 'platform', 'rad-core.html', 'rad-process.html']
+
+
+def test_container_without_markers_is_reported():
+    page = f'{navigation.NAV_REGIONS["mobile"]}\n<a href="a.html">A</a>\n</div>'
+    _, missing = navigation.splice_navigation(page, {'mobile': []})
+    assert missing == ['mobile']
+
+
+def test_validation_requires_href_or_children():
+    with pytest.raises(navigation.NavigationError, match='item 1: href is required'):
+        navigation.validate_navigation([{'label': 'Products'}])
+    with pytest.raises(navigation.NavigationError, match='item 1 child 1: href must be a non-empty string'):
+        navigation.validate_navigation([{'label': 'Products', 'children': [{'label': 'Labs'}]}])
+    assert navigation.validate_navigation([{'label': 'Products', 'children': [{'label': 'Labs', 'href': 'labs.html'}]}])
@@ -0,0 +1,74 @@
+import shutil
+import time
+
+from conftest import ROOT
+
+
+def make_site(tmp_path):
+    for directory in ('content/articles', 'articles', 'templates'):
+        shutil.copytree(ROOT / directory, tmp_path / directory)
+    shutil.copy(ROOT / 'index.html', tmp_path / 'index.html')
+    return tmp_path
+
+
+def test_new_markdown_article_reaches_sitemap(dev_server, tmp_path, monkeypatch):
+    site = make_site(tmp_path)
+    monkeypatch.chdir(site)
+    monkeypatch.setattr(dev_server, 'SITEMAP', None)
+    dev_server.update_sitemap([])
+    assert 'scheduler-test' not in (site / 'sitemap.xml').read_text()
+
+    (site / 'content/articles/scheduler-test.md').write_text(
+        '---\n'
+        'title: Scheduler Test\n'
+        'description: Added while the dev server is running.\n'
+        'topic: Backend\n'
+        'keywords: testing\n'
+        'date: 2026-01-02\n'
+        '---\n\n'
+        'A new article.\n',
+        encoding='utf-8'
+    )
+    dev_server.REBUILDS.rebuild(['content/articles/scheduler-test.md'])
+
+    assert (site / 'articles/scheduler-test.html').exists()
+    assert 'https://www.buildly.io/articles/scheduler-test.html' in (site / 'sitemap.xml').read_text()
+
+
+def test_rebuild_passes_written_files_not_patterns(dev_server):
+    seen = []
+    graph = dev_server.DependencyGraph()
+    graph.add('pages', inputs=['src/*.md'], produces=['out/*.html'], rebuild=lambda paths: ['out/a.html'])
+    graph.add('index', inputs=['out/*.html'], produces=['index.xml'], rebuild=lambda paths: seen.append(paths))
+    scheduler = dev_server.RebuildScheduler(graph)
+
+    scheduler.rebuild(['src/a.md'])
+
+    assert seen == [['out/a.html', 'src/a.md']]
+
+
+
+def test_saving_a_partial_rebuilds_articles_and_their_dependents(dev_server):
+    rebuilt = []
+    graph = dev_server.DependencyGraph()
+    for name, target in dev_server.DEPENDENCIES.targets.items():
+        graph.add(name, target['inputs'], target['produces'],
+                  rebuild=lambda paths, name=name: rebuilt.append(name) or [])
+    scheduler = dev_server.RebuildScheduler(graph, debounce=0)
+
+    for partial in ('includes/social-share.html', 'templates/articles/article.html',
+                    'templates/partials/article-footer.html'):
+        rebuilt.clear()
+        scheduler.schedule([partial])
+        assert wait_until(lambda: 'links' in rebuilt and not scheduler.status()['running'])
+        assert {'articles', 'articles-page', 'feeds', 'sitemap', 'links'} <= set(rebuilt)
+        assert rebuilt.index('articles') < rebuilt.index('articles-page')
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
@@ -0,0 +1,152 @@
+import json
+
+import social_publisher
+from social_publisher import FAILED, PENDING, SENDING, SENT, PublishError, SocialPublisher
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubTransport:
+    """Answers each send with the next queued outcome (an exception to raise, or a response)"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.sent = []
+
+    def __call__(self, account, post):
+        self.sent.append(post['article'])
+        outcome = self.outcomes.pop(0) if self.outcomes else {'id': 'ok'}
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def articles(count):
+    return [{'filename': f'articles/post-{i}.html', 'title': f'Post {i}'} for i in range(count)]
+
+
+def make_publisher(tmp_path, transport, rate_limit=None, clock=None, log=social_publisher.print_log):
+    account = {'endpoint': 'http://stub.invalid/statuses'}
+    if rate_limit:
+        account['rate_limit'] = rate_limit
+    (tmp_path / social_publisher.ACCOUNTS_FILE).write_text(json.dumps({'mastodon': account}), encoding='utf-8')
+    return SocialPublisher(str(tmp_path), transport=transport, clock=clock or Clock(), log=log)
+
+
+def statuses(publisher):
+    return sorted(post['status'] for post in publisher.posts.values())
+
+
+def test_rate_limit_spaces_posts_and_caps_the_window(tmp_path):
+    clock = Clock()
+    transport = StubTransport()
+    publisher = make_publisher(tmp_path, transport, {'posts': 2, 'window': 100, 'interval': 10}, clock)
+    publisher.enqueue(articles(3))
+
+    assert publisher.publish_due() == 1
+    assert publisher.publish_due() == 0
+    clock.now += 10
+    assert publisher.publish_due() == 1
+    clock.now += 10
+    assert publisher.publish_due() == 0
+    clock.now += 80
+    assert publisher.publish_due() == 1
+    assert statuses(publisher) == [SENT, SENT, SENT]
+
+
+def test_retryable_errors_back_off_then_succeed(tmp_path):
+    clock = Clock()
+    transport = StubTransport(PublishError('HTTP 503', 0))
+    publisher = make_publisher(tmp_path, transport, {'interval': 0}, clock)
+    publisher.enqueue(articles(1))
+
+    publisher.publish_due()
+    (post,) = publisher.posts.values()
+    assert post['status'] == PENDING
+    assert post['next_attempt'] >= clock.now + social_publisher.RETRY_BASE
+
+    assert publisher.publish_due() == 0
+    clock.now = post['next_attempt']
+    assert publisher.publish_due() == 1
+    assert post['status'] == SENT and post['attempts'] == 2
+
+
+def test_permanent_errors_and_exhausted_retries_fail(tmp_path):
+    clock = Clock()
+    transport = StubTransport(PublishError('HTTP 400'), *[PublishError('HTTP 429', 0)] * social_publisher.MAX_ATTEMPTS)
+    publisher = make_publisher(tmp_path, transport, {'interval': 0}, clock)
+    publisher.enqueue(articles(2))
+
+    for _ in range(social_publisher.MAX_ATTEMPTS + 1):
+        publisher.publish_due()
+        clock.now += social_publisher.RETRY_MAX * 2
+    assert statuses(publisher) == [FAILED, FAILED]
+    assert len(transport.sent) == social_publisher.MAX_ATTEMPTS + 1
+
+
+def test_unexpected_transport_error_fails_the_post(tmp_path):
+    transport = StubTransport(KeyError('instance'))
+    publisher = make_publisher(tmp_path, transport, {'interval': 0})
+    publisher.enqueue(articles(2))
+
+    assert publisher.publish_due() == 2
+    assert statuses(publisher) == [FAILED, SENT]
+    failed = next(post for post in publisher.posts.values() if post['status'] == FAILED)
+    assert failed['error'] == "KeyError: 'instance'"
+    assert SocialPublisher(str(tmp_path)).posts[failed['id']]['status'] == FAILED
+
+
+def test_outcomes_go_to_the_injected_log(tmp_path, capsys):
+    events = []
+    transport = StubTransport(PublishError('HTTP 503', 0), KeyError('instance'))
+    publisher = make_publisher(
+        tmp_path, transport, {'interval': 0}, log=lambda level, event, message, **fields: events.append((level, event, fields))
+    )
+    publisher.enqueue(articles(3))
+
+    assert publisher.publish_due() == 3
+    assert [(level, event) for level, event, _ in events] == [
+        ('warning', 'social_post_failed'), ('error', 'social_post_error'), ('info', 'social_posted'),
+    ]
+    assert events[0][2]['platform'] == 'mastodon' and events[0][2]['attempts'] == 1
+    assert capsys.readouterr().out == ''
+
+
+def wait_until(predicate, timeout=5):
+    deadline = social_publisher.time.monotonic() + timeout
+    while not predicate():
+        if social_publisher.time.monotonic() > deadline:
+            return False
+        social_publisher.time.sleep(0.01)
+    return True
+
+
+def test_worker_keeps_publishing_after_a_crash(tmp_path):
+    transport = StubTransport(KeyError('boom'))
+    publisher = make_publisher(tmp_path, transport, {'interval': 0}, clock=social_publisher.time.time)
+    publisher.enqueue(articles(1))
+    publisher.start()
+    assert wait_until(lambda: statuses(publisher) == [FAILED])
+
+    publisher.enqueue(articles(2)[1:])
+    assert wait_until(lambda: statuses(publisher) == [FAILED, SENT])
+    assert publisher.thread.is_alive()
+
+
+def test_stale_sending_posts_are_reset_on_load(tmp_path):
+    publisher = make_publisher(tmp_path, StubTransport())
+    publisher.enqueue(articles(1))
+    (post,) = publisher.posts.values()
+    post['status'] = SENDING
+    publisher.save_state()
+
+    reloaded = SocialPublisher(str(tmp_path))
+    assert reloaded.posts[post['id']]['status'] == PENDING
+    with open(tmp_path / social_publisher.STATE_FILE, encoding='utf-8') as f:
+        assert json.load(f)['posts'][post['id']]['status'] == PENDING
@@ -0,0 +1,40 @@
+import json
+import threading
+import urllib.parse
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def server(dev_server):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), dev_server.AdminHTTPRequestHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    dev_server.UNSUBSCRIBES.subscribe('reader@example.com', 'test')
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(url, body, content_type):
+    request = urllib.request.Request(url, data=body, headers={'Content-Type': content_type}, method='POST')
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_unsubscribe_accepts_the_pages_text_plain_json(server):
+    body = json.dumps({'action': 'check_email', 'email': 'Reader@example.com'}).encode()
+    result = post(f'{server}/api/unsubscribe', body, 'text/plain')
+    assert result['success'] and result['data']['exists']
+
+
+def test_unsubscribe_accepts_the_fallback_form_body(server):
+    body = urllib.parse.urlencode({
+        'email': 'reader@example.com',
+        'action': 'unsubscribe',
+        'source': 'website-unsubscribe-page-fallback',
+    }).encode()
+    result = post(f'{server}/api/unsubscribe', body, 'application/x-www-form-urlencoded;charset=UTF-8')
+    assert result['success'], result['message']
+    assert result['data']['email'] == 'reader@example.com'
@@ -0,0 +1,36 @@
+import sqlite3
+
+import pytest
+
+import unsubscribe_store
+from unsubscribe_store import SchemaError, UnsubscribeStore
+
+
+def make_list(tmp_path):
+    store = UnsubscribeStore(str(tmp_path))
+    store.subscribe('reader@example.com', 'test')
+    store.unsubscribe('reader@example.com', 'test')
+    store.close()
+    return tmp_path / unsubscribe_store.DB_FILE
+
+
+def test_a_newer_schema_is_refused_and_left_intact(tmp_path):
+    path = make_list(tmp_path)
+    with sqlite3.connect(path) as db:
+        db.execute('PRAGMA user_version = 99')
+
+    with pytest.raises(SchemaError, match='schema version 99'):
+        UnsubscribeStore(str(tmp_path))
+    with sqlite3.connect(path) as db:
+        assert db.execute('SELECT email, unsubscribed FROM subscribers').fetchall() == [('reader@example.com', 1)]
+
+
+def test_an_older_schema_is_migrated_in_place(tmp_path, monkeypatch):
+    make_list(tmp_path)
+    monkeypatch.setattr(unsubscribe_store, 'SCHEMA_VERSION', 2)
+    monkeypatch.setattr(unsubscribe_store, 'MIGRATIONS', {1: 'ALTER TABLE subscribers ADD COLUMN note TEXT;'})
+
+    store = UnsubscribeStore(str(tmp_path))
+    assert store.check('reader@example.com') == {'exists': True, 'unsubscribed': True}
+    assert store.db.execute('PRAGMA user_version').fetchone()[0] == 2
+    store.close()
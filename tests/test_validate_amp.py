@@ -0,0 +1,83 @@
+import validate_amp
+
+VALID_PAGE = f'''<!doctype html>
+<html ⚡ lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width">
+<link rel="canonical" href="https://www.buildly.io/labs.html">
+<script async src="{validate_amp.RUNTIME_URL}"></script>
+<script async custom-element="amp-carousel" src="https://cdn.ampproject.org/v0/amp-carousel-0.1.js"></script>
+<style amp-boilerplate>{validate_amp.BOILERPLATE_CSS}</style>
+<noscript><style amp-boilerplate>{validate_amp.BOILERPLATE_NOSCRIPT_CSS}</style></noscript>
+<style amp-custom>.hero {{ color: #123; }}</style>
+</head>
+<body>
+<amp-img src="a.png" width="16" height="9"></amp-img>
+<amp-carousel type="slides"></amp-carousel>
+</body>
+</html>
+'''
+
+
+def check(html):
+    parser = validate_amp.AmpRulesParser()
+    parser.feed(html)
+    parser.close()
+    parser.finish()
+    return [message for _, message in parser.errors], [message for _, message in parser.warnings]
+
+
+def test_valid_page_has_no_errors():
+    assert check(VALID_PAGE) == ([], [])
+
+
+def test_missing_required_head_elements_are_reported():
+    html = VALID_PAGE.replace(' ⚡', '').replace('<meta name="viewport" content="width=device-width">', '')
+    html = html.replace('<noscript>', '').replace('</noscript>', '')
+    errors, _ = check(html)
+    assert 'missing ⚡ or amp attribute on <html>' in errors
+    assert 'missing <meta name="viewport">' in errors
+    assert 'missing <noscript><style amp-boilerplate>' in errors
+
+
+def test_tags_scripts_and_handlers_that_amp_forbids():
+    body = '<img src="a.png"><script src="app.js"></script><div onclick="go()"></div><a href="javascript:go()">x</a>'
+    errors, _ = check(VALID_PAGE.replace('<body>', '<body>' + body))
+    assert '<img> must be <amp-img>' in errors
+    assert 'custom JavaScript is not allowed (app.js)' in errors
+    assert 'event handler attribute onclick is not allowed' in errors
+    assert 'javascript: URLs are not allowed' in errors
+
+
+def test_custom_css_rules():
+    html = VALID_PAGE.replace('color: #123;', 'color: #123 !important;')
+    html = html.replace('</head>', '<style amp-custom>.b{}</style><style>.c{}</style></head>')
+    errors, _ = check(html)
+    assert '!important is not allowed in <style amp-custom>' in errors
+    assert 'only one <style amp-custom> is allowed' in errors
+    assert '<style> must be amp-boilerplate or amp-custom' in errors
+
+    oversized = VALID_PAGE.replace('.hero', '.hero' + ' ' * validate_amp.MAX_CUSTOM_CSS_BYTES)
+    errors, _ = check(oversized)
+    assert any(error.startswith('custom CSS is') for error in errors)
+
+
+def test_components_and_extension_scripts_must_match():
+    html = VALID_PAGE.replace('<amp-carousel type="slides"></amp-carousel>', '<amp-video src="a.mp4"></amp-video>')
+    errors, warnings = check(html)
+    assert '<amp-video> is used without its extension script' in errors
+    assert 'extension script for amp-carousel is loaded but not used' in warnings
+
+
+def test_generate_leaves_canonical_page_alone_by_default(tmp_path):
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css/style.css').write_text('.hero { color: red; }', encoding='utf-8')
+    canonical = '<!doctype html><html><head><title>Labs</title></head><body><p class="hero">Hi</p></body></html>'
+    (tmp_path / 'labs.html').write_text(canonical, encoding='utf-8')
+
+    result = validate_amp.generate_amp_page(str(tmp_path), 'labs.html')
+
+    assert result['written'] and not result['linked']
+    assert (tmp_path / 'labs.html').read_text(encoding='utf-8') == canonical
+    assert check((tmp_path / 'labs.amp.html').read_text(encoding='utf-8'))[0] == []
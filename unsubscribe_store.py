@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Local newsletter unsubscribe list for the Buildly website.
+
+A stand-in for the Google Sheet behind google-apps-script/Code.gs, so
+unsubscribe.html can be exercised by the dev server without Google. The list
+lives in a SQLite database, .unsubscribes.db, keyed by normalized email, so
+checking or unsubscribing an address is one primary-key lookup instead of a
+scan over every row. The columns mirror the sheet (Email, Unsubscribed,
+Timestamp, Source), and the whole list is imported from and exported to CSV
+in that layout, so it round-trips with a sheet export.
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+DB_FILE = '.unsubscribes.db'
+
+# Bump when the table layout changes, and add the step from the previous version to MIGRATIONS
+SCHEMA_VERSION = 1
+
+# version -> SQL that upgrades a list at that version to the next one in place
+MIGRATIONS = {}
+
+SCHEMA = '''
+CREATE TABLE subscribers (
+    email TEXT PRIMARY KEY,
+    unsubscribed INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT,
+    source TEXT
+) WITHOUT ROWID;
+'''
+
+# The header of the Google Sheet, and of imported and exported CSV files
+CSV_COLUMNS = ('Email', 'Unsubscribed', 'Timestamp', 'Source')
+
+# Same check as isValidEmail in js/unsubscribe.js and Code.gs
+EMAIL_PATTERN = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
+# Rows written per executemany call during an import
+IMPORT_BATCH = 5000
+
+UNSUBSCRIBED, ALREADY_UNSUBSCRIBED, NOT_FOUND = 'unsubscribed', 'already_unsubscribed', 'not_found'
+
+
+class SchemaError(Exception):
+    """The database was written by a schema version this code cannot upgrade"""
+
+
+def normalize_email(email):
+    """Lower-case and trim an address; raise ValueError if it is not one"""
+    email = (email or '').strip().lower()
+    if not EMAIL_PATTERN.match(email):
+        raise ValueError('Invalid email address')
+    return email
+
+
+def parse_flag(value):
+    return str(value).strip().lower() in ('true', '1', 'yes')
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class UnsubscribeStore:
+    """The subscriber list in SQLite, safe to share between request threads"""
+
+    def __init__(self, root='.', path=None):
+        self.path = path or os.path.join(root, DB_FILE)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            self.ensure_schema()
+        except Exception:
+            self.db.close()
+            raise
+
+    def ensure_schema(self):
+        with self.lock:
+            version = self.db.execute('PRAGMA user_version').fetchone()[0]
+            if version == SCHEMA_VERSION:
+                return
+            exists = self.db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'subscribers'").fetchone()
+            if not exists:
+                self.db.executescript(SCHEMA + f'PRAGMA user_version = {SCHEMA_VERSION};')
+                return
+            # The list is the only copy of who unsubscribed, so never rebuild it; upgrade it or refuse to open it
+            steps = range(version, SCHEMA_VERSION)
+            if version > SCHEMA_VERSION or any(step not in MIGRATIONS for step in steps):
+                raise SchemaError(
+                    f'{self.path} has schema version {version} and this code expects {SCHEMA_VERSION}; '
+                    'export it with a matching version or add a migration'
+                )
+            for step in steps:
+                self.db.executescript(f'BEGIN; {MIGRATIONS[step]} PRAGMA user_version = {step + 1}; COMMIT;')
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def check(self, email):
+        """Return {'exists', 'unsubscribed'} for an address"""
+        email = normalize_email(email)
+        with self.lock:
+            row = self.db.execute('SELECT unsubscribed FROM subscribers WHERE email = ?', (email,)).fetchone()
+        return {'exists': row is not None, 'unsubscribed': bool(row and row[0])}
+
+    def subscribe(self, email, source=None):
+        """Add an address (or re-subscribe it); return the normalized address"""
+        email = normalize_email(email)
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT INTO subscribers (email, unsubscribed, timestamp, source) VALUES (?, 0, ?, ?) '
+                'ON CONFLICT (email) DO UPDATE SET unsubscribed = 0, timestamp = excluded.timestamp, source = excluded.source',
+                (email, now_iso(), source)
+            )
+        return email
+
+    def unsubscribe(self, email, source=None):
+        """Mark an address unsubscribed; return UNSUBSCRIBED, ALREADY_UNSUBSCRIBED or NOT_FOUND
+
+        Like the sheet, only addresses on the list can be unsubscribed.
+        """
+        email = normalize_email(email)
+        with self.lock, self.db:
+            updated = self.db.execute(
+                'UPDATE subscribers SET unsubscribed = 1, timestamp = ?, source = ? WHERE email = ? AND unsubscribed = 0',
+                (now_iso(), source, email)
+            ).rowcount
+            if updated:
+                return UNSUBSCRIBED
+            exists = self.db.execute('SELECT 1 FROM subscribers WHERE email = ?', (email,)).fetchone()
+        return ALREADY_UNSUBSCRIBED if exists else NOT_FOUND
+
+    def import_rows(self, rows, replace=False):
+        """Upsert (email, unsubscribed, timestamp, source) rows; return (imported, skipped)
+
+        With replace the list is emptied first, all in one transaction.
+        """
+        imported = skipped = 0
+        batch = []
+        with self.lock, self.db:
+            if replace:
+                self.db.execute('DELETE FROM subscribers')
+            for email, unsubscribed, timestamp, source in rows:
+                try:
+                    batch.append((normalize_email(email), int(bool(unsubscribed)), timestamp or None, source or None))
+                except ValueError:
+                    skipped += 1
+                    continue
+                if len(batch) >= IMPORT_BATCH:
+                    imported += self.write_batch(batch)
+                    batch = []
+            imported += self.write_batch(batch)
+        return imported, skipped
+
+    def write_batch(self, batch):
+        self.db.executemany(
+            'INSERT INTO subscribers (email, unsubscribed, timestamp, source) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (email) DO UPDATE SET unsubscribed = excluded.unsubscribed, '
+            'timestamp = excluded.timestamp, source = excluded.source',
+            batch
+        )
+        return len(batch)
+
+    def rows(self):
+        """Every (email, unsubscribed, timestamp, source) row, by email"""
+        with self.lock:
+            return self.db.execute(
+                'SELECT email, unsubscribed, timestamp, source FROM subscribers ORDER BY email'
+            ).fetchall()
+
+    def counts(self):
+        with self.lock:
+            total, unsubscribed = self.db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(unsubscribed), 0) FROM subscribers'
+            ).fetchone()
+        return {'subscribers': total, 'unsubscribed': unsubscribed, 'active': total - unsubscribed}
+
+    def import_csv(self, text, replace=False):
+        """Import a sheet-style CSV (header row optional); return (imported, skipped)"""
+        return self.import_rows(read_csv(text), replace)
+
+    def export_csv(self):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(CSV_COLUMNS)
+        for email, unsubscribed, timestamp, source in self.rows():
+            writer.writerow([email, 'TRUE' if unsubscribed else 'FALSE', timestamp or '', source or ''])
+        return output.getvalue()
+
+
+def read_csv(text):
+    """Yield (email, unsubscribed, timestamp, source) from CSV text in the sheet's column order"""
+    for index, row in enumerate(csv.reader(io.StringIO(text))):
+        if not row or (index == 0 and row[0].strip().lower() == CSV_COLUMNS[0].lower()):
+            continue
+        row = (row + [''] * len(CSV_COLUMNS))[:len(CSV_COLUMNS)]
+        yield row[0], parse_flag(row[1]), row[2].strip(), row[3].strip()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=f'Manage the local unsubscribe list in {DB_FILE}')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--import', dest='import_file', metavar='CSV', help='Import a sheet export (Email, Unsubscribed, Timestamp, Source)')
+    parser.add_argument('--replace', action='store_true', help='With --import, replace the list instead of merging')
+    parser.add_argument('--export', metavar='CSV', help='Write the list as CSV')
+    parser.add_argument('--check', metavar='EMAIL', help='Show the status of one address')
+    parser.add_argument('--unsubscribe', metavar='EMAIL', help='Unsubscribe one address')
+    args = parser.parse_args()
+
+    store = UnsubscribeStore(args.root)
+    try:
+        if args.import_file:
+            with open(args.import_file, 'r', encoding='utf-8', newline='') as f:
+                imported, skipped = store.import_csv(f.read(), args.replace)
+            print(f"📥 Imported {imported} addresses ({skipped} invalid rows skipped)")
+        if args.check:
+            status = store.check(args.check)
+            print(f"🔎 {args.check}: " + ('unsubscribed' if status['unsubscribed'] else 'subscribed' if status['exists'] else 'not on the list'))
+        if args.unsubscribe:
+            print(f"✉️  {args.unsubscribe}: {store.unsubscribe(args.unsubscribe, 'command-line').replace('_', ' ')}")
+        if args.export:
+            with open(args.export, 'w', encoding='utf-8', newline='') as f:
+                f.write(store.export_csv())
+            print(f"📤 Exported to {args.export}")
+    except ValueError as e:
+        parser.exit(1, f"❌ {e}\n")
+    counts = store.counts()
+    print(f"🗂️  {counts['subscribers']} addresses, {counts['unsubscribed']} unsubscribed")
+    store.close()
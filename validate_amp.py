@@ -0,0 +1,860 @@
+#!/usr/bin/env python3
+"""
+Validate and generate the AMP versions of Buildly pages.
+
+Every *.amp.html page in the tree is parsed once (across a process pool when
+many pages need checking) and held to the structural rules of AMP HTML: ⚡ on
+<html>, the charset and viewport meta tags, the runtime script, a canonical
+link, the boilerplate styles, one <style amp-custom> within the size limit,
+extension scripts for the components used, and no custom JavaScript, event
+handler attributes or tags AMP replaces with its own components. Results are
+cached in .amp-cache.json by content hash, so a re-check only parses pages
+that were edited. Canonical pages are checked for a rel="amphtml" link back,
+and sitemap.xml for the AMP URLs.
+
+--generate PAGE writes PAGE's AMP variant next to it: the site stylesheet and
+the page's own styles are inlined into <style amp-custom>, pruned to the
+selectors the page uses; inline style attributes become classes; images and
+iframes become <amp-img>/<amp-iframe> with explicit dimensions; and scripts,
+forms and event handlers are dropped. The canonical page is left untouched
+unless --link is given, which adds its rel="amphtml" link.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import build_assets
+from generate_sitemap import page_url
+
+CACHE_FILE = '.amp-cache.json'
+SITEMAP_FILE = 'sitemap.xml'
+STYLESHEET = 'css/style.css'
+AMP_SUFFIX = '.amp.html'
+
+# Bump when the rules change so cached results are discarded
+CACHE_VERSION = 1
+
+# Below this many pages to check, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+SKIPPED_DIRS = {'.git', '.build', '.venv', '__pycache__', 'node_modules', 'dist'}
+
+RUNTIME_URL = 'https://cdn.ampproject.org/v0.js'
+EXTENSION_URL = 'https://cdn.ampproject.org/v0/{name}-0.1.js'
+
+# Combined size limit for <style amp-custom> and inline style attributes
+MAX_CUSTOM_CSS_BYTES = 75000
+MAX_INLINE_STYLE_BYTES = 1000
+
+BOILERPLATE_CSS = (
+    'body{-webkit-animation:-amp-start 8s steps(1,end) 0s 1 normal both;'
+    '-moz-animation:-amp-start 8s steps(1,end) 0s 1 normal both;'
+    '-ms-animation:-amp-start 8s steps(1,end) 0s 1 normal both;'
+    'animation:-amp-start 8s steps(1,end) 0s 1 normal both}'
+    '@-webkit-keyframes -amp-start{from{visibility:hidden}to{visibility:visible}}'
+    '@-moz-keyframes -amp-start{from{visibility:hidden}to{visibility:visible}}'
+    '@-ms-keyframes -amp-start{from{visibility:hidden}to{visibility:visible}}'
+    '@-o-keyframes -amp-start{from{visibility:hidden}to{visibility:visible}}'
+    '@keyframes -amp-start{from{visibility:hidden}to{visibility:visible}}'
+)
+BOILERPLATE_NOSCRIPT_CSS = (
+    'body{-webkit-animation:none;-moz-animation:none;-ms-animation:none;animation:none}'
+)
+
+# Tags AMP does not allow at all, and those it replaces with a component
+DISALLOWED_TAGS = {'base', 'frame', 'frameset', 'object', 'param', 'applet', 'embed'}
+REPLACED_TAGS = {'img': 'amp-img', 'iframe': 'amp-iframe', 'video': 'amp-video', 'audio': 'amp-audio'}
+# Components that ship with the runtime; every other amp-* tag needs its script
+BUILTIN_COMPONENTS = {'amp-img', 'amp-layout', 'amp-pixel'}
+# Plain HTML tags that only work with an extension loaded
+EXTENSION_TAGS = {'form': 'amp-form'}
+# Stylesheets other than amp-custom may only come from font providers
+FONT_HOSTS = ('fonts.googleapis.com', 'fonts.gstatic.com', 'use.typekit.net', 'cloud.typography.com', 'fast.fonts.net')
+DATA_SCRIPT_TYPES = {'application/ld+json', 'application/json'}
+
+# What the generator keeps from the canonical page's <head>
+KEPT_META_NAMES = {'description', 'keywords', 'author', 'robots', 'theme-color'}
+KEPT_META_PREFIXES = ('og:', 'twitter:', 'article:')
+KEPT_LINK_RELS = {'icon', 'shortcut icon', 'apple-touch-icon', 'alternate', 'manifest'}
+# Dropped together with their content
+DROPPED_TAGS = {'script', 'form', 'noscript', 'template', 'object', 'embed', 'applet', 'frameset'}
+# Used when neither the markup nor the image file gives dimensions
+DEFAULT_IMAGE_SIZE = (16, 9)
+DEFAULT_IFRAME_SIZE = (560, 315)
+
+AMPHTML_LINK_PATTERN = re.compile(r'<link\b[^>]*\brel=["\']amphtml["\'][^>]*>', re.IGNORECASE)
+HREF_PATTERN = re.compile(r'\bhref=["\']([^"\']*)["\']', re.IGNORECASE)
+IMPORTANT_PATTERN = re.compile(r'!\s*important', re.IGNORECASE)
+AT_STATEMENT_PATTERN = re.compile(r'@(?:import|charset)[^;]*;', re.IGNORECASE)
+CLASS_SELECTOR_PATTERN = re.compile(r'\.((?:\\.|[\w-])+)')
+ID_SELECTOR_PATTERN = re.compile(r'#((?:\\.|[\w-])+)')
+SVG_TAG_PATTERN = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE)
+SVG_ATTRIBUTE_PATTERN = re.compile(rb'\b(width|height|viewBox)\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(?:px)?\s*$')
+
+
+class AmpRulesParser(HTMLParser):
+    """Checks one page against the AMP HTML rules in a single pass"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.errors = []
+        self.warnings = []
+        self.doctype = False
+        self.amp_html = False
+        self.in_head = False
+        self.in_noscript = False
+        self.style = None
+        self.style_text = []
+        self.found = set()
+        self.canonical = None
+        self.custom_css_bytes = 0
+        self.inline_css_bytes = 0
+        self.extensions = set()
+        self.components = {}
+
+    def error(self, message):
+        self.errors.append([self.getpos()[0], message])
+
+    def handle_decl(self, decl):
+        if decl.lower().startswith('doctype html'):
+            self.doctype = True
+
+    def handle_starttag(self, tag, attrs):
+        attributes = {name: (value if value is not None else '') for name, value in attrs}
+        if tag == 'html':
+            self.amp_html = '⚡' in attributes or 'amp' in attributes
+        elif tag == 'head':
+            self.in_head = True
+        elif tag == 'noscript':
+            self.in_noscript = True
+        elif tag == 'meta':
+            if 'charset' in attributes:
+                if attributes['charset'].lower() != 'utf-8':
+                    self.error('charset must be utf-8')
+                self.found.add('charset')
+            if attributes.get('name', '').lower() == 'viewport':
+                self.found.add('viewport')
+        elif tag == 'link':
+            rel = attributes.get('rel', '').lower().split()
+            if 'canonical' in rel:
+                self.canonical = attributes.get('href', '')
+            if 'stylesheet' in rel and urlsplit(attributes.get('href', '')).netloc not in FONT_HOSTS:
+                self.error(f"stylesheet {attributes.get('href', '')} is not allowed; inline it into <style amp-custom>")
+        elif tag == 'script':
+            self.check_script(attributes)
+        elif tag == 'style':
+            self.check_style(attributes)
+
+        if tag in DISALLOWED_TAGS:
+            self.error(f'<{tag}> is not allowed in AMP')
+        elif tag in REPLACED_TAGS:
+            self.error(f'<{tag}> must be <{REPLACED_TAGS[tag]}>')
+        elif tag in EXTENSION_TAGS:
+            self.components.setdefault(EXTENSION_TAGS[tag], self.getpos()[0])
+        elif tag.startswith('amp-') and tag not in BUILTIN_COMPONENTS:
+            self.components.setdefault(tag, self.getpos()[0])
+        if tag == 'amp-img' and 'layout' not in attributes and not ('width' in attributes and 'height' in attributes):
+            self.error('<amp-img> needs width and height, or a layout that does not')
+
+        for name, value in attributes.items():
+            if name.startswith('on') and name != 'on':
+                self.error(f'event handler attribute {name} is not allowed')
+            elif name == 'style':
+                size = len(value.encode('utf-8'))
+                self.inline_css_bytes += size
+                if size > MAX_INLINE_STYLE_BYTES:
+                    self.error(f'inline style is {size} bytes (limit {MAX_INLINE_STYLE_BYTES})')
+                if IMPORTANT_PATTERN.search(value):
+                    self.error('!important is not allowed in inline styles')
+            elif name == 'href' and value.strip().lower().startswith('javascript:'):
+                self.error('javascript: URLs are not allowed')
+
+    def check_script(self, attributes):
+        src = attributes.get('src')
+        if src == RUNTIME_URL:
+            self.found.add('runtime')
+            if 'async' not in attributes:
+                self.error('the AMP runtime script must be async')
+        elif 'custom-element' in attributes or 'custom-template' in attributes:
+            name = attributes.get('custom-element') or attributes.get('custom-template')
+            self.extensions.add(name)
+            if not (src or '').startswith('https://cdn.ampproject.org/'):
+                self.error(f'extension script for {name} must load from cdn.ampproject.org')
+        elif attributes.get('type', '').lower() not in DATA_SCRIPT_TYPES:
+            self.error(f"custom JavaScript is not allowed ({src or 'inline script'})")
+
+    def check_style(self, attributes):
+        if 'amp-boilerplate' in attributes:
+            self.style = 'amp-boilerplate'
+            self.found.add('boilerplate-noscript' if self.in_noscript else 'boilerplate')
+        elif 'amp-custom' in attributes:
+            self.style = 'amp-custom'
+            if 'amp-custom' in self.found:
+                self.error('only one <style amp-custom> is allowed')
+            self.found.add('amp-custom')
+        else:
+            self.style = 'other'
+            self.error('<style> must be amp-boilerplate or amp-custom')
+        if not self.in_head:
+            self.error('<style> must be in <head>')
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+        elif tag == 'noscript':
+            self.in_noscript = False
+        elif tag == 'style' and self.style:
+            if self.style == 'amp-custom':
+                css = ''.join(self.style_text)
+                self.custom_css_bytes = len(css.encode('utf-8'))
+                if IMPORTANT_PATTERN.search(css):
+                    self.error('!important is not allowed in <style amp-custom>')
+            self.style = None
+            self.style_text = []
+
+    def handle_data(self, data):
+        if self.style:
+            self.style_text.append(data)
+
+    def finish(self):
+        """Check the page-wide rules once the whole page has been seen"""
+        if not self.doctype:
+            self.errors.append([1, 'missing <!doctype html>'])
+        if not self.amp_html:
+            self.errors.append([1, 'missing ⚡ or amp attribute on <html>'])
+        required = {
+            'charset': 'missing <meta charset="utf-8">',
+            'viewport': 'missing <meta name="viewport">',
+            'runtime': f'missing AMP runtime script {RUNTIME_URL}',
+            'boilerplate': 'missing <style amp-boilerplate>',
+            'boilerplate-noscript': 'missing <noscript><style amp-boilerplate>',
+        }
+        for key, message in required.items():
+            if key not in self.found:
+                self.errors.append([1, message])
+        if self.canonical is None:
+            self.errors.append([1, 'missing <link rel="canonical">'])
+        total = self.custom_css_bytes + self.inline_css_bytes
+        if total > MAX_CUSTOM_CSS_BYTES:
+            self.errors.append([1, f'custom CSS is {total} bytes (limit {MAX_CUSTOM_CSS_BYTES})'])
+        for component, line in sorted(self.components.items()):
+            if component not in self.extensions:
+                self.errors.append([line, f'<{component}> is used without its extension script'])
+        for extension in sorted(self.extensions - set(self.components)):
+            self.warnings.append([1, f'extension script for {extension} is loaded but not used'])
+
+
+def check_page(args):
+    """Check one page; runs in a worker process"""
+    root, path = args
+    with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    parser = AmpRulesParser()
+    try:
+        parser.feed(content)
+        parser.close()
+    except Exception as e:
+        parser.errors.append([parser.getpos()[0], f'could not parse page: {e}'])
+    parser.finish()
+    return path, {
+        'errors': parser.errors,
+        'warnings': parser.warnings,
+        'css_bytes': parser.custom_css_bytes + parser.inline_css_bytes,
+        'canonical': parser.canonical,
+    }
+
+
+def discover_amp_pages(root='.'):
+    """Return the site-relative paths of every AMP page"""
+    pages = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+        for filename in filenames:
+            if filename.endswith(AMP_SUFFIX) and not filename.startswith('.'):
+                pages.append(os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, '/'))
+    return sorted(pages)
+
+
+def canonical_path(amp_path):
+    return amp_path[:-len(AMP_SUFFIX)] + '.html'
+
+
+def amp_path_for(path):
+    return path[:-len('.html')] + AMP_SUFFIX
+
+
+class AmpValidator:
+    """Checks AMP pages (cached by content hash) and their links to canonical pages"""
+
+    def __init__(self, root='.', workers=None):
+        self.root = root
+        self.workers = workers
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if cache.get('version') != CACHE_VERSION:
+            return {}
+        return cache.get('pages', {})
+
+    def save_cache(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'pages': self.cache}, f)
+
+    def check_pages(self, pages):
+        """Return {path: result}, checking only pages whose content changed"""
+        hashes, stale = {}, []
+        for path in pages:
+            with open(os.path.join(self.root, path), 'rb') as f:
+                hashes[path] = hashlib.sha256(f.read()).hexdigest()
+            cached = self.cache.get(path)
+            if cached is None or cached['hash'] != hashes[path]:
+                stale.append(path)
+
+        if len(stale) >= PARALLEL_THRESHOLD and self.workers != 0:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(check_page, [(self.root, path) for path in stale], chunksize=4))
+        else:
+            results = [check_page((self.root, path)) for path in stale]
+        for path, result in results:
+            self.cache[path] = {'hash': hashes[path], **result}
+
+        for path in list(self.cache):
+            if path not in hashes:
+                del self.cache[path]
+        return {path: self.cache[path] for path in pages}, len(stale)
+
+    def sitemap_urls(self):
+        try:
+            with open(os.path.join(self.root, SITEMAP_FILE), 'r', encoding='utf-8') as f:
+                return set(re.findall(r'<loc>([^<]+)</loc>', f.read()))
+        except FileNotFoundError:
+            return None
+
+    def validate(self):
+        """Check every AMP page and return the report as a dict"""
+        pages = discover_amp_pages(self.root)
+        checked, rechecked = self.check_pages(pages)
+        sitemap = self.sitemap_urls()
+
+        results = {}
+        for path in pages:
+            result = checked[path]
+            warnings = list(result['warnings'])
+            canonical = canonical_path(path)
+            canonical_file = os.path.join(self.root, canonical)
+            if not os.path.exists(canonical_file):
+                warnings.append([1, f'canonical page {canonical} does not exist'])
+            else:
+                with open(canonical_file, 'r', encoding='utf-8', errors='replace') as f:
+                    links = AMPHTML_LINK_PATTERN.findall(f.read())
+                if not any(page_url(path) in link or posixpath.basename(path) in link for link in links):
+                    warnings.append([1, f'{canonical} has no rel="amphtml" link to this page'])
+            if result['canonical'] is not None and result['canonical'] != page_url(canonical):
+                warnings.append([1, f"canonical link {result['canonical']} is not {page_url(canonical)}"])
+            if sitemap is not None and page_url(path) not in sitemap:
+                warnings.append([1, f'not listed in {SITEMAP_FILE}'])
+            results[path] = {**result, 'warnings': warnings}
+
+        # AMP URLs the sitemap advertises but the tree no longer has
+        missing = sorted(
+            url for url in (sitemap or ()) if url.endswith(AMP_SUFFIX) and url not in {page_url(path) for path in pages}
+        )
+        self.save_cache()
+        return {
+            'generated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'summary': {
+                'pages': len(pages),
+                'rechecked': rechecked,
+                'valid': sum(1 for result in results.values() if not result['errors']),
+                'errors': sum(len(result['errors']) for result in results.values()),
+                'warnings': sum(len(result['warnings']) for result in results.values()),
+            },
+            'pages': results,
+            'missing_from_tree': missing,
+        }
+
+
+def validate_amp(root='.', workers=None):
+    """Run one validation; see AmpValidator.validate for the report format"""
+    return AmpValidator(root, workers).validate()
+
+
+def image_size(file_path):
+    """Return (width, height) read from a PNG, GIF, WebP, JPEG or SVG header, or None"""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read(65536)
+    except OSError:
+        return None
+    if data.startswith(b'\x89PNG\r\n\x1a\n') and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b'VP8X':
+            return 1 + int.from_bytes(data[24:27], 'little'), 1 + int.from_bytes(data[27:30], 'little')
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        return None
+    if data.startswith(b'\xff\xd8'):
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+        return None
+    match = SVG_TAG_PATTERN.search(data)
+    if match:
+        attributes = {name.decode().lower(): value.decode() for name, value in SVG_ATTRIBUTE_PATTERN.findall(match.group(0))}
+        width = NUMBER_PATTERN.match(attributes.get('width', ''))
+        height = NUMBER_PATTERN.match(attributes.get('height', ''))
+        if width and height:
+            return round(float(width.group(1))), round(float(height.group(1)))
+        box = attributes.get('viewbox', '').replace(',', ' ').split()
+        if len(box) == 4:
+            try:
+                return round(float(box[2])), round(float(box[3]))
+            except ValueError:
+                return None
+    return None
+
+
+def local_file(root, page, url):
+    """Resolve a URL referenced from page to a file under root, or None if external"""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+    path = unquote(parts.path)
+    if path.startswith('/'):
+        return Path(root) / path.lstrip('/')
+    return Path(root) / posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+
+
+def dimension(value):
+    match = NUMBER_PATTERN.match(value or '')
+    return round(float(match.group(1))) if match else None
+
+
+def render_attributes(attributes):
+    parts = []
+    for name, value in attributes:
+        parts.append(name if value is None else f'{name}="{escape(value, quote=True)}"')
+    return ''.join(' ' + part for part in parts)
+
+
+class AmpConverter(HTMLParser):
+    """Rewrites a canonical page into head metadata, AMP-safe body markup and its CSS"""
+
+    def __init__(self, root, page):
+        super().__init__(convert_charrefs=False)
+        self.root = root
+        self.page = page
+        self.lang = 'en'
+        self.title = []
+        self.head = []
+        self.body = []
+        self.body_attributes = []
+        self.stylesheets = []
+        self.styles = []
+        self.inline_styles = {}
+        self.classes = set()
+        self.ids = set()
+        self.extensions = set()
+        self.warnings = []
+        self.in_head = False
+        self.in_title = False
+        self.capture = None
+        self.captured = []
+        self.skipping = None
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.start(tag, attrs, closed=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self.start(tag, attrs, closed=True)
+
+    def start(self, tag, attrs, closed):
+        if self.skipping:
+            if tag == self.skipping and not closed:
+                self.skip_depth += 1
+            return
+        attributes = dict(attrs)
+        if tag == 'html':
+            self.lang = attributes.get('lang') or self.lang
+            return
+        if tag == 'head':
+            self.in_head = True
+            return
+        if tag == 'body':
+            self.body_attributes = self.clean_attributes(attrs)
+            return
+        if tag == 'title':
+            self.in_title = True
+            return
+        if tag == 'style':
+            self.capture = 'style'
+            return
+        if tag == 'script' and (attributes.get('type') or '').lower() in DATA_SCRIPT_TYPES:
+            self.capture = 'data'
+            self.captured = [f'<script{render_attributes(attrs)}>']
+            return
+        if tag == 'link':
+            self.keep_link(attributes, attrs)
+            return
+        if self.in_head:
+            if tag == 'meta':
+                name = (attributes.get('name') or attributes.get('property') or '').lower()
+                if name in KEPT_META_NAMES or name.startswith(KEPT_META_PREFIXES):
+                    self.head.append(f'<meta{render_attributes(attrs)}>')
+            elif tag in DROPPED_TAGS and not closed:
+                self.skip(tag)
+            return
+        if tag in DROPPED_TAGS or tag in DISALLOWED_TAGS:
+            if not closed:
+                self.skip(tag)
+            return
+        if tag == 'img':
+            self.body.append(self.render_image(attrs))
+            return
+        if tag == 'iframe':
+            self.body.append(self.render_iframe(attrs))
+            if not closed:
+                self.skip(tag)
+            return
+        if tag in REPLACED_TAGS:
+            component = REPLACED_TAGS[tag]
+            self.extensions.add(component)
+            tag = component
+            attrs = [(name, value) for name, value in attrs if name not in ('width', 'height', 'layout')]
+            attrs += [('width', str(dimension(attributes.get('width')) or DEFAULT_IFRAME_SIZE[0])),
+                      ('height', str(dimension(attributes.get('height')) or DEFAULT_IFRAME_SIZE[1])),
+                      ('layout', 'responsive')]
+        self.body.append(f'<{tag}{render_attributes(self.clean_attributes(attrs))}{" /" if closed else ""}>')
+
+    def skip(self, tag):
+        self.skipping = tag
+        self.skip_depth = 1
+
+    def keep_link(self, attributes, attrs):
+        rel = (attributes.get('rel') or '').lower()
+        href = attributes.get('href') or ''
+        if rel == 'stylesheet':
+            if urlsplit(href).netloc in FONT_HOSTS:
+                self.head.append(f'<link{render_attributes(attrs)}>')
+            else:
+                target = local_file(self.root, self.page, href)
+                if target is not None:
+                    self.stylesheets.append(target)
+        elif self.in_head and rel in KEPT_LINK_RELS:
+            self.head.append(f'<link{render_attributes(attrs)}>')
+
+    def clean_attributes(self, attrs):
+        """Drop event handlers and javascript: URLs; turn inline styles into classes"""
+        cleaned, style = [], None
+        for name, value in attrs:
+            if name.startswith('on') and name != 'on':
+                continue
+            if name == 'style':
+                style = (value or '').strip().rstrip(';')
+                continue
+            if name == 'href' and (value or '').strip().lower().startswith('javascript:'):
+                value = '#'
+            if name == 'class':
+                self.classes.update((value or '').split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+            cleaned.append((name, value))
+        if style:
+            class_name = self.inline_styles.setdefault(style, f'amp-inline-{len(self.inline_styles) + 1}')
+            self.classes.add(class_name)
+            for index, (name, value) in enumerate(cleaned):
+                if name == 'class':
+                    cleaned[index] = (name, f'{value} {class_name}'.strip())
+                    break
+            else:
+                cleaned.append(('class', class_name))
+        return cleaned
+
+    def render_image(self, attrs):
+        attributes = dict(attrs)
+        width, height = dimension(attributes.get('width')), dimension(attributes.get('height'))
+        layout = 'intrinsic'
+        if not (width and height):
+            target = local_file(self.root, self.page, attributes.get('src') or '')
+            size = image_size(target) if target is not None else None
+            if size and all(size):
+                width, height = size
+            else:
+                width, height = DEFAULT_IMAGE_SIZE
+                layout = 'responsive'
+                self.warnings.append(f"no dimensions for {attributes.get('src')}; using a {width}:{height} box")
+        kept = [(name, value) for name, value in attrs if name not in ('width', 'height', 'loading', 'decoding')]
+        kept += [('width', str(width)), ('height', str(height)), ('layout', layout)]
+        return f'<amp-img{render_attributes(self.clean_attributes(kept))}></amp-img>'
+
+    def render_iframe(self, attrs):
+        attributes = dict(attrs)
+        if not (attributes.get('src') or '').startswith('https://'):
+            self.warnings.append(f"dropped iframe {attributes.get('src')}: amp-iframe needs an https URL")
+            return ''
+        self.extensions.add('amp-iframe')
+        width = dimension(attributes.get('width')) or DEFAULT_IFRAME_SIZE[0]
+        height = dimension(attributes.get('height')) or DEFAULT_IFRAME_SIZE[1]
+        kept = [
+            (name, value) for name, value in attrs
+            if name in ('src', 'title', 'class', 'id', 'allow', 'allowfullscreen', 'frameborder', 'style')
+        ]
+        kept += [
+            ('width', str(width)), ('height', str(height)), ('layout', 'responsive'),
+            ('sandbox', 'allow-scripts allow-same-origin allow-popups allow-presentation'),
+        ]
+        return f'<amp-iframe{render_attributes(self.clean_attributes(kept))}></amp-iframe>'
+
+    def handle_endtag(self, tag):
+        if self.skipping:
+            if tag == self.skipping:
+                self.skip_depth -= 1
+                if self.skip_depth == 0:
+                    self.skipping = None
+            return
+        if tag in ('html', 'body', 'title', 'link', 'meta', 'img') or (tag == 'head' and self.in_head):
+            if tag == 'head':
+                self.in_head = False
+            if tag == 'title':
+                self.in_title = False
+            return
+        if tag in ('style', 'script') and self.capture:
+            if self.capture == 'style':
+                self.styles.append(''.join(self.captured))
+            else:
+                self.head.append(''.join(self.captured) + '</script>')
+            self.capture = None
+            self.captured = []
+            return
+        if self.in_head or tag in DROPPED_TAGS or tag in DISALLOWED_TAGS:
+            return
+        self.body.append(f'</{REPLACED_TAGS.get(tag, tag)}>')
+
+    def handle_data(self, data):
+        if self.skipping:
+            return
+        if self.capture:
+            self.captured.append(data)
+        elif self.in_title:
+            self.title.append(data)
+        elif not self.in_head:
+            self.body.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+
+    def css(self):
+        """Every stylesheet the page uses, plus classes for its inline styles"""
+        sources = [Path(self.root) / STYLESHEET] + self.stylesheets
+        seen, parts = set(), []
+        for path in sources:
+            key = path.resolve()
+            if key in seen or not path.is_file():
+                continue
+            seen.add(key)
+            parts.append(path.read_text(encoding='utf-8'))
+        parts.extend(self.styles)
+        parts.extend(f'.{name}{{{style}}}' for style, name in self.inline_styles.items())
+        return '\n'.join(parts)
+
+
+def split_rules(css):
+    """Split a stylesheet into top-level (prelude, body) pairs"""
+    rules, depth, start, prelude = [], 0, 0, None
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:index]))
+                start = index + 1
+    return rules
+
+
+def selector_used(selector, classes, ids):
+    wanted_classes = {name.replace('\\', '') for name in CLASS_SELECTOR_PATTERN.findall(selector)}
+    wanted_ids = {name.replace('\\', '') for name in ID_SELECTOR_PATTERN.findall(selector)}
+    return wanted_classes <= classes and wanted_ids <= ids
+
+
+def prune_css(css, classes, ids):
+    """Drop rules whose selectors match no class or id on the page; return the kept rules"""
+    kept = []
+    for prelude, body in split_rules(css):
+        if prelude.lower().startswith(('@media', '@supports')):
+            inner = prune_css(body, classes, ids)
+            if inner:
+                kept.append(f'{prelude}{{{"".join(inner)}}}')
+        elif prelude.startswith('@'):
+            kept.append(f'{prelude}{{{body}}}')
+        else:
+            selectors = [s.strip() for s in prelude.split(',') if selector_used(s, classes, ids)]
+            if selectors:
+                kept.append(f'{",".join(selectors)}{{{body}}}')
+    return kept
+
+
+def amp_css(converter):
+    """Build the page's <style amp-custom> content within the size limit; return (css, warnings)"""
+    css = AT_STATEMENT_PATTERN.sub('', IMPORTANT_PATTERN.sub('', converter.css()))
+    css = build_assets.minify_css(css)
+    rules = prune_css(css, converter.classes | {'amp-custom'}, converter.ids)
+    warnings = []
+    while rules and len(''.join(rules).encode('utf-8')) > MAX_CUSTOM_CSS_BYTES:
+        rules.pop()
+        if not warnings:
+            warnings.append(f'CSS trimmed to fit the {MAX_CUSTOM_CSS_BYTES}-byte amp-custom limit')
+    return ''.join(rules), warnings
+
+
+def render_amp_page(root, page):
+    """Return (html, warnings) for the AMP variant of a canonical page"""
+    with open(os.path.join(root, page), 'r', encoding='utf-8') as f:
+        content = f.read()
+    converter = AmpConverter(root, page)
+    converter.feed(content)
+    converter.close()
+    css, css_warnings = amp_css(converter)
+
+    head = [
+        '<meta charset="utf-8">',
+        f'<script async src="{RUNTIME_URL}"></script>',
+    ]
+    head += [
+        f'<script async custom-element="{name}" src="{EXTENSION_URL.format(name=name)}"></script>'
+        for name in sorted(converter.extensions)
+    ]
+    head += [
+        f"<title>{''.join(converter.title).strip()}</title>",
+        f'<link rel="canonical" href="{page_url(page)}">',
+        '<meta name="viewport" content="width=device-width,minimum-scale=1,initial-scale=1">',
+    ]
+    head += converter.head
+    head += [
+        f'<style amp-boilerplate>{BOILERPLATE_CSS}</style>'
+        f'<noscript><style amp-boilerplate>{BOILERPLATE_NOSCRIPT_CSS}</style></noscript>',
+        f'<style amp-custom>{css}</style>',
+    ]
+    body = ''.join(converter.body).strip()
+    html = (
+        '<!doctype html>\n'
+        f'<html ⚡ lang="{escape(converter.lang, quote=True)}">\n'
+        '<head>\n' + ''.join(f'    {line}\n' for line in head) + '</head>\n'
+        f'<body{render_attributes(converter.body_attributes)}>\n{body}\n</body>\n'
+        '</html>\n'
+    )
+    return html, converter.warnings + css_warnings
+
+
+def link_canonical_page(root, page):
+    """Add a rel="amphtml" link to the canonical page's <head>; return True if it changed"""
+    file_path = os.path.join(root, page)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if AMPHTML_LINK_PATTERN.search(content):
+        return False
+    position = content.find('</head>')
+    if position == -1:
+        return False
+    link = f'    <link rel="amphtml" href="{page_url(amp_path_for(page))}">\n'
+    line_start = content.rfind('\n', 0, position) + 1
+    updated = content[:line_start] + link + content[line_start:]
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return True
+
+
+def generate_amp_page(root, page, link=False):
+    """Write the AMP variant of page; return {'path', 'written', 'linked', 'warnings'}"""
+    html, warnings = render_amp_page(root, page)
+    path = amp_path_for(page)
+    written = build_assets.write_if_changed(Path(root) / path, html.encode('utf-8'))
+    linked = link_canonical_page(root, page) if link else False
+    return {'path': path, 'written': written, 'linked': linked, 'warnings': warnings}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Validate AMP pages, or generate them from canonical pages')
+    parser.add_argument('--root', default='.', help='Website root directory')
+    parser.add_argument('--generate', nargs='+', metavar='PAGE', help='Write the AMP variant of these pages first')
+    parser.add_argument('--link', action='store_true', help='Also add rel="amphtml" to each generated page\'s canonical page')
+    parser.add_argument('--output', default=None, help='Write the JSON report here; "-" for stdout')
+    parser.add_argument('--workers', type=int, default=None, help='Checker processes (0 checks in-process)')
+    args = parser.parse_args()
+
+    for page in args.generate or []:
+        page = page.replace(os.sep, '/')
+        if page.endswith(AMP_SUFFIX) or not page.endswith('.html'):
+            parser.error(f'{page} is not a canonical .html page')
+        result = generate_amp_page(args.root, page, link=args.link)
+        status = 'written' if result['written'] else 'unchanged'
+        print(f"⚡ {result['path']} {status}{', linked from ' + page if result['linked'] else ''}")
+        for warning in result['warnings']:
+            print(f'   ⚠️  {warning}')
+
+    report = validate_amp(args.root, args.workers)
+    failed = report['summary']['errors'] > 0
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        sys.exit(1 if failed else 0)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    for path, result in report['pages'].items():
+        print(f"{'❌' if result['errors'] else '✅'} {path} ({result['css_bytes']} bytes of CSS)")
+        for line, message in result['errors']:
+            print(f'   ❌ line {line}: {message}')
+        for line, message in result['warnings']:
+            print(f'   ⚠️  {message}')
+    for url in report['missing_from_tree']:
+        print(f'⚠️  {SITEMAP_FILE} lists {url}, which does not exist')
+    summary = report['summary']
+    print(
+        f"⚡ Checked {summary['pages']} AMP pages ({summary['rechecked']} re-checked): "
+        f"{summary['valid']} valid, {summary['errors']} errors, {summary['warnings']} warnings"
+    )
+    sys.exit(1 if failed else 0)